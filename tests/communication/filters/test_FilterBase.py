@@ -36,3 +36,14 @@ class TestFilterBase(base_class):
             for msg, err in x.get('error', []):
                 with pytest.raises(err):
                     inst(msg)
+
+    def test_filter_rows(self, python_class, testing_options, nested_approx):
+        r"""Test row-wise filter."""
+        for x in testing_options:
+            inst = python_class(**x.get('kwargs', {}))
+            for msg_in, msg_exp in x.get('rows', []):
+                msg_out = inst.filter_rows(msg_in)
+                if msg_exp is None:
+                    assert msg_out is None
+                else:
+                    assert nested_approx(msg_exp) == msg_out
@@ -14,3 +14,22 @@ def test_LockedBuffer_pop():
     r"""Test the pop method of the LockedBuffer class."""
     x = BufferComm.LockedBuffer()
     assert(x.pop(default='hello') == 'hello')
+
+
+def test_LockedBuffer_in_process(wait_on_function):
+    r"""Test passing messages by reference until the buffer is shared."""
+    x = BufferComm.LockedBuffer()
+    assert x.in_process
+    msg = ['test']
+    x.append(msg)
+    assert len(x) == 1
+    assert x.pop() is msg
+    x.append(msg)
+    x.share()
+    assert not x.in_process
+    wait_on_function(lambda: not x.empty())
+    out = x.pop()
+    assert out == msg
+    assert out is not msg
+    x.close()
+    assert not x.in_process
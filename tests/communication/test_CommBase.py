@@ -507,6 +507,30 @@ class TestComm(BaseComm):
         if send_comm is not None:
             send_comm.linger()
 
+    def test_send_recv_nolimit_pool(self, msg_long, send_comm, recv_comm,
+                                    do_send_recv, timeout):
+        r"""Test that work comms are reused for multiple large messages."""
+        nmsg = 3
+        for _ in range(nmsg):
+            do_send_recv(send_comm, recv_comm, msg_long,
+                         send_params={'method': 'send_nolimit'},
+                         recv_params={'method': 'recv_nolimit',
+                                      'wait_timeout': timeout})
+        for x in [send_comm, recv_comm]:
+            if (x is None) or (x.work_comm_pool_size == 0):
+                continue
+            stats = x.work_comm_pool_stats
+            if (stats['hits'] + stats['misses']) == 0:
+                continue  # Message did not exceed maxMsgSize
+            assert (stats['hits'] + stats['misses']) == nmsg
+            assert stats['size'] <= x.work_comm_pool_size
+            assert stats['misses'] <= x.work_comm_pool_size
+            assert 'Work comm pool' in x.printStatus(return_str=True)
+        if (send_comm is not None) and send_comm._work_comm_pool:
+            for x in send_comm._work_comm_pool:
+                assert x.work_comm_reuse and not x.single_use
+                assert not x.allow_multiple_comms
+
     def test_send_recv_filter_eof(self, run_once, filtered_comms, send_comm,
                                   recv_comm, do_send_recv):
         r"""Test send/recv of EOF with filter."""
@@ -27,7 +27,8 @@ class TestForkComm(base_class):
         return 2
 
     @pytest.fixture(scope="class", autouse=True,
-                    params=['broadcast', 'cycle', 'scatter'])
+                    params=['broadcast', 'cycle', 'scatter',
+                            'least_loaded', 'work_stealing'])
     def send_pattern(self, request):
         r"""Pattern in which to send messages to fork communicators."""
         return request.param
@@ -37,7 +38,9 @@ class TestForkComm(base_class):
         r"""Pattern in which to recv messages to fork communicators."""
         pattern_map = {'broadcast': 'cycle',
                        'cycle': 'cycle',
-                       'scatter': 'gather'}
+                       'scatter': 'gather',
+                       'least_loaded': 'cycle',
+                       'work_stealing': 'cycle'}
         return pattern_map[send_pattern]
 
     @pytest.fixture(scope="class", autouse=True)
@@ -57,6 +60,8 @@ class TestForkComm(base_class):
         out = python_class.get_testing_options(**options)
         out['kwargs'].update(ncomm=ncomm, pattern=send_pattern,
                              commtype='ForkComm')
+        if send_pattern == 'work_stealing':
+            out['kwargs']['steal_timeout'] = 0.1
         out.setdefault('recv_kwargs', {})
         out['recv_kwargs'].update(pattern=recv_pattern,
                                   commtype='ForkComm')
@@ -166,6 +171,110 @@ class TestForkComm(base_class):
         assert flag
         assert msg_recv == map_sent2recv(test_msg)
 
+    def test_load_balance(self, send_pattern, send_comm, recv_comm,
+                          testing_options, timeout):
+        r"""Test that load aware patterns send to the least loaded comm."""
+        if send_pattern not in ['least_loaded', 'work_stealing']:
+            pytest.skip("Only valid for load aware patterns")
+        send_comm.track_completion = True
+        test_msg = testing_options['msg']
+        for _ in range(len(send_comm)):
+            assert send_comm.send(test_msg)
+        assert send_comm.comm_nsent == [1 for _ in range(len(send_comm))]
+        for _ in range(len(send_comm)):
+            flag, msg_recv = recv_comm.recv(timeout=timeout)
+            assert flag
+        T = send_comm.start_timeout(timeout)
+        while ((not T.is_out)
+               and any(x.n_msg_outstanding for x in send_comm.comm_list)):
+            send_comm.sleep()
+        send_comm.stop_timeout()
+        send_comm.complete_message(1)
+        assert send_comm.select_comm_index() == 1
+        assert send_comm.send(test_msg)
+        assert send_comm.comm_nsent[1] == 2
+        assert 'outstanding' in send_comm.printStatus(return_str=True)
+        flag, msg_recv = recv_comm.recv(timeout=timeout)
+        assert flag
+
+    def test_broadcast_shared(self, send_pattern, send_comm, recv_comm,
+                              testing_options, map_sent2recv, timeout):
+        r"""Test that broadcast messages are serialized once and shared."""
+        if send_pattern != 'broadcast':
+            pytest.skip("Only valid for broadcast pattern")
+        test_msg = testing_options['msg']
+        for _ in range(2):
+            msg = send_comm.prepare_message(test_msg)
+            if msg.args[0].msg is msg.args[1].msg:
+                break
+            assert send_comm.send_message(msg)
+            for _ in range(len(send_comm)):
+                flag, msg_recv = recv_comm.recv(timeout=timeout)
+                assert flag
+        assert msg.args[0].msg is msg.args[1].msg
+        assert msg.args[0] is not msg.args[1]
+        assert send_comm.send_message(msg)
+        for _ in range(len(send_comm)):
+            flag, msg_recv = recv_comm.recv(timeout=timeout)
+            assert flag
+            assert msg_recv == map_sent2recv(test_msg)
+
+    def test_broadcast_shared_async(self, send_pattern, use_async, name,
+                                    commtype, testing_options,
+                                    map_sent2recv, timeout, close_comm):
+        r"""Test that broadcast messages are shared between asynchronous
+        comms."""
+        if (send_pattern != 'broadcast') or use_async:
+            pytest.skip("Only valid for synchronous broadcast pattern "
+                        "(asynchronous covered by test_broadcast_shared)")
+        send_comm = self.create_send_comm(name, commtype, True,
+                                          testing_options)
+        recv_comm = self.create_recv_comm(name, commtype, send_comm,
+                                          testing_options)
+        try:
+            assert all(x.is_async for x in send_comm.comm_list)
+            self.test_broadcast_shared(send_pattern, send_comm, recv_comm,
+                                       testing_options, map_sent2recv,
+                                       timeout)
+        finally:
+            close_comm(send_comm)
+            close_comm(recv_comm)
+
+    def test_broadcast_key_header(self, send_pattern, send_comm):
+        r"""Test that comms adding different header information are not
+        grouped for a broadcast."""
+        from yggdrasil.communication.ForkComm import get_broadcast_key
+        from yggdrasil.communication.ZMQComm import ZMQComm
+        if send_pattern != 'broadcast':
+            pytest.skip("Only valid for broadcast pattern")
+        comms = [getattr(x, '_wrapped', x) for x in send_comm.comm_list]
+        if not all(isinstance(x, ZMQComm) for x in comms):
+            pytest.skip("Only valid for ZMQ comms")
+        for x in comms:
+            x.serializer._initialized = True
+        assert get_broadcast_key(send_comm.comm_list[0]) is not None
+        assert (get_broadcast_key(send_comm.comm_list[0])
+                == get_broadcast_key(send_comm.comm_list[1]))
+        for x in comms:
+            x.reply_frame = False
+        assert (get_broadcast_key(send_comm.comm_list[0])
+                != get_broadcast_key(send_comm.comm_list[1]))
+
+    @pytest.mark.parametrize('recv_fairness', ['round_robin', 'first_ready'])
+    def test_recv_ready(self, recv_pattern, send_comm, recv_comm,
+                        testing_options, map_sent2recv, recv_fairness,
+                        timeout):
+        r"""Test receipt from the only comm with a message waiting."""
+        if recv_pattern != 'cycle':
+            pytest.skip("Only valid for cycle pattern")
+        recv_comm.recv_fairness = recv_fairness
+        test_msg = testing_options['msg']
+        assert send_comm.comm_list[-1].send(test_msg)
+        flag, msg_recv = recv_comm.recv(timeout=timeout)
+        assert flag
+        assert msg_recv == map_sent2recv(test_msg)
+        assert recv_comm.last_comm is recv_comm.comm_list[-1]
+
 
 class TestForkCommList(TestForkComm):
     r"""Tests for ForkComm communication class with construction from address."""
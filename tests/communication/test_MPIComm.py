@@ -1,5 +1,7 @@
 import copy
+import time
 import pytest
+import numpy as np
 from yggdrasil.communication import CommBase, new_comm, get_comm
 from tests.communication.test_CommBase import TestComm as base_class
 
@@ -395,6 +397,20 @@ class TestMPIComm(base_class):
                 msg = local_comm.finalize_message(msg)
                 assert(msg.flag == CommBase.FLAG_EMPTY)
 
+    def test_send_recv_array(self, use_async, local_comm):
+        r"""Test send/recv of arrays as typed MPI buffers."""
+        if use_async:
+            pytest.skip("skip for async")
+        arr = np.arange(10, dtype='float64')
+        if local_comm.direction == 'send':
+            for _ in range(len(local_comm.ranks)):
+                assert local_comm.send_array(arr[::2])
+        else:
+            for _ in range(len(local_comm.ranks)):
+                flag, msg = local_comm.recv_array(arr.dtype, timeout=60.0)
+                assert flag
+                np.testing.assert_array_equal(msg, arr[::2])
+
     def test_purge(self, use_async, local_comm, testing_options,
                    wait_on_function, n_msg_expected, sync):
         r"""Test purging messages from the comm."""
@@ -434,3 +450,55 @@ class TestMPICommMultipleRecv(TestMPIComm):
     def root_direction(self):
         r"""str: Direction of communicator on the root process."""
         return 'recv'
+
+
+def test_MPIRequest_self():
+    r"""Test a single message round trip through MPI requests addressed
+    to the current process."""
+    MPI = pytest.importorskip('mpi4py.MPI')
+    from yggdrasil.communication.MPIComm import MPIComm, MPIRequest
+    mpi_comm = MPI.COMM_WORLD
+    rank = mpi_comm.Get_rank()
+    tag = 30000
+    msg = b'0' * (2 * MPIComm._maxMsgSize)
+    recv_req = MPIRequest(mpi_comm, 'recv', rank, tag)
+    assert not recv_req.complete
+    send_req = MPIRequest(mpi_comm, 'send', rank, tag, payload=msg)
+    tstop = time.perf_counter() + 10.0
+    while not recv_req.complete:
+        assert time.perf_counter() < tstop
+    assert recv_req.data == msg
+    assert isinstance(recv_req.data, bytearray)
+    send_req.req.wait(timeout=10.0)
+    assert send_req.complete
+    # Arrays are sent & received as typed buffers
+    arr = np.arange(10, dtype='int32')
+    recv_req = MPIRequest(mpi_comm, 'recv', rank, tag, dtype=arr.dtype)
+    send_req = MPIRequest(mpi_comm, 'send', rank, tag, payload=arr[::2])
+    tstop = time.perf_counter() + 10.0
+    while not recv_req.complete:
+        assert time.perf_counter() < tstop
+    assert recv_req.data.dtype == arr.dtype
+    np.testing.assert_array_equal(recv_req.data, arr[::2])
+    send_req.req.wait(timeout=10.0)
+    # Cancelled receives are never completed
+    recv_req = MPIRequest(mpi_comm, 'recv', rank, tag)
+    recv_req.cancel()
+    assert not recv_req.complete
+
+
+@pytest.mark.suite('mpi')
+@pytest.mark.mpi(min_size=2)
+@pytest.mark.parametrize('typed', [False, True])
+def test_time_mpi_bandwidth(mpi_rank, adv_global_mpi_tag, typed):
+    r"""Test timing the bandwidth of an MPIComm connection."""
+    from yggdrasil import timing
+    msg_sizes = [2**10, 2**21]
+    out = timing.time_mpi_bandwidth(msg_sizes=msg_sizes, nmsg=2,
+                                    tag_start=adv_global_mpi_tag(10),
+                                    typed=typed)
+    if mpi_rank == 1:
+        assert sorted(out.keys()) == msg_sizes
+        assert all(v > 0 for v in out.values())
+    else:
+        assert out == {}
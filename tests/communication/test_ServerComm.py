@@ -103,6 +103,43 @@ class TestServerComm(base_class):
         assert(flag)
         assert(msg_recv == msg_long)
 
+    def test_call_async(self, send_comm, recv_comm, testing_options,
+                        timeout):
+        r"""Test pipelined RPC calls with responses retrieved out of
+        order."""
+        nmsg = 3
+        futures = [send_comm.call_async(testing_options['msg'])
+                   for _ in range(nmsg)]
+        assert send_comm.n_outstanding == nmsg
+        for _ in range(nmsg):
+            flag, msg_recv = recv_comm.recv(timeout=timeout)
+            assert(flag)
+            assert(msg_recv == testing_options['msg'])
+            assert(recv_comm.send(msg_recv))
+        for x in futures[::-1]:
+            flag, msg_recv = x.result(timeout=timeout)
+            assert(flag)
+            assert(msg_recv == testing_options['msg'])
+            assert(x.done())
+            assert(x.result() == (flag, msg_recv))
+        assert send_comm.n_outstanding == 0
+        assert not send_comm.request_order
+
+    def test_call_many(self, send_comm, recv_comm, testing_options,
+                       timeout, wait_on_function):
+        r"""Test multiple RPC calls with a limit on outstanding requests."""
+        nmsg = 3
+        send_comm.max_outstanding = 2
+        send_comm.sched_task(0.0, send_comm.call_many,
+                             args=[nmsg * [testing_options['msg']]],
+                             store_output=True)
+        for _ in range(nmsg):
+            flag, msg_recv = recv_comm.recv(timeout=timeout)
+            assert(flag)
+            assert(recv_comm.send(msg_recv))
+        wait_on_function(lambda: (send_comm.sched_out is not None))
+        assert send_comm.sched_out == nmsg * [(True, testing_options['msg'])]
+
     def test_close_in_thread(self, send_comm, recv_comm):
         r"""Test close of comm in thread."""
         send_comm.close_in_thread()
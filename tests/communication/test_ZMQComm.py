@@ -107,6 +107,72 @@ class TestZMQComm(base_class):
             new_comm('test_invalid_protocol', commtype=commtype,
                      protocol='invalid')
 
+    def test_uses_python_interface(self, run_once, python_module):
+        r"""Test determination of languages that use the Python interface."""
+        from yggdrasil.components import import_component
+        for lang in ['python', 'matlab']:
+            assert python_module.uses_python_interface(
+                import_component('model', lang))
+        assert not python_module.uses_python_interface(
+            import_component('model', 'c'))
+        assert not python_module.uses_python_interface(None)
+
+    def test_cumulative_ack(self, run_once, python_module, close_comm):
+        r"""Test accounting for cumulative delivery acknowledgements."""
+        from yggdrasil.communication import new_comm
+        comm = new_comm('test_cumulative_ack', commtype='zmq',
+                        dont_open=True, ack_window=4)
+        try:
+            key = 'tcp://localhost:5555'
+            comm._n_zmq_recv[key] = 3
+            comm._n_reply_recv[key] = 0
+            # Senders that don't advertise a window get per-message replies
+            assert comm.ack_message(key) == python_module._reply_msg
+            assert comm.parse_ack_message(python_module._reply_msg) == 1
+            comm._ack_window_recv[key] = 4
+            assert comm.is_ack_due(key)  # Idle, so the partial window is sent
+            msg1 = comm.ack_message(key)
+            assert comm.parse_ack_message(msg1) == 3
+            comm._n_zmq_recv[key] = 7
+            msg2 = comm.ack_message(key)
+            assert comm.parse_ack_message(msg2) == 4
+            assert comm.parse_ack_message(msg2) == 0
+        finally:
+            close_comm(comm)
+
+    def test_send_recv_nolimit_proxy(self, run_once, close_comm, timeout):
+        r"""Test sending large messages to multiple receivers through a
+        proxy, which requires a dedicated work comm for each message."""
+        from yggdrasil.communication import new_comm
+        send_comm = new_comm('test_nolimit_proxy', commtype='zmq',
+                             direction='send', allow_multiple_comms=True)
+        recv_comms = []
+        try:
+            assert send_comm.create_proxy
+            assert send_comm.work_comm_pool_size == 0
+            for i in range(2):
+                recv_comms.append(new_comm(
+                    'test_nolimit_proxy_%d' % i,
+                    **send_comm.opp_comm_kwargs()))
+            msgs = [(b'%d' % i) * (2 * send_comm.maxMsgSize)
+                    for i in range(2)]
+            for x in msgs:
+                assert send_comm.send_nolimit(x)
+            received = []
+            T = send_comm.start_timeout(timeout)
+            while (len(received) < len(msgs)) and (not T.is_out):
+                for x in recv_comms:
+                    if x.n_msg:
+                        flag, msg_recv = x.recv_nolimit(timeout=timeout)
+                        assert flag
+                        received.append(msg_recv)
+                send_comm.sleep()
+            send_comm.stop_timeout()
+            assert sorted(received) == msgs
+        finally:
+            for x in recv_comms + [send_comm]:
+                close_comm(x)
+
     @pytest.mark.skipif(platform._is_mac, reason="Testing on MacOS")
     @pytest.mark.skipif(platform._is_win, reason="Testing on Windows")
     def test_error_on_send_open_twice(self, run_once, python_module,
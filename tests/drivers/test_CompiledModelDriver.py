@@ -87,6 +87,57 @@ def test_locate_library_file():
                 == files['shared'])
 
 
+def test_get_build_cache_dir(monkeypatch, tmpdir):
+    r"""Test get_build_cache_dir."""
+    monkeypatch.delenv('YGG_BUILD_CACHE', raising=False)
+    assert CompiledModelDriver.get_build_cache_dir() is None
+    monkeypatch.setenv('YGG_BUILD_CACHE', '0')
+    assert CompiledModelDriver.get_build_cache_dir() is None
+    monkeypatch.setenv('YGG_BUILD_CACHE', str(tmpdir))
+    assert CompiledModelDriver.get_build_cache_dir() == str(tmpdir)
+
+
+def test_hash_build_inputs(tmpdir):
+    r"""Test that build hashes follow changes to included headers."""
+    src = os.path.join(str(tmpdir), 'src.c')
+    incdir = os.path.join(str(tmpdir), 'include')
+    os.mkdir(incdir)
+    with open(src, 'w') as fd:
+        fd.write('#include "a.h"\n#include <stdio.h>\n')
+    with open(os.path.join(str(tmpdir), 'a.h'), 'w') as fd:
+        fd.write('#include "b.h"\n#include "src.c"\n')
+    with open(os.path.join(incdir, 'b.h'), 'w') as fd:
+        fd.write('int b;\n')
+
+    def get_hash():
+        return CompiledModelDriver.hash_build_inputs(
+            [src], include_dirs=[incdir]).hexdigest()
+
+    key = get_hash()
+    assert get_hash() == key
+    # Identical sources in another location give the same hash
+    other = os.path.join(str(tmpdir), 'other')
+    shutil.copytree(str(tmpdir), other, ignore=shutil.ignore_patterns('other'))
+    assert CompiledModelDriver.hash_build_inputs(
+        [os.path.join(other, 'src.c')],
+        include_dirs=[os.path.join(other, 'include')]).hexdigest() == key
+    with open(os.path.join(incdir, 'b.h'), 'w') as fd:
+        fd.write('int c;\n')
+    assert get_hash() != key
+
+
+def test_check_build_cache(tmpdir):
+    r"""Test that existing outputs without a build stamp are kept."""
+    out = os.path.join(str(tmpdir), 'out.o')
+    with open(out, 'w') as fd:
+        fd.write('existing')
+    tool = CompiledModelDriver.CompilationToolBase
+    assert tool.check_build_cache('key', [], out)
+    assert os.path.isfile(out)
+    with open(out + '.ygghash', 'r') as fd:
+        assert fd.read() == 'key'
+
+
 def test_CompilationToolBase():
     r"""Test error in CompilationToolBase."""
     with pytest.raises(RuntimeError):
@@ -348,6 +399,17 @@ class TestCompiledModelDriver(model_base_class):
         deps = list(python_class.internal_libraries.keys())
         python_class.get_dependency_order(deps)
 
+    def test_get_dependency_graph(self, python_class):
+        r"""Test get_dependency_graph."""
+        deps = list(python_class.internal_libraries.keys())
+        order = python_class.get_dependency_order(deps)
+        graph = python_class.get_dependency_graph(deps)
+        assert list(graph.keys()) == order[::-1]
+        complete = []
+        for k, v in graph.items():
+            assert all(x in complete for x in v)
+            complete.append(k)
+
     def test_get_flags(self, python_class):
         r"""Test get_flags."""
         compiler = python_class.get_tool('compiler')
@@ -464,11 +526,29 @@ class TestCompiledModelDriver(model_base_class):
             instance.compile_model(out=instance.model_file,
                                    overwrite=False)
             assert os.path.isfile(instance.model_file)
+            mtime = os.path.getmtime(instance.model_file)
             instance.compile_model(out=instance.model_file,
                                    overwrite=False)
             assert os.path.isfile(instance.model_file)
+            assert os.path.getmtime(instance.model_file) == mtime
             os.remove(instance.model_file)
 
+    def test_dependencies_locked(self, instance):
+        r"""Test that internal libraries are compiled under a shared lock
+        when running under MPI."""
+        from yggdrasil.drivers.CompiledModelDriver import (
+            _buildfile_locks, _dependencies_lock)
+        old_mpi_comm = instance._mpi_comm
+        try:
+            instance._mpi_comm = False
+            with instance.dependencies_locked():
+                pass
+            instance._mpi_comm = True
+            with instance.dependencies_locked():
+                assert _dependencies_lock in _buildfile_locks
+        finally:
+            instance._mpi_comm = old_mpi_comm
+
     def test_call_linker(self, instance):
         r"""Test call_linker with static."""
         out = instance.compile_model(dont_link=True, out=None)
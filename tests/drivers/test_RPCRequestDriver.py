@@ -1,5 +1,6 @@
 import pytest
 from yggdrasil import constants
+from yggdrasil.communication import new_comm
 from tests.drivers.test_ConnectionDriver import (
     TestConnectionDriver as base_class)
 
@@ -96,3 +97,35 @@ class TestRPCRequestDriver(base_class):
     def test_send_recv_nolimit(self, do_send_recv, msg_long):
         r"""Test routing of a large message between client and server."""
         do_send_recv(msg_long)
+
+    def test_send_recv_multiple_clients(self, started_instance, name,
+                                        send_comm, send_comm_kwargs,
+                                        recv_comm, route_timeout,
+                                        wait_on_function, close_comm,
+                                        test_msg, nested_approx):
+        r"""Test that responses to multiple clients are routed through a
+        single response driver."""
+        send_comm2 = new_comm(name, **send_comm_kwargs)
+        try:
+            wait_on_function(lambda: started_instance.is_valid)
+            clients = [send_comm, send_comm2]
+            for x in clients:
+                assert x.send(test_msg)
+            for _ in clients:
+                flag, srv_msg = recv_comm.recv(timeout=route_timeout)
+                assert flag
+                assert srv_msg == nested_approx(test_msg)
+                assert recv_comm.send(srv_msg)
+            for x in clients:
+                flag, cli_msg = x.recv(timeout=route_timeout)
+                assert flag
+                assert cli_msg == nested_approx(test_msg)
+            if started_instance.ocomm._commtype != 'fork':
+                assert len(started_instance.response_drivers) == 1
+            addresses = set()
+            for x in started_instance.response_drivers.values():
+                addresses.update(x.response_comms.keys())
+                assert not x.response_routes
+            assert len(addresses) == len(clients)
+        finally:
+            close_comm(send_comm2)
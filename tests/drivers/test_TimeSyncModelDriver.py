@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+from yggdrasil.drivers.TimeSyncModelDriver import (
+    TimeSeriesStore, TimeSyncScheduler, TimeSyncModelDriver)
+
+
+def test_TimeSeriesStore():
+    r"""Test insertion and lookup in time series store."""
+    x = TimeSeriesStore()
+    assert len(x) == 0
+    assert x.max_time is None
+    t = [pd.Timedelta(i, unit='s') for i in range(4)]
+    x.insert(t[2], {'a': 2.0})
+    x.insert(t[0], {'a': 0.0})
+    x.insert(t[1], {'a': 10.0, 'b': 1.0})
+    x.insert(t[1], {'a': 1.0})
+    assert len(x) == 3
+    assert x.max_time == t[2]
+    assert x.data['a'] == [0.0, 1.0, 2.0]
+    assert np.isnan(x.data['b']).all()
+    assert x.bracket(t[1]) == (1, 1)
+    assert x.bracket(pd.Timedelta(1.5, unit='s')) == (1, 2)
+    assert x.bracket(t[3]) == (2, None)
+    assert x.bracket(pd.Timedelta(-1, unit='s')) == (None, 0)
+    frame = x.frame()
+    assert frame.shape == (3, 2)
+    assert frame.index.name == 'time'
+    frame = x.frame(time=pd.Timedelta(1.5, unit='s'), npoints=1)
+    assert list(frame.index) == [t[1], pd.Timedelta(1.5, unit='s'), t[2]]
+    assert np.isnan(frame['a'].iloc[1])
+
+
+def test_TimeSyncScheduler():
+    r"""Test ordering of pending requests by time."""
+    t = [pd.Timedelta(i, unit='s') for i in range(3)]
+    x = TimeSyncScheduler()
+    x.add(t[2], 'c')
+    x.add(t[0], 'a')
+    x.add(t[1], 'b')
+    assert len(x) == 3
+    assert x.pop_ready(None) == []
+    assert x.pop_ready(t[1]) == [(t[0], 'a'), (t[1], 'b')]
+    assert len(x) == 1
+    assert x.pop_ready(t[1]) == []
+    assert x.pop_ready(t[2]) == [(t[2], 'c')]
+    assert not x
+
+
+def test_available_time():
+    r"""Test determination of the latest time with data from all clients."""
+    t = [pd.Timedelta(i, unit='s') for i in range(3)]
+    tables = {'a': TimeSeriesStore(), 'b': TimeSeriesStore()}
+    table_units = {'a': {}, 'b': {}}
+    tables['a'].insert(t[2], {'x': 1.0})
+    assert TimeSyncModelDriver.available_time(
+        tables, table_units, ['a', 'b']) is None
+    tables['b'].insert(t[1], {'y': 1.0})
+    assert TimeSyncModelDriver.available_time(
+        tables, table_units, ['a', 'b']) == t[1]
+    assert TimeSyncModelDriver.available_time(
+        tables, table_units, ['a']) == t[2]
+    assert TimeSyncModelDriver.check_for_data(
+        t[1], tables, table_units, ['a', 'b'])
+    assert not TimeSyncModelDriver.check_for_data(
+        t[2], tables, table_units, ['a', 'b'])
+
+
+def test_merge():
+    r"""Test merging of variables from multiple models."""
+    t = [pd.Timedelta(i, unit='s') for i in range(5)]
+    tables = {'a': TimeSeriesStore(), 'b': TimeSeriesStore()}
+    for i in range(5):
+        tables['a'].insert(t[i], {'x': float(i), 'y': 10.0 * i})
+    for i in [0, 2, 4]:
+        tables['b'].insert(t[i], {'x': 2.0 * i, 'xvar': float(i)})
+    table_units = {'base': {'x': 'm', 'y': 'm', 'z': 'm'},
+                   'a': {'x': 'km', 'y': 'm'},
+                   'b': {'x': 'm', 'xvar': 'm', 'z': 'm'}}
+    synonyms = {'b': {'z': {'alt': ['xvar'], 'alt2base': lambda x: 3 * x,
+                            'base2alt': None}}}
+    aggregation = {'x': 'mean', 'y': 'sum', 'z': (lambda x: x.max())}
+    out = TimeSyncModelDriver.merge(
+        t[3], tables, table_units, ['a', 'b'], synonyms,
+        {'method': 'index'}, aggregation)
+    assert list(out.columns) == ['x', 'y', 'z']
+    np.testing.assert_allclose(out.loc[t[3]].values, [1503.0, 30.0, 9.0])
+    out = TimeSyncModelDriver.merge(
+        t[3], tables, table_units, ['a', 'b'], synonyms,
+        {'a': {'method': 'polynomial', 'order': 2},
+         'b': {'method': 'nearest'}}, aggregation)
+    np.testing.assert_allclose(out.loc[t[3], 'y'], 30.0)
+
+
+def test_interpolate_extrapolate():
+    r"""Test local interpolation methods outside the range of the data."""
+    t = [pd.Timedelta(i, unit='s') for i in range(4)]
+    store = TimeSeriesStore()
+    for i in range(3):
+        store.insert(t[i], {'x': float(i)})
+    for method in ['slinear', 'nearest', 'zero']:
+        out = TimeSyncModelDriver.interpolate(t[3], store, {'method': method})
+        assert list(out.keys()) == ['x']
+        out = TimeSyncModelDriver.interpolate(
+            pd.Timedelta(1.5, unit='s'), store, {'method': method})
+        assert not np.isnan(out['x'])
+    store = TimeSeriesStore()
+    store.insert(t[0], {'x': 1.0})
+    for method in ['slinear', 'nearest', 'zero']:
+        out = TimeSyncModelDriver.interpolate(t[1], store, {'method': method})
+        assert np.isnan(out['x'])
@@ -108,6 +108,14 @@ class TestSerializeBase(base_class):
              and (class_name not in ['SerializeBase', 'DefaultSerialize']))):
             instance.deserialize(testing_options['contents'])
 
+    def test_deserialize_bytearray(self, instance, map_sent2recv,
+                                   testing_options):
+        r"""Test deserializing messages received into a bytearray."""
+        for iobj in testing_options['objects']:
+            msg = bytearray(instance.serialize(iobj))
+            iout, ihead = instance.deserialize(msg)
+            assert map_sent2recv(iobj) == iout
+
     def test_dump_load_error(self, instance, testing_options):
         r"""Test error when dumping invalid message."""
         import io
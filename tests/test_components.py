@@ -26,6 +26,25 @@ def test_import_component():
     components.restore_registry(out)
 
 
+def test_import_component_cache():
+    r"""Test that imported components are cached."""
+    components.clear_component_cache()
+    x = components.import_component('serializer', 'direct')
+    assert ('serializer', 'direct') in components._component_cache
+    assert components.import_component('serializer', 'direct') is x
+    assert components.import_component('serializer',
+                                       seritype='direct') is x
+    components.clear_component_cache()
+    assert not components._component_cache
+
+
+def test_registry_hash():
+    r"""Test that the registry in constants matches its hash."""
+    from yggdrasil import constants
+    assert (components.registry_hash(constants.COMPONENT_REGISTRY)
+            == constants.COMPONENT_REGISTRY_HASH)
+
+
 def test_create_component():
     r"""Test dynamic creation of component instance."""
     x = components.create_component('serializer', seritype='direct')
@@ -34,3 +53,25 @@ def test_create_component():
     assert(not components.isinstance_component(x, ['comm']))
     x = components.create_component('serializer')
     assert(components.isinstance_component(x, ['serializer']))
+
+
+def test_component_init_cache():
+    r"""Test that defaults are cached without being shared."""
+
+    class DummyComponent(components.ComponentBase):
+        _schema_properties = {
+            'a': {'type': 'array', 'default': []},
+            'b': {'type': 'string', 'default': 'b'},
+            'c': {'type': 'array', 'aliases': ['c_alias']}}
+
+    x = DummyComponent()
+    y = DummyComponent(c_alias=['c1', 'c2'])
+    assert x.a == [] and (x.a is not y.a)
+    assert x.b == 'b'
+    assert x.c is None
+    assert y.c == ['c1', 'c2']
+    assert sorted(x._defaults_set) == ['a', 'b']
+    cache = DummyComponent._get_init_cache()
+    assert DummyComponent._get_init_cache() is cache
+    with pytest.raises(TypeError):
+        cache['aliases'] = ()
@@ -55,6 +55,62 @@ def test_TaskProcess():
     assert(not q.is_alive())
 
 
+def test_TaskNotifier():
+    r"""Test notification of task events."""
+    x = multitasking.TaskNotifier()
+    assert not x.wait(timeout=0.0)
+    x.notify('a')
+    x.notify('b', 'error')
+    x.notify('a')
+    assert x.wait(timeout=0.0) == {'a': ['complete'], 'b': ['error']}
+    assert not x.wait(timeout=0.0)
+    q = multitasking.YggTask(target=multitasking.test_target_error)
+    q.add_notifier(x)
+    q.start()
+    out = x.wait(timeout=60.0)
+    assert 'error' in out[q.name]
+    q.join(60.0)
+    assert not q.is_alive()
+    q.disconnect()
+
+
+@pytest.mark.skipif(not multitasking.OutputMultiplexer.supported,
+                    reason="Selecting on pipes not supported")
+def test_OutputMultiplexer():
+    r"""Test forwarding output from multiple processes from one thread."""
+    import sys
+    import subprocess
+    x = multitasking.OutputMultiplexer()
+    out = {}
+    handles = []
+    procs = []
+    for i in range(3):
+        out[i] = []
+        p = subprocess.Popen(
+            [sys.executable, '-c', 'print("hello %d")' % i],
+            stdout=subprocess.PIPE, bufsize=0)
+        procs.append(p)
+        handles.append(x.register(p.stdout, out[i].append, name=str(i)))
+    for i, h in enumerate(handles):
+        assert h.wait(60.0)
+        assert not h.is_alive()
+        assert out[i][-1] == b''
+        assert b''.join(out[i]).strip() == b'hello %d' % i
+    for p in procs:
+        p.wait()
+        p.stdout.close()
+    p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'],
+                         stdout=subprocess.PIPE, bufsize=0)
+    h = x.register(p.stdout, out[0].append)
+    assert h.is_alive()
+    h.set_break_flag()
+    assert h.was_break
+    assert not h.is_alive()
+    p.kill()
+    p.wait()
+    p.stdout.close()
+
+
 class TestContextThread(base_class):
     r"""Test for thread based Context."""
 
@@ -34,6 +34,13 @@ def test_get_run():
                    namespace=namespace)
 
 
+def test_run_serial_startup():
+    r"""Test run with drivers created and started serially."""
+    namespace = "test_run_%s" % str(uuid.uuid4)
+    runner.run([ex_yamls['hello']['python']],
+               startup_workers=1, namespace=namespace)
+
+
 def test_run_process_connections():
     r"""Test run with process based connections."""
     namespace = "test_run_%s" % str(uuid.uuid4)
@@ -42,6 +49,21 @@ def test_run_process_connections():
                namespace=namespace)
 
 
+def test_get_model_location():
+    r"""Test determination of where models run relative to connections."""
+    namespace = "test_get_model_location_%s" % str(uuid.uuid4)
+    cr = runner.get_runner([ex_yamls['hello']['python']],
+                           namespace=namespace)
+    name = list(cr.modeldrivers.keys())[0]
+    assert cr.get_model_location(name) == 'host'
+    assert cr.get_model_location(name, for_service=True) == 'remote'
+    assert cr.get_model_location('invalid') is None
+    cr.modeldrivers[name]['driver'] = 'DummyModelDriver'
+    assert cr.get_model_location(name) == 'process'
+    cr.connection_task_method = 'process'
+    assert cr.get_model_location(name) == 'host'
+
+
 # def test_runner_error():
 #     r"""Start a runner for a model with an error."""
 #     cr = runner.get_runner([sc_yamls['error']])
@@ -254,6 +254,23 @@ def test_update_constants(project_dir, display_diff):
             fd.write(old)
 
 
+def test_check_constants(project_dir):
+    r"""Test checking that constants are up to date with the modules."""
+    schema.check_constants()
+    filename = os.path.join(project_dir, 'constants.py')
+    with open(filename, 'r') as fd:
+        old = fd.read()
+    try:
+        with open(filename, 'w') as fd:
+            fd.write(old.replace('COMPONENT_REGISTRY_HASH = (',
+                                 'COMPONENT_REGISTRY_HASH_OLD = ('))
+        with pytest.raises(RuntimeError):
+            schema.update_constants(check=True)
+    finally:
+        with open(filename, 'w') as fd:
+            fd.write(old)
+
+
 def test_get_full_schema():
     r"""Test full schema."""
     s = schema.get_schema()
@@ -34,6 +34,31 @@ def test_get_source():
             assert os.path.isfile(fname)
 
 
+def test_interface_import():
+    r"""Test that importing the Python interface does not import modules
+    that are only required by the runner."""
+    assert timing.check_interface_import() > 0
+
+
+@pytest.mark.suite("timing", disabled=True)
+def test_interface_import_time():
+    r"""Test that importing the Python interface is fast."""
+    timing.check_interface_import(
+        target=timing._interface_import_target)
+
+
+def test_comm_creation():
+    r"""Test timing the creation of comms."""
+    assert timing.time_comm_creation(nrep=10) > 0
+
+
+def test_zmq_proxy():
+    r"""Test timing forwarding through a ZMQ proxy."""
+    out = timing.time_zmq_proxy(nclients=[1, 2], nmsg=10)
+    assert sorted(out.keys()) == [1, 2]
+    assert all(v > 0 for v in out.values())
+
+
 def test_platform_error():
     r"""Test error when test cannot be performed."""
     test_platform_map = {'MacOS': 'Linux',
@@ -271,6 +271,34 @@ def test_eval_kwarg():
     assert(tools.eval_kwarg('"one"') == 'one')
 
 
+def test_run_task_graph():
+    r"""Test running a dependency graph of tasks."""
+    graph = {'a': [], 'b': ['a'], 'c': [], 'd': ['b', 'c', 'invalid']}
+    for nproc in [1, None]:
+        order = []
+
+        def func(x):
+            order.append(x)
+            return x * 2
+
+        out = tools.run_task_graph(graph, func, nproc=nproc)
+        assert out == {k: k * 2 for k in graph.keys()}
+        for k, v in graph.items():
+            assert all(order.index(x) < order.index(k)
+                       for x in v if x in graph)
+    cycle = {'a': ['b'], 'b': ['a'], 'c': []}
+    with pytest.raises(ValueError):
+        tools.run_task_graph(cycle, func)
+    assert (sorted(tools.run_task_graph(cycle, func, break_cycles=True).keys())
+            == ['a', 'b', 'c'])
+
+    def error(x):
+        raise RuntimeError(x)
+
+    with pytest.raises(RuntimeError):
+        tools.run_task_graph({'a': [], 'b': []}, error)
+
+
 class TestYggClass(base_class):
     r"""Test basic behavior of YggTestClass."""
 
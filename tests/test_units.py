@@ -90,6 +90,29 @@ class TestUnits(base_class):
         x = units.add_units(int(1), 'umol')
         units.convert_to(x, 'mol')
 
+    def test_get_conversion_function(self, nested_approx):
+        r"""Test get_conversion_function."""
+        import pandas as pd
+        units.clear_conversion_cache()
+        fconv = units.get_conversion_function('cm', 'm')
+        assert fconv(100.0) == nested_approx(1.0)
+        assert fconv(units.add_units(1.0, 'm')) == nested_approx(1.0)
+        np.testing.assert_allclose(fconv(np.arange(3) * 100.0),
+                                   np.arange(3, dtype='f8'))
+        x = fconv(pd.Series([100.0, 200.0]))
+        assert isinstance(x, pd.Series)
+        np.testing.assert_allclose(x.values, [1.0, 2.0])
+        ftemp = units.get_conversion_function('degC', 'K')
+        np.testing.assert_allclose(ftemp(np.array([0.0, 100.0])),
+                                   [273.15, 373.15])
+        info = units.get_conversion_cache_info()
+        assert info['size'] == 3
+        assert info['misses'] == 3
+        assert info['hits'] == 3
+        units.clear_conversion_cache()
+        assert units.get_conversion_cache_info() == {
+            'hits': 0, 'misses': 0, 'size': 0}
+
     def test_are_compatible(self):
         r"""Test are_compatible."""
         assert(units.are_compatible('cm', 'm'))
@@ -5,7 +5,6 @@ import sys
 import shutil
 from ._version import get_versions
 from yggdrasil import platform, config
-from yggdrasil.runner import YggFunction
 _test_package_name = None
 _test_package = None
 config.cfg_logging()
@@ -50,9 +49,20 @@ def import_as_function(model_yaml, service_address=None, **kwargs):
         YggFunction: Callable wrapper for model.
 
     """
+    from yggdrasil.runner import YggFunction
     return YggFunction(model_yaml, service_address=service_address, **kwargs)
 
 
+def __getattr__(name):
+    r"""Import attributes that are expensive to import on first access
+    so that 'import yggdrasil' (e.g. from model interfaces) does not
+    import the runner, drivers, and schema."""
+    if name == 'YggFunction':
+        from yggdrasil.runner import YggFunction
+        return YggFunction
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = []
 __version__ = get_versions()['version']
 del get_versions
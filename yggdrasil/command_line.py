@@ -1467,6 +1467,10 @@ class regen_schema(SubCommand):
          {'action': 'store_true',
           'help': ('Only update the constants.py file without updating '
                    'the schema.')}),
+        (('--check', ),
+         {'action': 'store_true',
+          'help': ('Check that constants.py is up to date with the '
+                   'component modules without updating any files.')}),
         (('--filename', ),
          {'type': str,
           'help': 'Name where schema should be saved.'})]
@@ -1474,7 +1478,9 @@ class regen_schema(SubCommand):
     @classmethod
     def func(cls, args):
         from yggdrasil import schema
-        if not args.only_constants:
+        if args.check:
+            schema.check_constants()
+        elif not args.only_constants:
             if args.filename is None:
                 args.filename = schema._schema_fname
             if os.path.isfile(args.filename):
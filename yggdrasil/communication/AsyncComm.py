@@ -215,6 +215,12 @@ class AsyncComm(ProxyObject, ComponentBaseUnregistered):
         r"""int: Number of messages in the send backlog."""
         return self.n_msg_backlog_send
 
+    @property
+    def n_msg_outstanding(self):
+        r"""int: The number of messages in the send backlog or sent, but
+        not yet confirmed by the partner comm."""
+        return self.n_msg_backlog_send + self._wrapped.n_msg_outstanding
+
     @property
     def n_msg_direct_recv(self):
         r"""int: Number of messages currently being routed in recv."""
@@ -1,16 +1,97 @@
+import queue
+import threading
 from yggdrasil import multitasking
 from yggdrasil.communication import CommBase, NoMessages
 
 
 class LockedBuffer(multitasking.Queue):
-    r"""Buffer intended to be shared between threads/processes."""
+    r"""Buffer intended to be shared between threads/processes. Buffers
+    that can be shared between processes pass messages by reference
+    through an in-memory queue until they are pickled for use by
+    another process, at which point any pending messages are moved to
+    the process queue and it is used from then on."""
 
-    __slots__ = ["_closed"]
+    __slots__ = ["_closed", "_local", "_local_lock"]
 
     def __init__(self, *args, **kwargs):
         kwargs.setdefault('task_method', 'process')
         super(LockedBuffer, self).__init__(*args, **kwargs)
         self._closed = self.context.Event()
+        self._local_lock = threading.RLock()
+        self._local = None
+        if self.parallel:
+            self._local = queue.Queue()
+
+    def __getstate__(self):
+        self.share()
+        state = super(LockedBuffer, self).__getstate__()
+        state.pop('_local_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        state['_local_lock'] = threading.RLock()
+        super(LockedBuffer, self).__setstate__(state)
+
+    @property
+    def in_process(self):
+        r"""bool: True if messages are passed by reference because the
+        buffer has not been shared with another process."""
+        return (self._local is not None)
+
+    def share(self):
+        r"""Switch to passing messages through the process queue so that
+        the buffer can be used by another process."""
+        with self._local_lock:
+            local, self._local = self._local, None
+            if local is None:
+                return
+            while True:
+                try:
+                    self._base.put(local.get_nowait())
+                except queue.Empty:
+                    break
+
+    def put(self, *args, **kwargs):
+        with self._local_lock:
+            if self._local is not None:
+                return self._local.put(*args, **kwargs)
+            return super(LockedBuffer, self).put(*args, **kwargs)
+
+    def put_nowait(self, *args, **kwargs):
+        with self._local_lock:
+            if self._local is not None:
+                return self._local.put_nowait(*args, **kwargs)
+            return super(LockedBuffer, self).put_nowait(*args, **kwargs)
+
+    def get(self, *args, **kwargs):
+        local = self._local
+        if local is not None:
+            return local.get(*args, **kwargs)
+        return super(LockedBuffer, self).get(*args, **kwargs)
+
+    def get_nowait(self, *args, **kwargs):
+        local = self._local
+        if local is not None:
+            return local.get_nowait(*args, **kwargs)
+        return super(LockedBuffer, self).get_nowait(*args, **kwargs)
+
+    def empty(self):
+        local = self._local
+        if local is not None:
+            return local.empty()
+        return super(LockedBuffer, self).empty()
+
+    def full(self):
+        local = self._local
+        if local is not None:
+            return local.full()
+        return super(LockedBuffer, self).full()
+
+    def qsize(self):
+        local = self._local
+        if local is not None:
+            return local.qsize()
+        return super(LockedBuffer, self).qsize()
 
     @property
     def closed(self):
@@ -28,6 +109,8 @@ class LockedBuffer(multitasking.Queue):
         if hasattr(self, '_closed'):
             self._closed.set()
             self._closed.disconnect()
+        if hasattr(self, '_local'):
+            self._local = None
         super(LockedBuffer, self).disconnect()
         
     def __len__(self):
@@ -3,6 +3,61 @@ from collections import OrderedDict
 from yggdrasil.communication import CommBase, new_comm, get_comm, import_comm
 
 
+class RPCFuture(object):
+    r"""Response to an asynchronous RPC call that has not necessarily
+    been received yet.
+
+    Args:
+        client (ClientComm): Client comm that sent the request.
+        request_id (str): ID of the request.
+
+    Attributes:
+        client (ClientComm): Client comm that sent the request.
+        request_id (str): ID of the request.
+
+    """
+
+    __slots__ = ['client', 'request_id', '_result']
+
+    def __init__(self, client, request_id):
+        self.client = client
+        self.request_id = request_id
+        self._result = None
+        super(RPCFuture, self).__init__()
+
+    def done(self):
+        r"""Determine if the response has been received.
+
+        Returns:
+            bool: True if the response has been received, False otherwise.
+
+        """
+        return ((self._result is not None)
+                or (self.request_id in self.client.responses))
+
+    def result(self, timeout=False):
+        r"""Get the response, receiving it if it has not already been
+        received.
+
+        Args:
+            timeout (float, optional): Time that should be waited for the
+                response. Defaults to False and the call will block until
+                the response is received.
+
+        Returns:
+            tuple(bool, obj): Success or failure of the call and the
+                response.
+
+        """
+        if self._result is None:
+            out = self.client.recv(timeout=timeout,
+                                   request_id=self.request_id)
+            if self.request_id not in self.client.request_order:
+                self._result = out
+            return out
+        return self._result
+
+
 class ClientComm(CommBase.CommBase):
     r"""Class for handling Client side communication.
 
@@ -15,10 +70,16 @@ class ClientComm(CommBase.CommBase):
             comm. Defaults to empty dict.
         direct_connection (bool, optional): If True, the comm will be
             directly connected to a ServerComm. Defaults to False.
+        max_outstanding (int, optional): Maximum number of requests sent by
+            call_async that can be awaiting a response before call_async
+            blocks to receive the response to the oldest request. Defaults
+            to 0 and the number of outstanding requests is not limited.
         **kwargs: Additional keywords arguments are passed to the output comm.
 
     Attributes:
         response_kwargs (dict): Keyword arguments for the response comm.
+        max_outstanding (int): Maximum number of requests sent by call_async
+            that can be awaiting a response.
         request_order (list): Order of request IDs.
         responses (dict): Mapping between request IDs and response messages.
         ocomm (Comm): Request comm.
@@ -31,7 +92,7 @@ class ClientComm(CommBase.CommBase):
     
     def __init__(self, name, request_commtype=None, response_kwargs=None,
                  dont_open=False, is_async=False, direct_connection=False,
-                 **kwargs):
+                 max_outstanding=0, **kwargs):
         if response_kwargs is None:
             response_kwargs = dict()
         ocomm_name = name
@@ -43,6 +104,7 @@ class ClientComm(CommBase.CommBase):
         if direct_connection:
             ocomm_kwargs.setdefault('is_client', True)
         self.direct_connection = direct_connection
+        self.max_outstanding = max_outstanding
         self.response_kwargs = response_kwargs
         self.ocomm = get_comm(ocomm_name, **ocomm_kwargs)
         self.icomm = None
@@ -254,11 +316,20 @@ class ClientComm(CommBase.CommBase):
         return out
         
     # RECV METHODS
-    def recv_message(self, *args, **kwargs):
-        r"""Receive a message.
+    @property
+    def n_outstanding(self):
+        r"""int: Number of requests that have not received a response."""
+        return len(self.request_order) - len(self.responses)
+
+    def recv_message(self, *args, request_id=None, **kwargs):
+        r"""Receive a message. Responses to other requests that are received
+        first are stored until they are requested.
 
         Args:
             *args: Arguments are passed to the response comm's recv_message method.
+            request_id (str, optional): ID of the request that the response
+                should be returned for. Defaults to None and the response to
+                the oldest request is returned.
             **kwargs: Keyword arguments are passed to the response comm's recv_message
                 method.
 
@@ -268,16 +339,41 @@ class ClientComm(CommBase.CommBase):
         """
         if not self.request_order:  # pragma: debug
             raise RuntimeError("There are not any requests registered.")
-        while self.responses.get(self.request_order[0], None) is None:
+        if request_id is None:
+            request_id = self.request_order[0]
+        elif request_id not in self.request_order:  # pragma: debug
+            raise RuntimeError(f"There is not a request registered with "
+                               f"request_id = '{request_id}'.")
+        msg = self.recv_response(request_id, *args, **kwargs)
+        if request_id in self.responses:
+            msg = self.responses.pop(request_id)
+            self.request_order.remove(request_id)
+        return msg
+
+    def recv_response(self, request_id, *args, **kwargs):
+        r"""Receive responses, storing them by request ID, until the
+        response to a specific request has been received.
+
+        Args:
+            request_id (str): ID of the request to receive the response for.
+            *args: Arguments are passed to the response comm's recv_message method.
+            **kwargs: Keyword arguments are passed to the response comm's recv_message
+                method.
+
+        Returns:
+            CommMessage: Last message received. If the response was not
+                received, this will contain the failure flag.
+
+        """
+        msg = self.responses.get(request_id, None)
+        while msg is None:
             msg = self.icomm.recv_message(*args, **kwargs)
             self.errors += self.icomm.errors
             if msg.flag != CommBase.FLAG_SUCCESS:  # pragma: debug
                 break
             assert msg.header['__meta__']['request_id'] not in self.responses
             self.responses[msg.header['__meta__']['request_id']] = msg
-        if self.request_order[0] in self.responses:
-            msg = self.responses.pop(self.request_order[0])
-            self.request_order.pop(0)
+            msg = self.responses.get(request_id, None)
         return msg
 
     def finalize_message(self, msg, **kwargs):
@@ -318,6 +414,53 @@ class ClientComm(CommBase.CommBase):
         r"""Alias for call."""
         return self.call(*args, **kwargs)
 
+    def call_async(self, *args, **kwargs):
+        r"""Send an RPC request without waiting for the response. If there
+        are already max_outstanding requests awaiting a response, the
+        response to the oldest request is received (and stored) first.
+
+        Args:
+            *args: Arguments are passed to output comm send method.
+            **kwargs: Keyword arguments are passed to output comm send method
+
+        Returns:
+            RPCFuture: Future for the response.
+
+        """
+        if self.max_outstanding > 0:
+            for request_id in list(self.request_order):
+                if self.n_outstanding < self.max_outstanding:
+                    break
+                msg = self.recv_response(request_id, timeout=False)
+                if msg.flag != CommBase.FLAG_SUCCESS:  # pragma: debug
+                    raise RuntimeError("Failed to receive RPC response.")
+        flag = self.send(*args, **kwargs)
+        if not flag:  # pragma: debug
+            raise RuntimeError("Failed to send RPC request.")
+        return RPCFuture(self, self.request_order[-1])
+
+    def call_many(self, args_list, **kwargs):
+        r"""Do multiple RPC calls, sending requests before the responses to
+        earlier requests have been received (subject to max_outstanding).
+
+        Args:
+            args_list (list): Arguments for each call. Each element should
+                be a tuple of arguments or a single argument.
+            **kwargs: Keyword arguments are passed to output comm send method
+                for each call.
+
+        Returns:
+            list: Output from input comm recv method for each call, in the
+                same order as args_list.
+
+        """
+        futures = []
+        for args in args_list:
+            if not isinstance(args, tuple):
+                args = (args, )
+            futures.append(self.call_async(*args, **kwargs))
+        return [x.result() for x in futures]
+
     # OLD STYLE ALIASES
     def rpcSend(self, *args, **kwargs):
         r"""Alias for RPCComm.send"""
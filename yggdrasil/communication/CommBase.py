@@ -33,6 +33,26 @@ FLAG_INCOMPLETE = 5
 FLAG_EMPTY = 6
 
 
+def uses_python_interface(driver):
+    r"""Determine if models handled by a driver communicate through the
+    Python interface.
+
+    Args:
+        driver (class): Model driver class.
+
+    Returns:
+        bool: True if the driver's models use the Python interface.
+
+    """
+    if driver is None:
+        return False
+    if any(c.__dict__.get('language', None) == 'python'
+           for c in driver.__mro__):
+        return True
+    return any(uses_python_interface(import_component('model', x))
+               for x in driver.base_languages)
+
+
 class NeverMatch(Exception):
     'An exception class that is never raised by any code anywhere'
 
@@ -63,12 +83,14 @@ class CommMessage(object):
             comm as the original message had to be split due to its size.
         sent (bool): True if the message has been sent, False otherwise.
         singular (bool): True if there was only one argument.
+        data (bytes): The serialized message without the header. If set
+            before serialization, it is used in place of serializing args.
 
     """
 
     __slots__ = ['msg', 'length', 'flag', 'args', 'header',
                  'additional_messages', 'worker', 'worker_messages',
-                 'sent', 'finalized', 'singular', 'stype', 'sinfo']
+                 'sent', 'finalized', 'singular', 'stype', 'sinfo', 'data']
 
     def __init__(self, msg=None, length=0, flag=None, args=None, header=None):
         self.msg = msg
@@ -86,6 +108,7 @@ class CommMessage(object):
         self.singular = False
         self.stype = None
         self.sinfo = None
+        self.data = None
 
     def __str__(self):
         return 'CommMessage(flag=%s, %.100s..., sent=%s)' % (
@@ -370,6 +393,11 @@ class CommBase(tools.YggClass):
             partner comm. Defaults to 'python'.
         partner_mpi_ranks (list, optional): Ranks of processes of this comm's
             partner comm(s). Defaults to [].
+        partner_location (str, optional): Where this comm's partner comm
+            runs relative to this one. 'process' if in the same process,
+            'host' if in a different process on the same host, and 'remote'
+            if on a different host. Defaults to None and the location is
+            unknown.
         datatype (schema, optional): JSON schema (with expanded core types
             defined by |yggdrasil|) that constrains the type of data that
             should be sent/received by this object. Defaults to {'type': 'bytes'}.
@@ -407,6 +435,18 @@ class CommBase(tools.YggClass):
             open. Defaults to False.
         single_use (bool, optional): If True, the comm will only be used to
             send/recv a single message. Defaults to False.
+        work_comm_pool_size (int, optional): Maximum number of work comms
+            that will be kept open and reused to send messages that exceed
+            the maximum message size. Defaults to _work_comm_pool_size. Work
+            comms are only reused if the partner comm uses the Python
+            interface and messages are not routed to multiple receivers
+            (e.g. via a proxy or for clients/servers); a value of 0
+            disables reuse. A pooled work comm carries the chunks of one
+            message at a time so messages are serialized over the comm,
+            not multiplexed.
+        work_comm_reuse (bool, optional): If True, the comm is a pooled work
+            comm that will be reused to send/recv the chunks of multiple
+            messages. Defaults to False.
         reverse_names (bool, optional): If True, the suffix added to the comm
             with be reversed. Defaults to False.
         no_suffix (bool, optional): If True, no directional suffix will be added
@@ -470,6 +510,8 @@ class CommBase(tools.YggClass):
     Class Attributes:
         is_file (bool): True if the comm accesses a file.
         _maxMsgSize (int): Maximum size of a single message that should be sent.
+        _work_comm_pool_size (int): Default maximum number of work comms
+            that will be reused for messages exceeding _maxMsgSize.
         address_description (str): Description of the information constituting
             an address for this communication mechanism.
 
@@ -485,6 +527,8 @@ class CommBase(tools.YggClass):
         partner_model (str): Name of model that this comm is partnered with.
         partner_language (str): Programming language of this comm's partner comm.
         partner_mpi_ranks (list): Ranks of processes of this comm's partner comm(s).
+        partner_location (str): Where this comm's partner comm runs relative
+            to this one.
         serializer (:class:.DefaultSerialize): Object that will be used to
             serialize/deserialize messages to/from python objects.
         recv_timeout (float): Time that should be waited for an incoming
@@ -495,6 +539,10 @@ class CommBase(tools.YggClass):
             sends an end-of-file messages. Otherwise, it will remain open.
         single_use (bool): If True, the comm will only be used to send/recv a
             single message.
+        work_comm_pool_size (int): Maximum number of work comms that will
+            be reused to send messages that exceed the maximum message size.
+        work_comm_reuse (bool): If True, the comm is a pooled work comm that
+            will be reused to send/recv the chunks of multiple messages.
         allow_multiple_comms (bool): If True, initialize the comm such that
             mulitiple comms can connect to the same address.
         is_client (bool): If True, the comm is one of many potential clients
@@ -585,6 +633,7 @@ class CommBase(tools.YggClass):
                            '$properties/serializer': True}}
     is_file = False
     _maxMsgSize = 0
+    _work_comm_pool_size = 4
     address_description = None
     no_serialization = False
     _model_schema_prop = ['is_default', 'outside_loop', 'dont_copy',
@@ -600,8 +649,11 @@ class CommBase(tools.YggClass):
     def __init__(self, name, address=None, direction='send', dont_open=False,
                  is_interface=None, language=None, env=None, partner_copies=0,
                  partner_model=None, partner_language='python', partner_mpi_ranks=[],
-                 recv_timeout=0.0, close_on_eof_recv=True, close_on_eof_send=False,
-                 single_use=False, reverse_names=False, no_suffix=False,
+                 partner_location=None, recv_timeout=0.0, close_on_eof_recv=True,
+                 close_on_eof_send=False,
+                 single_use=False, work_comm_pool_size=None,
+                 work_comm_reuse=False,
+                 reverse_names=False, no_suffix=False,
                  allow_multiple_comms=False,
                  is_client=False, is_response_client=False,
                  is_server=False, is_response_server=False,
@@ -648,6 +700,7 @@ class CommBase(tools.YggClass):
             self.partner_language_driver = import_component(
                 'model', self.partner_language)
         self.partner_mpi_ranks = copy.copy(partner_mpi_ranks)
+        self.partner_location = partner_location
         self.language_driver = import_component('model', self.language)
         self.touches_model = (self.partner_model is not None)
         self.is_client = is_client
@@ -660,6 +713,9 @@ class CommBase(tools.YggClass):
         self.close_on_eof_recv = close_on_eof_recv
         self.close_on_eof_send = close_on_eof_send
         self._work_comms = {}
+        self._work_comm_pool = collections.deque()
+        self._work_comm_hits = 0
+        self._work_comm_misses = 0
         self.single_use = single_use
         self._used = False
         self._multiple_first_send = True
@@ -673,18 +729,31 @@ class CommBase(tools.YggClass):
         self._server_class = CommServer
         self._server_kwargs = {}
         self._send_serializer = True
+        self.work_comm_reuse = work_comm_reuse
         self.allow_multiple_comms = allow_multiple_comms
-        if (((not self.single_use)
+        if (((not (self.single_use or self.work_comm_reuse))
              and ((self.is_interface and self.env.get('YGG_THREADING', False))
                   or (self.model_copies > 1) or (self.partner_copies > 1)
                   or self.for_service))):
             self.allow_multiple_comms = True
-        if self.single_use and (not self.is_response_server):
+        if (((self.single_use or self.work_comm_reuse)
+             and (not self.is_response_server))):
             self._send_serializer = False
         self.create_proxy = ((self.is_client or self.allow_multiple_comms)
                              and (not self.is_interface)
                              and (self.direction != 'recv')
                              and (self._commtype not in ['mpi', 'rest']))
+        if work_comm_pool_size is None:
+            work_comm_pool_size = self._work_comm_pool_size
+        if ((self.allow_multiple_comms or self.create_proxy
+             or self.is_client or self.is_server
+             or self.is_response_client or self.is_response_server
+             or (not uses_python_interface(self.partner_language_driver)))):
+            # Other language interfaces close work comms after each
+            # message and work comms are paired with a single receiver so
+            # they cannot be reused when messages are routed to several
+            work_comm_pool_size = 0
+        self.work_comm_pool_size = work_comm_pool_size
         # Add interface tag
         if self.is_interface:
             self._name += '_I'
@@ -699,7 +768,7 @@ class CommBase(tools.YggClass):
         self._eof_sent = multitasking.Event()
         self._iterator_backlog = None
         self._field_backlog = dict()
-        if self.single_use:
+        if self.single_use or self.work_comm_reuse:
             self._eof_sent.set()
         if self.is_response_client or self.is_response_server:
             self._eof_sent.set()  # Don't send EOF, these are single use
@@ -962,6 +1031,12 @@ class CommBase(tools.YggClass):
         nindent = kwargs.get('nindent', 0)
         lines, prefix = self.get_status_message(*args, **kwargs)
         if len(self._work_comms) > 0:
+            stats = self.work_comm_pool_stats
+            lines.append(
+                '%sWork comm pool: %d/%d (%d hits, %d misses, %.1f%% hit '
+                'rate)' % (prefix, stats['size'], stats['max_size'],
+                           stats['hits'], stats['misses'],
+                           100 * stats['hit_rate']))
             lines.append('%sWork comms:' % prefix)
             for v in self._work_comms.values():
                 lines += v.get_status_message(nindent=nindent + 1)[0]
@@ -1404,6 +1479,12 @@ class CommBase(tools.YggClass):
         r"""int: The number of outgoing messages in the connection."""
         return 0
 
+    @property
+    def n_msg_outstanding(self):
+        r"""int: The number of sent messages that have not yet been
+        received and confirmed by the partner comm."""
+        return self.n_msg_send
+
     @property
     def n_msg_recv_drain(self):
         r"""int: The number of incoming messages in the connection to drain."""
@@ -1429,7 +1510,7 @@ class CommBase(tools.YggClass):
             bool: True if the message indicates an EOF, False otherwise.
 
         """
-        out = (isinstance(msg, bytes) and (msg == self.eof_msg))
+        out = (isinstance(msg, (bytes, bytearray)) and (msg == self.eof_msg))
         return out
 
     def update_message_from_serializer(self, msg):
@@ -1554,6 +1635,31 @@ class CommBase(tools.YggClass):
             out = self.filter(msg_in)
         assert isinstance(out, bool)
         return out
+
+    def evaluate_row_filter(self, msg):
+        r"""Evaluate a row-wise filter on a table message, reducing the
+        message to the rows that pass the filter.
+
+        Args:
+            msg (CommMessage): Message to filter.
+
+        Returns:
+            bool: True if the filter is row-wise and the message is a table
+                (in which case msg.args will be updated to the reduced table
+                or msg.flag will be set to FLAG_SKIP if no rows pass),
+                False otherwise.
+
+        """
+        if (not self.filter) or self.is_eof(msg.args):
+            return False
+        if not self.filter.is_table(msg.args):
+            return False
+        out = self.filter.filter_rows(msg.args)
+        if out is None:
+            msg.flag = FLAG_SKIP
+        else:
+            msg.args = out
+        return True
         
     @property
     def empty_obj_recv(self):
@@ -1573,10 +1679,10 @@ class CommBase(tools.YggClass):
 
         """
         try:
-            import pandas
             if isinstance(msg, np.ndarray):
                 np.testing.assert_array_equal(msg, emsg)
-            elif isinstance(msg, pandas.DataFrame):
+            elif type(msg).__name__ == 'DataFrame':
+                import pandas
                 pandas.testing.assert_frame_equal(msg, emsg)
             else:
                 assert msg == emsg
@@ -1741,10 +1847,84 @@ class CommBase(tools.YggClass):
         """
         c = self._work_comms.get(header['__meta__']['id'], None)
         if c is None:
+            if header['__meta__'].get('work_comm_reuse', False):
+                kwargs.setdefault('single_use', False)
+                kwargs.setdefault('work_comm_reuse', True)
             c = self.header2workcomm(header, **kwargs)
             self.add_work_comm(c)
+            self._work_comm_misses += 1
+        else:
+            self._work_comm_hits += 1
+        return c
+
+    def acquire_work_comm(self):
+        r"""Get a work comm for sending a message that exceeds the maximum
+        message size. Idle comms in the work comm pool are reused and new
+        comms are only created while the pool is below work_comm_pool_size.
+        If all of the pooled comms are busy, the least recently used comm
+        is returned once it has finished sending. Pooled comms only
+        serialize messages; the chunks of one message are all sent before
+        the next message is sent via the same comm.
+
+        Returns:
+            :class:.CommBase: Work comm.
+
+        """
+        if self.work_comm_pool_size <= 0:
+            self._work_comm_misses += 1
+            return self.create_work_comm()
+        for x in list(self._work_comm_pool):
+            if x.is_closed:
+                self.remove_work_comm(x.uuid)
+        c = None
+        for x in self._work_comm_pool:
+            if not self.is_work_comm_busy(x):
+                c = x
+                break
+        if (c is None) and (len(self._work_comm_pool)
+                            < self.work_comm_pool_size):
+            c = self.create_work_comm(single_use=False,
+                                      work_comm_reuse=True)
+            self._work_comm_misses += 1
+        else:
+            if c is None:
+                c = self._work_comm_pool[0]
+                c.task_timer.join(self.timeout)
+                if self.is_work_comm_busy(c):  # pragma: debug
+                    # Don't interleave chunks from two messages
+                    self._work_comm_misses += 1
+                    return self.create_work_comm()
+            self._work_comm_pool.remove(c)
+            self._work_comm_hits += 1
+        self._work_comm_pool.append(c)
         return c
 
+    @classmethod
+    def is_work_comm_busy(cls, comm):
+        r"""Determine if a work comm is still sending a message.
+
+        Args:
+            comm (:class:.CommBase): Work comm to check.
+
+        Returns:
+            bool: True if the comm is still sending message chunks.
+
+        """
+        task_timer = getattr(comm, 'task_timer', None)
+        return bool(task_timer is not None and task_timer.is_alive())
+
+    @property
+    def work_comm_pool_stats(self):
+        r"""dict: Size of the work comm pool and the rate at which
+        existing work comms are reused for messages exceeding the maximum
+        message size."""
+        ntot = self._work_comm_hits + self._work_comm_misses
+        return {'size': len(self._work_comm_pool),
+                'max_size': self.work_comm_pool_size,
+                'hits': self._work_comm_hits,
+                'misses': self._work_comm_misses,
+                'hit_rate': (self._work_comm_hits / ntot) if ntot else 0.0}
+
     def create_work_comm(self, work_comm_name=None, **kwargs):
         r"""Create a temporary work comm.
 
@@ -1799,6 +1979,8 @@ class CommBase(tools.YggClass):
             return
         if not in_thread:
             c = self._work_comms.pop(key)
+            if c in self._work_comm_pool:
+                self._work_comm_pool.remove(c)
             c.close(linger=linger)
         else:  # pragma: debug
             # c = self._work_comms[key]
@@ -2083,7 +2265,12 @@ class CommBase(tools.YggClass):
         if not skip_processing:
             # 4. Check if the message should be filtered
             if msg.flag not in [FLAG_SKIP, FLAG_EOF]:
-                if not self.evaluate_filter(*msg.tuple_args):
+                if self.evaluate_row_filter(msg):
+                    if msg.flag == FLAG_SKIP:
+                        self.debug("Sent table skipped based on row-wise "
+                                   "filter: %.100s", str(msg.args))
+                        return msg
+                elif not self.evaluate_filter(*msg.tuple_args):
                     self.debug("Sent message skipped based on filter: %.100s",
                                str(msg.args))
                     msg.flag = FLAG_SKIP
@@ -2124,7 +2311,8 @@ class CommBase(tools.YggClass):
                         else:
                             x.msg = x.args
                     else:
-                        x.msg = self.serialize(x.args, metadata=x.header)
+                        x.msg = self.serialize(x.args, metadata=x.header,
+                                               data=x.data)
                         x.flag = FLAG_SUCCESS
                     x.length = len(x.msg)
                 # 8. Create a work comm if the message is too large to be sent all
@@ -2134,13 +2322,15 @@ class CommBase(tools.YggClass):
                         raise NotImplementedError(("EOF message with header (%d) "
                                                    "exceeds max message size (%d).")
                                                   % (msg.length, self.maxMsgSize))
-                    x.worker = self.create_work_comm()
-                    # if 'address' not in x.header:
-                    #     x.worker = self.create_work_comm()
-                    # else:
-                    #     x.worker = self.get_work_comm(x.header)
+                    x.worker = self.acquire_work_comm()
                     x.header = self.workcomm2header(x.worker, **x.header)
-                    total = self.serialize(x.args, metadata=x.header)
+                    if x.worker in self._work_comm_pool:
+                        # Chunks for this message follow those of any prior
+                        # message sent via the same pooled work comm so the
+                        # receiver reads them in order without message IDs
+                        x.header['__meta__']['work_comm_reuse'] = True
+                    total = self.serialize(x.args, metadata=x.header,
+                                           data=x.data)
                     x.msg = total[:self.maxMsgSize]
                     x.length = len(x.msg)
                     for imsg in self.chunk_message(total[self.maxMsgSize:]):
@@ -2277,7 +2467,7 @@ class CommBase(tools.YggClass):
             if no_serialization:
                 msg.args = msg.msg
                 msg.header = {'__meta__': {}}
-                if isinstance(msg.msg, bytes):
+                if isinstance(msg.msg, (bytes, bytearray)):
                     msg.header['__meta__']['size'] = len(msg.msg)
             else:
                 msg.args, msg.header = self.deserialize(msg.msg)
@@ -2285,6 +2475,7 @@ class CommBase(tools.YggClass):
             if msg.header.get('incomplete', False):
                 msg.msg = msg.args
                 msg.worker = self.get_work_comm(msg.header)
+                reuse_worker = msg.header['__meta__'].get('work_comm_reuse', False)
                 msg.flag = FLAG_INCOMPLETE
                 while len(msg.msg) < msg.header['__meta__']['size']:
                     imsg = msg.worker.recv_message(skip_deserialization=True, **kwargs)
@@ -2295,15 +2486,16 @@ class CommBase(tools.YggClass):
                         break
                     if imsg.flag == FLAG_SUCCESS:
                         msg.msg += imsg.msg
-                self.debug("Received %d/%d bytes", len(msg.msg),
-                           msg.header['__meta__']['size'])
+                self.debug("Received %d/%d bytes",
+                           len(msg.msg), msg.header['__meta__']['size'])
                 if msg.flag in [FLAG_INCOMPLETE, FLAG_SUCCESS]:
                     msg.args = msg.msg
                     if not (no_serialization or msg.header.get('raw', False)):
                         msg.args, msg.header = self.deserialize(msg.msg,
                                                                 metadata=msg.header)
                     msg.flag = FLAG_SUCCESS
-                msg.worker.linger_close()
+                if not reuse_worker:
+                    msg.worker.linger_close()
             if not no_serialization:
                 self.update_message_from_serializer(msg)
         except TemporaryCommunicationError if self.is_async else NeverMatch:
@@ -2312,7 +2504,7 @@ class CommBase(tools.YggClass):
             self.exception('Failed to recv.')
             self.close()
             return CommMessage(flag=FLAG_FAILURE)
-        if isinstance(msg.msg, bytes):
+        if isinstance(msg.msg, (bytes, bytearray)):
             msg.length = len(msg.msg)
         else:
             msg.length = 1
@@ -2363,7 +2555,9 @@ class CommBase(tools.YggClass):
             elif msg.flag == FLAG_EMPTY:
                 msg.args = self.empty_obj_recv
             # 2. Filter
-            if (msg.flag == FLAG_SUCCESS) and (not self.evaluate_filter(msg.args)):
+            if (((msg.flag == FLAG_SUCCESS)
+                 and (not self.evaluate_row_filter(msg))
+                 and (not self.evaluate_filter(msg.args)))):
                 msg.flag = FLAG_SKIP
             # 3. Perform python2language
             if (msg.flag in [FLAG_EOF, FLAG_SUCCESS]) and (not skip_python2language):
@@ -1,13 +1,88 @@
 import copy
+import pickle
+import collections
+from yggdrasil import multitasking, constants
 from yggdrasil.communication import CommBase, get_comm, import_comm
 
 
 _address_sep = ':YGG_ADD:'
 _pattern_pairs = [('scatter', 'gather')]
+_load_patterns = ['least_loaded', 'work_stealing']
+
+
+def get_broadcast_key(comm):
+    r"""Get a key identifying communicators that will produce identical
+    serialized messages from the same input so that a broadcast message
+    can be processed and serialized once and shared between them.
+
+    Args:
+        comm (CommBase): Communicator to get the key for.
+
+    Returns:
+        tuple: Key that is equal for compatible communicators. None if
+            messages for the communicator must be prepared separately
+            (e.g. the serializer is not yet initialized or the class
+            customizes message preparation).
+
+    """
+    try:
+        # Asynchronous comms are proxies for the comm that prepares
+        # the messages
+        comm = getattr(comm, '_wrapped', comm)
+        cls = type(comm)
+        if not ((cls.prepare_message is CommBase.CommBase.prepare_message)
+                and (cls.serialize is CommBase.CommBase.serialize)
+                and comm.serializer.initialized):
+            return None
+        # Header information added by the comm (e.g. reply addresses)
+        # must be the same for the serialized message to be shared
+        return (cls, comm.maxMsgSize, comm.is_file, comm.no_serialization,
+                comm._send_serializer, comm.full_model_name,
+                pickle.dumps(comm.prepare_header({})),
+                type(comm.serializer),
+                pickle.dumps(comm.serializer.serializer_info),
+                tuple((type(x), pickle.dumps(x._ygg_rapidjson()))
+                      for x in comm.transform),
+                (type(comm.filter), pickle.dumps(comm.filter._ygg_rapidjson()))
+                if comm.filter else None)
+    except Exception:
+        return None
+
+
+def copy_message(msg, share_serialized=False):
+    r"""Create a copy of a message that shares the (possibly large)
+    message contents with the original, but can be annotated and sent
+    independently.
+
+    Args:
+        msg (CommBase.CommMessage): Message to copy.
+        share_serialized (bool, optional): If True, the serialized
+            message will also be shared so that it can be sent without
+            serializing it again. Defaults to False.
+
+    Returns:
+        CommBase.CommMessage: Copy of the message.
+
+    """
+    out = CommBase.CommMessage(args=msg.args, flag=msg.flag,
+                               header=copy.deepcopy(msg.header))
+    for k in ['singular', 'stype', 'sinfo']:
+        setattr(out, k, copy.deepcopy(getattr(msg, k)))
+    out.data = msg.data
+    if share_serialized:
+        out.msg = msg.msg
+        out.length = msg.length
+    out.additional_messages = [
+        copy_message(x, share_serialized=share_serialized)
+        for x in msg.additional_messages]
+    return out
 
 
 class ForkedCommMessage(CommBase.CommMessage):
-    r"""Class for forked comm messages.
+    r"""Class for forked comm messages. When the same message is sent to
+    multiple communicators, it is only processed and serialized once for
+    each group of communicators that would produce the same result (see
+    get_broadcast_key) and the serialized bytes are shared.
 
     Args:
         msg (CommBase.CommMessage): Message being distributed.
@@ -26,22 +101,85 @@ class ForkedCommMessage(CommBase.CommMessage):
             args=msg.args, header=msg.header)
         for k in CommBase.CommMessage.__slots__:
             setattr(self, k, getattr(msg, k))
-        if (pattern in ['broadcast', 'cycle']) or (msg.flag == CommBase.FLAG_EOF):
-            msg_list = [copy.deepcopy(msg)
-                        for _ in range(len(comm_list))]
+        if msg.header:
+            kwargs.setdefault('header_kwargs', msg.header)
+        if ((pattern in ['broadcast', 'cycle'] + _load_patterns)
+                or (msg.flag == CommBase.FLAG_EOF)):
+            args = self.prepare_broadcast(msg, comm_list, **kwargs)
         elif pattern == 'scatter':
-            msg_list = [copy.deepcopy(msg.args[i])
-                        for i in range(len(comm_list))]
             kwargs.setdefault('flag', msg.flag)
+            args = {i: x.prepare_message(copy.deepcopy(msg.args[i]), **kwargs)
+                    for i, x in enumerate(comm_list)}
         else:  # pragma: debug
             raise ValueError("Unsupported pattern: '%s'" % pattern)
-        if msg.header:
-            kwargs.setdefault('header_kwargs', msg.header)
-        args = {i: x.prepare_message(msg_list[i], **kwargs)
-                for i, x in enumerate(comm_list)}
         self.orig = msg.args
         self.args = args
 
+    @classmethod
+    def prepare_broadcast(cls, msg, comm_list, **kwargs):
+        r"""Prepare the same message for sending via multiple comms.
+
+        Args:
+            msg (CommBase.CommMessage): Message being distributed.
+            comm_list (list): List of communicators that the message is
+                being distributed to.
+            **kwargs: Additional keyword arguments are passed to the
+                'prepare_message' method for each communicator.
+
+        Returns:
+            dict: Prepared messages for each communicator.
+
+        """
+        groups = collections.OrderedDict()
+        allow_sharing = not ((msg.flag == CommBase.FLAG_EOF)
+                             or kwargs.get('after_prepare_message', None)
+                             or (isinstance(msg.args, bytes)
+                                 and (msg.args == constants.YGG_CLIENT_EOF)))
+        for i, x in enumerate(comm_list):
+            key = None
+            if allow_sharing:
+                key = get_broadcast_key(x)
+            if key is None:
+                key = ('unique', i)
+            groups.setdefault(key, [])
+            groups[key].append(i)
+        args = {}
+        for key, idx in groups.items():
+            rep = comm_list[idx[0]]
+            if len(idx) == 1:
+                args[idx[0]] = rep.prepare_message(copy.deepcopy(msg),
+                                                   **kwargs)
+                continue
+            # Only copy the contents if the processing could modify them
+            if rep.transform or rep.filter:
+                imsg = copy.deepcopy(msg)
+            else:
+                imsg = copy_message(msg)
+            # Process once and save the headers before serialization
+            # adds per-comm information (e.g. work comm addresses)
+            imsg = rep.prepare_message(imsg, skip_serialization=True,
+                                       **kwargs)
+            if imsg.flag == CommBase.FLAG_SKIP:
+                for i in idx:
+                    args[i] = copy_message(imsg)
+                continue
+            for x in [imsg] + imsg.additional_messages:
+                x.data = rep.serializer.serialize_data(x.args,
+                                                       metadata=x.header)
+            unserialized = copy_message(imsg)
+            args[idx[0]] = rep.prepare_message(imsg, skip_processing=True,
+                                               **kwargs)
+            shared = all(x.worker is None for x in
+                         [imsg] + imsg.additional_messages)
+            for i in idx[1:]:
+                if shared:
+                    args[i] = copy_message(imsg, share_serialized=True)
+                else:
+                    args[i] = comm_list[i].prepare_message(
+                        copy_message(unserialized), skip_processing=True,
+                        **kwargs)
+        return args
+
 
 def get_comm_name(name, i):
     r"""Get the name of the ith comm in the series.
@@ -73,14 +211,43 @@ class ForkComm(CommBase.CommBase):
                   (default for sending comms).
               'scatter': [SEND ONLY] Send part of message (must be a list)
                   to each comm.
+              'least_loaded': [SEND ONLY] Send to the comm with the fewest
+                  outstanding (sent, but not yet received or completed)
+                  messages.
+              'work_stealing': [SEND ONLY] Send to the first comm that is
+                  idle (has no outstanding messages), waiting up to
+                  steal_timeout for one to become idle before falling back
+                  to 'least_loaded'.
               'gather': [RECV ONLY] Receive lists of messages from each
                   comm where a message is only returned when there is a
                   message from each.
+        steal_timeout (float, optional): Time in seconds that the
+            'work_stealing' pattern should wait for a comm to become idle.
+            Defaults to the comm timeout.
+        recv_fairness (str, optional): Order in which comms with messages
+            waiting are received from by the 'cycle' pattern. Options
+            include:
+              'round_robin': Receive from the next ready comm after the
+                  comm that was last received from (default).
+              'first_ready': Receive from the comm that became ready first.
         **kwargs: Additional keyword arguments are passed to the parent class.
 
     Attributes:
         comm_list (list): Comms included in this fork.
         curr_comm_index (int): Index comm that next receive will be from.
+        comm_nsent (list): Number of messages sent to each comm.
+        comm_pending (list): Number of messages sent to each comm that have
+            not been marked as complete via complete_message. Only updated
+            if track_completion is True.
+        track_completion (bool): If True, messages sent via the load aware
+            patterns are considered outstanding until complete_message is
+            called for the comm they were sent to (e.g. when the response
+            to a request is returned).
+        recv_multiplexer (str): Method used to determine which comms have
+            messages waiting without polling each comm in turn. 'notify' if
+            the comms are asynchronous and notify the fork as messages are
+            added to their backlogs, 'poller' if the comms are ZMQ comms
+            that can be polled with a single call, and None otherwise.
 
     """
 
@@ -92,7 +259,8 @@ class ForkComm(CommBase.CommBase):
     noprop_keys = ['send_converter', 'recv_converter', 'filter', 'transform']
     
     def __init__(self, name, comm_list=None, is_async=False,
-                 pattern=None, **kwargs):
+                 pattern=None, steal_timeout=None,
+                 recv_fairness='round_robin', **kwargs):
         child_kwargs = {k: kwargs.pop(k) for k in self.child_keys if k in kwargs}
         noprop_kwargs = {k: kwargs.pop(k) for k in self.noprop_keys if k in kwargs}
         self.comm_list_backlog = {}
@@ -100,7 +268,19 @@ class ForkComm(CommBase.CommBase):
         self.curr_comm_index = 0
         self.eof_recv = []
         self.eof_send = []
+        self.comm_nsent = []
+        self.comm_pending = []
+        self.track_completion = False
+        self._selected_index = None
+        self.steal_timeout = steal_timeout
+        self.load_lock = multitasking.RLock()
+        self.recv_fairness = recv_fairness
+        self.recv_multiplexer = None
+        self.recv_ready = multitasking.Event()
+        self._recv_ready_queue = collections.deque()
+        self._recv_poller = None
         self.pattern = pattern
+        assert self.recv_fairness in ['round_robin', 'first_ready']
         if kwargs.get('direction', 'send') == 'recv':
             # if self.pattern is None:
             #     self.pattern = 'cycle'
@@ -108,7 +288,8 @@ class ForkComm(CommBase.CommBase):
         else:
             if self.pattern is None:
                 self.pattern = 'broadcast'
-            assert self.pattern in ['cycle', 'scatter', 'broadcast']
+            assert self.pattern in (['cycle', 'scatter', 'broadcast']
+                                    + _load_patterns)
         address = kwargs.pop('address', None)
         if comm_list is None:
             if isinstance(address, list):
@@ -141,14 +322,101 @@ class ForkComm(CommBase.CommBase):
             self.comm_list.append(get_comm(iname, **ikw))
             self.eof_recv.append(0)
             self.eof_send.append(0)
+            self.comm_nsent.append(0)
+            self.comm_pending.append(0)
             self.comm_list_backlog[i] = []
         if ncomm > 0:
             kwargs['address'] = [x.address for x in self.comm_list]
         kwargs.update(noprop_kwargs)
         super(ForkComm, self).__init__(name, is_async=is_async, **kwargs)
+        if self.steal_timeout is None:
+            self.steal_timeout = self.timeout
         assert not self.single_use
         assert not self.is_server
-        assert not (self.is_client and (self.pattern != 'cycle'))
+        assert not (self.is_client
+                    and (self.pattern not in ['cycle'] + _load_patterns))
+        if (self.direction == 'recv') and (self.pattern == 'cycle'):
+            self._init_recv_multiplexer()
+
+    def _init_recv_multiplexer(self):
+        r"""Set up notification of received messages by the forked comms
+        so that fan-in does not require polling each comm."""
+        if not self.comm_list:
+            return
+        if all(hasattr(x, 'backlog_ready') for x in self.comm_list):
+            self.recv_multiplexer = 'notify'
+            for i, x in enumerate(self.comm_list):
+                x.backlog_ready.add_callback(self.notify_ready, args=(i, ))
+                if x.backlog_ready.is_set():
+                    self.notify_ready(i)
+        elif all(x._commtype == 'zmq' for x in self.comm_list):
+            from yggdrasil.communication.ZMQComm import ZMQPoller
+            self.recv_multiplexer = 'poller'
+            self._recv_poller = ZMQPoller(self.comm_list)
+
+    def notify_ready(self, idx):
+        r"""Record that a forked comm has a message waiting.
+
+        Args:
+            idx (int): Index of the comm in the fork bundle.
+
+        """
+        with self.load_lock:
+            if idx not in self._recv_ready_queue:
+                self._recv_ready_queue.append(idx)
+            self.recv_ready.set()
+
+    def ready_comm_indices(self, timeout=0):
+        r"""Determine which forked comms have messages waiting, waiting
+        for one to become ready if there are none.
+
+        Args:
+            timeout (float, optional): Time in seconds that should be
+                waited for a comm to become ready. Defaults to 0.
+
+        Returns:
+            list: Indices of comms with messages waiting in the order that
+                they should be received from based on recv_fairness.
+
+        """
+        if self.recv_multiplexer == 'notify':
+            if (not self.recv_ready.is_set()) and (timeout > 0):
+                self.recv_ready.wait(timeout)
+            with self.load_lock:
+                out = list(self._recv_ready_queue)
+        elif self.recv_multiplexer == 'poller':
+            out = self._recv_poller.poll(timeout)
+        else:  # pragma: debug
+            out = list(range(len(self)))
+        if self.recv_fairness == 'round_robin':
+            out.sort(key=lambda i: (i - self.curr_comm_index) % len(self))
+        return out
+
+    def _clear_ready(self, idx):
+        r"""Remove a comm from the ready queue after receiving from it,
+        adding it back to the end of the queue if it has more messages.
+
+        Args:
+            idx (int): Index of the comm in the fork bundle.
+
+        """
+        if self.recv_multiplexer != 'notify':
+            return
+        x = self.comm_list[idx]
+        # The backlog size must be read without holding load_lock as the
+        # backlog lock is held while notify_ready is called
+        has_more = (x.n_msg_backlog_recv > 0)
+        with self.load_lock:
+            if idx in self._recv_ready_queue:
+                self._recv_ready_queue.remove(idx)
+            if has_more:
+                self._recv_ready_queue.append(idx)
+            if not self._recv_ready_queue:
+                self.recv_ready.clear()
+        # Re-add the comm if a message arrived after the check above and
+        # its notification was removed
+        if (not has_more) and (x.n_msg_backlog_recv > 0):
+            self.notify_ready(idx)
 
     def disconnect(self):
         r"""Disconnect attributes that are aliases."""
@@ -170,6 +438,13 @@ class ForkComm(CommBase.CommBase):
         """
         nindent = kwargs.get('nindent', 0)
         extra_lines_after = ['%-15s: %s' % ('pattern', self.pattern)]
+        if (self.direction == 'send') and (self.pattern in _load_patterns):
+            nsent_tot = max(sum(self.comm_nsent), 1)
+            for i, x in enumerate(self.comm_list):
+                extra_lines_after.append(
+                    '%-15s: %d sent, %d outstanding (%5.1f%%)' % (
+                        x.name, self.comm_nsent[i], self.comm_load(i),
+                        100.0 * self.comm_nsent[i] / nsent_tot))
         for x in self.comm_list:
             extra_lines_after += x.get_status_message(nindent=nindent + 1)[0]
         extra_lines_after += kwargs.get('extra_lines_after', [])
@@ -197,6 +472,63 @@ class ForkComm(CommBase.CommBase):
         r"""CommBase: Current comm."""
         return self.comm_list[self.curr_comm_index % len(self)]
 
+    def comm_load(self, idx):
+        r"""Determine the number of messages outstanding for a comm.
+
+        Args:
+            idx (int): Index of the comm in the fork bundle.
+
+        Returns:
+            int: Number of messages sent to the comm that have not been
+                received (or completed if track_completion is True).
+
+        """
+        return (self.comm_list[idx].n_msg_outstanding
+                + self.comm_pending[idx])
+
+    def complete_message(self, idx):
+        r"""Mark a message sent to a comm as complete so that it is no
+        longer counted towards the comm's load.
+
+        Args:
+            idx (int): Index of the comm in the fork bundle.
+
+        """
+        with self.load_lock:
+            if self.comm_pending[idx] > 0:
+                self.comm_pending[idx] -= 1
+
+    def select_comm_index(self):
+        r"""Select the comm that the next message will be sent to based on
+        the pattern. The selection is retained until the next message is
+        sent so that it can be used to determine the response comm before
+        sending.
+
+        Returns:
+            int: Index of the comm that the next message will be sent to.
+
+        """
+        with self.load_lock:
+            if self._selected_index is not None:
+                return self._selected_index
+            if self.pattern not in _load_patterns:
+                return self.curr_comm_index % len(self)
+        if self.pattern == 'work_stealing':
+            T = self.start_timeout(self.steal_timeout,
+                                   key_suffix='send:steal')
+            while ((not T.is_out) and self.is_open
+                   and all(self.comm_load(i) for i in range(len(self)))):
+                self.sleep()
+            self.stop_timeout(key_suffix='send:steal')
+        with self.load_lock:
+            # Ties are broken in round robin order starting with the
+            # comm after the one last sent to
+            order = [(self.curr_comm_index + i) % len(self)
+                     for i in range(len(self))]
+            self._selected_index = min(order, key=self.comm_load)
+            self.curr_comm_index = self._selected_index
+            return self._selected_index
+
     @property
     def maxMsgSize(self):
         r"""int: Maximum size of a single message that should be sent."""
@@ -281,13 +613,15 @@ class ForkComm(CommBase.CommBase):
         for pair in _pattern_pairs:
             if self.pattern in pair:
                 kwargs['pattern'] = pair[(pair.index(self.pattern) + 1) % 2]
+        if self.pattern in _load_patterns:
+            kwargs['pattern'] = 'cycle'
         return kwargs
 
     @property
     def get_response_comm_kwargs(self):
         r"""dict: Keyword arguments to use for a response comm."""
-        assert self.pattern == 'cycle'
-        return self.curr_comm.get_response_comm_kwargs
+        assert self.pattern in ['cycle'] + _load_patterns
+        return self.comm_list[self.select_comm_index()].get_response_comm_kwargs
         
     def bind(self):
         r"""Bind in place of open."""
@@ -456,6 +790,10 @@ class ForkComm(CommBase.CommBase):
         
         """
         assert isinstance(msg.args, dict)
+        is_load = ((self.pattern in _load_patterns)
+                   and (msg.flag != CommBase.FLAG_EOF))
+        if is_load:
+            self.select_comm_index()
         for idx in range(len(self)):
             i = self.curr_comm_index % len(self)
             x = self.curr_comm
@@ -465,7 +803,15 @@ class ForkComm(CommBase.CommBase):
                 self.eof_send[i] = 1
             self.curr_comm_index += 1
             if not out:
+                self._selected_index = None
                 return out
+            elif is_load:
+                with self.load_lock:
+                    self._selected_index = None
+                    self.comm_nsent[i] += 1
+                    if self.track_completion:
+                        self.comm_pending[i] += 1
+                break
             elif (self.pattern == 'cycle') and (msg.flag != CommBase.FLAG_EOF):
                 break
         msg.args = msg.orig
@@ -502,30 +848,46 @@ class ForkComm(CommBase.CommBase):
             def complete():
                 return bool(out_gather)
         
+        def recv_from(idx):
+            x = self.comm_list[idx]
+            if idx in out_gather:
+                return
+            if self.comm_list_backlog[idx]:
+                out_gather[idx] = self.comm_list_backlog[idx].pop(0)
+            elif x.is_open:
+                msg = x.recv_message(*args, **kwargs)
+                self.errors += x.errors
+                if msg.flag == CommBase.FLAG_EOF:
+                    self.eof_recv[idx] = 1
+                    if self.pattern == 'gather':
+                        assert all((v.flag == CommBase.FLAG_EOF)
+                                   for v in out_gather.values())
+                        out_gather[idx] = msg
+                    elif sum(self.eof_recv) == len(self):
+                        out_gather[idx] = msg
+                    else:
+                        x.finalize_message(msg)
+                elif msg.flag == CommBase.FLAG_SUCCESS:
+                    out_gather[idx] = msg
+
+        use_mux = ((self.recv_multiplexer is not None)
+                   and (not any(self.comm_list_backlog.values())))
         while ((not T.is_out) or first_comm) and self.is_open and (not complete()):
+            if use_mux:
+                # Only receive from comms that are known to have messages
+                wait = 0 if first_comm else self.sleeptime
+                for idx in self.ready_comm_indices(timeout=wait):
+                    recv_from(idx)
+                    self._clear_ready(idx)
+                    if complete():
+                        self.curr_comm_index = idx + 1
+                        break
+                first_comm = False
+                continue
             for i in range(len(self)):
                 if complete():
                     break
-                idx = self.curr_comm_index % len(self)
-                x = self.curr_comm
-                if idx not in out_gather:
-                    if self.comm_list_backlog[idx]:
-                        out_gather[idx] = self.comm_list_backlog[idx].pop(0)
-                    elif x.is_open:
-                        msg = x.recv_message(*args, **kwargs)
-                        self.errors += x.errors
-                        if msg.flag == CommBase.FLAG_EOF:
-                            self.eof_recv[idx] = 1
-                            if self.pattern == 'gather':
-                                assert all((v.flag == CommBase.FLAG_EOF)
-                                           for v in out_gather.values())
-                                out_gather[idx] = msg
-                            elif sum(self.eof_recv) == len(self):
-                                out_gather[idx] = msg
-                            else:
-                                x.finalize_message(msg)
-                        elif msg.flag == CommBase.FLAG_SUCCESS:
-                            out_gather[idx] = msg
+                recv_from(self.curr_comm_index % len(self))
                 self.curr_comm_index += 1
             first_comm = False
             if not complete():
@@ -1,4 +1,5 @@
 import logging
+import collections
 import numpy as np
 from yggdrasil.multitasking import _on_mpi, MPI, RLock, MPIRequestWrapper
 from yggdrasil.communication import (
@@ -11,71 +12,123 @@ class MPIClosedError(BaseException):
 
 
 class MPIRequest(object):
-    r"""Container for MPI request."""
+    r"""Container for MPI request. Each message is transfered as a single
+    MPI message. Sends are posted immediately from the payload's buffer and
+    receives are matched with Improbe before being received (via Mrecv)
+    into a buffer allocated to the probed size.
 
-    __slots__ = ['comm', 'address', 'direction', 'tag', 'size_req',
-                 'req', 'size', '_data']
+    Args:
+        comm (MPI.Comm): MPI communicator.
+        direction (str): Direction of the request ('send' or 'recv').
+        address (int, list): Rank(s) of the partner process(es).
+        tag (int, dict): MPI tag(s) for the message.
+        dtype (np.dtype, optional): Data type of the array that a receive
+            request should be received into as a typed MPI buffer. Defaults
+            to None and the message is received as bytes into a bytearray.
+        **kwargs: Additional keyword arguments are passed to make_request.
+
+    """
 
-    def __init__(self, comm, direction, address, tag, **kwargs):
+    __slots__ = ['comm', 'address', 'direction', 'tag', 'req',
+                 'status', 'canceled', 'dtype', '_data']
+
+    def __init__(self, comm, direction, address, tag, dtype=None, **kwargs):
         self.comm = comm
         self.address = address
         self.direction = direction
         self.tag = tag
-        self.size = np.zeros(1, dtype='i')
+        self.status = None
+        self.canceled = False
+        self.dtype = None
         self._data = None
-        self.size_req = None
         self.req = self.make_request(**kwargs)
+        if dtype is not None:
+            self.set_dtype(dtype)
 
     @property
     def data(self):
         r"""object: Data returned by a request."""
-        if (self.direction == 'recv') and isinstance(self._data, np.ndarray):
-            self._data = self._data.tobytes()
         return self._data
 
+    @classmethod
+    def as_buffer(cls, payload):
+        r"""Get an MPI buffer specification for a payload without copying
+        it (unless it is a non-contiguous array).
+
+        Args:
+            payload (bytes, bytearray, np.ndarray): Serialized message or
+                array that should be sent as a typed MPI buffer.
+
+        Returns:
+            list: Buffer and MPI datatype.
+
+        """
+        if isinstance(payload, np.ndarray):
+            payload = np.ascontiguousarray(payload)
+            return [payload, MPI._typedict[payload.dtype.char]]
+        return [payload, MPI.BYTE]
+
+    def set_dtype(self, dtype):
+        r"""Set the data type of the array that a message should be
+        received into. This has no effect if the message has already been
+        received.
+
+        Args:
+            dtype (np.dtype): Array data type.
+
+        """
+        self.dtype = np.dtype(dtype)
+
     def make_request(self, payload=None):
         r"""Complete a request."""
-        kwargs = dict(tag=self.tag)
         if self.direction == 'send':
-            method = 'Isend'
-            args = ([payload, MPI.CHAR], )
-            kwargs['dest'] = self.address
-            # Send size of message
-            self.size[0] = len(payload)
-            self.size_req = MPIRequestWrapper(
-                self.comm.Isend([self.size, MPI.INT], **kwargs))
-            out = MPIRequestWrapper(
-                self.comm.Isend(*args, **kwargs))
+            self._data = payload
+            kwargs = dict(dest=self.address, tag=self.tag)
+            logger.debug("rank = %d, method = Isend, kwargs = %.100s",
+                         self.comm.Get_rank(), kwargs)
+            return MPIRequestWrapper(
+                self.comm.Isend(self.as_buffer(payload), **kwargs))
+        self.status = MPI.Status()
+        return None
+
+    def probe(self):
+        r"""Check for a matching incoming message and receive it if there is
+        one.
+
+        Returns:
+            bool: True if a message was received.
+
+        """
+        message = self.comm.Improbe(source=self.address, tag=self.tag,
+                                    status=self.status)
+        if message is None:
+            return False
+        if self.dtype is None:
+            # Serializers accept the bytearray so it is not copied
+            buf = bytearray(self.status.Get_count(MPI.BYTE))
+            message.Recv([buf, MPI.BYTE])
         else:
-            method = 'Irecv'
-            args = ([self.size, MPI.INT], )
-            kwargs['source'] = self.address
-            self.size_req = MPIRequestWrapper(
-                self.comm.Irecv(*args, **kwargs))
-            out = None
-        logger.debug("rank = %d, method = %s, args = %.100s, kwargs = %.100s",
-                     self.comm.Get_rank(), method, args, kwargs)
-        return out
+            mpi_type = MPI._typedict[self.dtype.char]
+            buf = np.empty(self.status.Get_count(mpi_type), dtype=self.dtype)
+            message.Recv([buf, mpi_type])
+        self._data = buf
+        return True
 
     @property
     def complete(self):
         r"""bool: True if the request has been completed, False otherwise."""
         if self.direction == 'recv':
-            if self.size_req.test()[0] and (self.req is None):
-                self._data = np.zeros(self.size[0], dtype='c')
-                self.req = MPIRequestWrapper(
-                    self.comm.Irecv([self._data, MPI.CHAR],
-                                    source=self.address,
-                                    tag=self.tag))
-        return (((self.req is not None)
-                 and (self.req.test()[0] or self.req.canceled))
-                or self.size_req.canceled)
+            if (self._data is None) and (not self.canceled):
+                self.probe()
+            return (self._data is not None)
+        return (self.req.test()[0] or self.req.canceled)
 
     def cancel(self):
         r"""Cancel a request."""
-        self.size_req.cancel()
-        if self.req is not None:  # pragma: intermittent
+        if self.req is not None:
             self.req.cancel()
+        elif self._data is None:
+            self.canceled = True
 
 
 class MPIMultiRequest(MPIRequest):
@@ -111,6 +164,19 @@ class MPIMultiRequest(MPIRequest):
                     break
         return bool(self.remainder)
 
+    def set_dtype(self, dtype):
+        r"""Set the data type of the array that a message should be
+        received into. This has no effect if the message has already been
+        received.
+
+        Args:
+            dtype (np.dtype): Array data type.
+
+        """
+        super(MPIMultiRequest, self).set_dtype(dtype)
+        for v in self.req.values():
+            v.set_dtype(dtype)
+
     def cancel(self):
         r"""Cancel a request."""
         for k, v in self.req.items():
@@ -153,7 +219,7 @@ class MPIComm(CommBase.CommBase):
                                                          'address']
             ranks = kwargs['partner_mpi_ranks']
         self._request_lock = RLock(task_method='thread')
-        self.requests = []
+        self.requests = collections.deque()
         self.unused_tags = {}
         self.tags = {}
         self.ranks = ranks
@@ -347,7 +413,7 @@ class MPIComm(CommBase.CommBase):
                     self.cache_tag(x)
                     x.cancel()
             # Cancel uncompleted partial request for multi-receive?
-            self.requests = complete_requests
+            self.requests = collections.deque(complete_requests)
 
     @property
     def is_open(self):
@@ -436,7 +502,6 @@ class MPIComm(CommBase.CommBase):
 
         """
         out = super(MPIComm, self).recv_message(*args, **kwargs)
-        self.sleep()
         if out.flag == CommBase.FLAG_EOF:
             self.eof_recv[self.last_request.address] = 1
             if not all(self.eof_recv.values()):
@@ -447,7 +512,8 @@ class MPIComm(CommBase.CommBase):
         r"""Send a message.
 
         Args:
-            payload (str): Message to send.
+            payload (bytes, np.ndarray): Message to send. Arrays are sent
+                directly from their buffer as typed MPI buffers.
 
         Returns:
             bool: Success or failure of sending the message.
@@ -456,9 +522,14 @@ class MPIComm(CommBase.CommBase):
         self.add_request(payload=payload)
         return True
         
-    def _recv(self):
+    def _recv(self, dtype=None):
         r"""Receive a message from the MPI communicator.
 
+        Args:
+            dtype (np.dtype, optional): Data type of the array that the
+                message should be received into as a typed MPI buffer.
+                Defaults to None and the message is received as bytes.
+
         Returns:
             tuple (bool, str): The success or failure of receiving a message
                 and the message received.
@@ -466,10 +537,46 @@ class MPIComm(CommBase.CommBase):
         """
         with self._request_lock:
             self.add_request(on_empty=True)
+            if dtype is not None:
+                self.requests[0].set_dtype(dtype)
             if not self.requests[0].complete:
                 raise NoMessages("No messages in communicator.")
-            self.last_request = self.requests.pop(0)
-            return (True, self.last_request.data)
+            self.last_request = self.requests.popleft()
+            out = self.last_request.data
+            if (dtype is not None) and (not isinstance(out, np.ndarray)):
+                # Message was probed as bytes before the type was known
+                out = np.frombuffer(out, dtype=dtype)
+            return (True, out)
+
+    def send_array(self, arr, **kwargs):
+        r"""Send an array as a single typed MPI buffer without serializing
+        it. The array must be received via recv_array with the same data
+        type.
+
+        Args:
+            arr (np.ndarray): Array to send. Contiguous arrays are sent
+                without copying.
+            **kwargs: Additional keyword arguments are passed to _safe_send.
+
+        Returns:
+            bool: Success or failure of sending the array.
+
+        """
+        return self._safe_send(np.asarray(arr), **kwargs)
+
+    def recv_array(self, dtype, **kwargs):
+        r"""Receive an array sent via send_array as a typed MPI buffer.
+
+        Args:
+            dtype (np.dtype): Data type of the array.
+            **kwargs: Additional keyword arguments are passed to _safe_recv.
+
+        Returns:
+            tuple (bool, np.ndarray): The success or failure of receiving
+                the array and the flattened array received.
+
+        """
+        return self._safe_recv(dtype=dtype, **kwargs)
 
     def purge(self):
         r"""Purge all messages from the comm."""
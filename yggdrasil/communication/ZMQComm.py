@@ -1,11 +1,14 @@
 import os
 import tempfile
+import collections
 import uuid
 import logging
 from yggdrasil import tools
 from yggdrasil import multitasking
+from yggdrasil import platform
 from yggdrasil.communication import (
     CommBase, TemporaryCommunicationError, NoMessages)
+from yggdrasil.communication.CommBase import uses_python_interface
 logger = logging.getLogger(__name__)
 try:
     import zmq
@@ -25,12 +28,18 @@ _socket_type_pairs = [('PUSH', 'PULL'),
 _socket_send_types = [t[0] for t in _socket_type_pairs]
 _socket_recv_types = [t[1] for t in _socket_type_pairs]
 _socket_protocols = ['tcp', 'inproc', 'ipc', 'udp', 'pgm', 'epgm']
+# Protocols used for partners at different locations (see
+# CommBase.partner_location)
+_location_protocols = {'process': 'inproc', 'host': 'ipc', 'remote': 'tcp'}
 _flag_zmq_filter = b'_ZMQFILTER_'
 _default_socket_type = 4
 _default_protocol = 'tcp'
 _wait_send_t = 0  # 0.0001
 _reply_msg = b'YGG_REPLY'
 _purge_msg = b'YGG_PURGE'
+_proxy_batch_size = 1000
+_default_ack_window = 16
+_reply_frame_sep = b'|'
 
 
 def set_context_opts(context):
@@ -197,7 +206,57 @@ def bind_socket(socket, address, retry_timeout=-1, nretry=1):
                                   retry_timeout=retry_timeout)
     return address
 
-    
+
+class ZMQPoller(object):
+    r"""Poll the sockets of several receiving ZMQ comms with a single call
+    so that the comms with messages waiting can be identified without
+    polling each one in turn.
+
+    Args:
+        comms (list): ZMQ comms that should be polled.
+
+    """
+
+    def __init__(self, comms):
+        self.comms = comms
+        self.poller = None
+        self.sockets = []
+
+    def update(self):
+        r"""Register the sockets of open comms with a new poller if any of
+        the comms have been closed or had their sockets replaced (e.g. on
+        reset)."""
+        sockets = [(i, x.socket) for i, x in enumerate(self.comms)
+                   if x.is_open]
+        if ((self.poller is None) or (len(sockets) != len(self.sockets))
+                or any((i1 != i2) or (s1 is not s2) for (i1, s1), (i2, s2)
+                       in zip(sockets, self.sockets))):
+            self.poller = zmq.Poller()
+            for _, s in sockets:
+                self.poller.register(s, zmq.POLLIN)
+            self.sockets = sockets
+
+    def poll(self, timeout=0):
+        r"""Wait for one or more of the comms to have a message waiting.
+
+        Args:
+            timeout (float, optional): Time in seconds to wait for a
+                message. Defaults to 0.
+
+        Returns:
+            list: Indices of comms that have a message waiting.
+
+        """
+        self.update()
+        if not self.sockets:
+            return []
+        try:
+            events = dict(self.poller.poll(int(1000 * timeout)))
+        except zmq.ZMQError:  # pragma: debug
+            return []
+        return [i for i, s in self.sockets if events.get(s, 0) & zmq.POLLIN]
+
+
 class ZMQProxy(CommBase.CommServer):
     r"""Start a proxy in a new thread for a server address. A client-side
     address will be randomly generated.
@@ -264,54 +323,69 @@ class ZMQProxy(CommBase.CommServer):
             raise
         ZMQComm.register_comm('DEALER_server_' + self.srv_address,
                               self.srv_socket)
-        # Set up poller
-        # self.poller = zmq.Poller()
-        # self.poller.register(frontend, zmq.POLLIN)
         self.reply_socket = None
         # Set name
-        self.backlog = []
+        self.backlog = collections.deque()
         self.server_active = False
         super(ZMQProxy, self).__init__(self.srv_address, self.cli_address, **kwargs)
         self._name = 'ZMQProxy.%s.to.%s' % (cli_address, srv_address)
 
     def client_recv(self):
-        r"""Receive single message from the client."""
+        r"""Receive all of the messages from the clients that are ready.
+        Messages received before a server has signed on are held in the
+        backlog until one does.
+
+        Returns:
+            list: Messages (identity, message pairs) that should be forwarded
+                to the server in the order they were received.
+
+        """
         with self.lock:
             if self.was_break:  # pragma: debug
-                return None
-            if self.backlog and self.server_active:
-                return self.backlog.pop(0)
-            msg = self.cli_socket.recv_multipart()
-            if msg[1].startswith(self.server_signon_msg):
-                self.debug(f"A server has signed on after {self.nsignon} "
-                           f"attempts, activating proxy.")
-                self.server_active = True
-                self.server_send(self.client_signon_msg
-                                 + str(self.nsignon).encode('utf-8'))
-                return None
-            # if msg[1].startswith(self.server_signoff_msg):
-            #     self.sleep(1.0)
-            #     return None
-            if not self.server_active:
-                self.debug("Backlogging message")
+                return []
+            for _ in range(_proxy_batch_size):
+                try:
+                    msg = self.cli_socket.recv_multipart(zmq.NOBLOCK)
+                except zmq.ZMQError as e:
+                    if e.errno == zmq.EAGAIN:
+                        break
+                    raise  # pragma: debug
+                if msg[1].startswith(self.server_signon_msg):
+                    self.debug(f"A server has signed on after {self.nsignon} "
+                               f"attempts, activating proxy.")
+                    self.server_active = True
+                    self.server_send(self.client_signon_msg
+                                     + str(self.nsignon).encode('utf-8'))
+                    continue
+                # if msg[1].startswith(self.server_signoff_msg):
+                #     self.sleep(1.0)
+                #     continue
                 self.backlog.append(msg)
-                return None
-            return msg
+            if not self.server_active:
+                if self.backlog:
+                    self.debug("Backlogging messages (%d total)",
+                               len(self.backlog))
+                return []
+            out = list(self.backlog)
+            self.backlog.clear()
+            return out
 
     def server_send(self, msg):
-        r"""Send single message to the server."""
+        r"""Send single message (or list of message frames) to the
+        server."""
         if msg is None:  # pragma: debug
             return
+        if not isinstance(msg, list):
+            msg = [msg]
         while not self.was_break:
             try:
-                self.srv_socket.send(msg, zmq.NOBLOCK)
+                self.srv_socket.send_multipart(msg, zmq.NOBLOCK)
                 break
             except zmq.ZMQError:  # pragma: no cover
-                self.sleep(0.0001)
+                self.srv_socket.poll(timeout=1, flags=zmq.POLLOUT)
 
     def poll(self):
-        # socks = dict(self.poller.poll())
-        # return (socks.get(self.cli_socket) == zmq.POLLIN)
+        r"""Check for messages that are ready to be forwarded."""
         with self.lock:
             if self.was_break:  # pragma: debug
                 return False
@@ -326,13 +400,13 @@ class ZMQProxy(CommBase.CommServer):
         return (out == zmq.POLLIN)
 
     def run_loop(self):
-        r"""Forward messages from client to server."""
+        r"""Forward all ready messages from clients to server."""
         if self.poll():
-            message = self.client_recv()
-            if message is not None:
-                self.debug('Forwarding message of size %d from %s',
-                           len(message[1]), message[0])
-                self.server_send(message[1])
+            messages = self.client_recv()
+            if messages:
+                self.debug('Forwarding %d messages', len(messages))
+            for message in messages:
+                self.server_send(message[1:])
         if (not self.server_active):
             self.nsignon += 1
             msg = self.server_signon_msg + self.cli_address.encode('utf-8')
@@ -432,7 +506,8 @@ class ZMQComm(CommBase.CommBase):
     def _init_before_open(self, context=None, socket_type=None,
                           socket_action=None, topic_filter='',
                           dealer_identity=None, new_process=False,
-                          reply_socket_address=None, **kwargs):
+                          reply_socket_address=None, ack_window=None,
+                          reply_frame=None, **kwargs):
         r"""Initialize defaults for socket type/action based on direction."""
         self.reply_socket_lock = multitasking.RLock()
         self.socket_lock = multitasking.RLock()
@@ -516,6 +591,16 @@ class ZMQComm(CommBase.CommBase):
         self._n_zmq_recv = {}
         self._n_reply_sent = 0
         self._n_reply_recv = {}
+        if ack_window is None:
+            ack_window = _default_ack_window
+        self.ack_window = max(int(ack_window), 1)
+        self._ack_identity = str(uuid.uuid4())
+        self._ack_window_recv = {}
+        self._ack_peers = {}
+        if reply_frame is None:
+            reply_frame = uses_python_interface(self.partner_language_driver)
+        self.reply_frame = reply_frame
+        self._recv_parsed_header = None
         self._server_class = ZMQProxy
         self._server_kwargs = dict(zmq_context=self.context,
                                    nretry=4, retry_timeout=2.0 * self.sleeptime)
@@ -541,6 +626,13 @@ class ZMQComm(CommBase.CommBase):
         state['_server_kwargs']['zmq_context'] = state['context']
         super(ZMQComm, self).__setstate__(state)
         self.socket = create_socket(self.context, self.socket_type)
+        # Cumulative acknowledgements restart under a new identity so
+        # that senders don't count messages twice, only carrying over the
+        # messages that have not been acknowledged yet
+        self._ack_identity = str(uuid.uuid4())
+        for k in self._n_zmq_recv.keys():
+            self._n_zmq_recv[k] -= self._n_reply_recv.get(k, 0)
+            self._n_reply_recv[k] = 0
         if self._bound:
             self._bound = False
             self.bind()
@@ -561,12 +653,18 @@ class ZMQComm(CommBase.CommBase):
         """
         lines, prefix = super(ZMQComm, self).get_status_message(
             nindent=nindent, **kwargs)
-        lines += ['%s%-15s: %s' % (prefix, 'nsent (zmq)', self._n_zmq_sent),
-                  '%s%-15s: %s' % (prefix, 'nsent reply (zmq)', self._n_reply_sent)]
+        lines += ['%s%-15s: %s' % (prefix, 'protocol', self.protocol),
+                  '%s%-15s: %s' % (prefix, 'partner location',
+                                   self.partner_location),
+                  '%s%-15s: %s' % (prefix, 'nsent (zmq)', self._n_zmq_sent),
+                  '%s%-15s: %s' % (prefix, 'nsent reply (zmq)', self._n_reply_sent),
+                  '%s%-15s: %s' % (prefix, 'ack window', self.ack_window)]
         for k in self._n_zmq_recv.keys():
             lines += ['%s%-15s: %s' % (prefix, 'nrecv (%s)' % k, self._n_zmq_recv[k]),
                       '%s%-15s: %s' % (prefix, 'nrecv reply (%s)' % k,
-                                       self._n_reply_recv[k])]
+                                       self._n_reply_recv[k]),
+                      '%s%-15s: %s' % (prefix, 'ack window (%s)' % k,
+                                       self._ack_window_recv.get(k, 1))]
         return lines, prefix
 
     @property
@@ -624,18 +722,25 @@ class ZMQComm(CommBase.CommBase):
 
     @classmethod
     def new_comm_kwargs(cls, name, protocol=None, host=None, port=None,
-                        **kwargs):
+                        partner_location=None, **kwargs):
         r"""Initialize communication with new queue.
 
         Args:
             name (str): Name of new socket.
             protocol (str, optional): The protocol that should be used.
-                Defaults to None and is set to _default_protocol. See zmq for
-                details.
+                Defaults to None and is set to the YGG_ZMQ_PROTOCOL
+                environment variable if set, otherwise the protocol is
+                selected based on partner_location. See zmq for details.
             host (str, optional): The host that should be used. Invalid for
                 'inproc' protocol. Defaults to 'localhost'.
             port (int, optional): The port used. Invalid for 'inproc' protocol.
                 Defaults to None and a random port is choosen.
+            partner_location (str, optional): Location of the partner comm
+                ('process', 'host', or 'remote') that is used to select
+                the fastest protocol that can reach it: 'inproc' within
+                the same process, 'ipc' on the same host (where
+                supported), and 'tcp' otherwise. Defaults to None and
+                _default_protocol is used.
             **kwargs: Additional keywords arguments are returned as keyword
                 arguments for the new comm.
 
@@ -645,7 +750,13 @@ class ZMQComm(CommBase.CommBase):
         """
         args = [name]
         if protocol is None:
-            protocol = _default_protocol
+            protocol = os.environ.get('YGG_ZMQ_PROTOCOL', None)
+        if protocol is None:
+            protocol = _location_protocols.get(partner_location,
+                                               _default_protocol)
+            if (protocol == 'ipc') and platform._is_win:  # pragma: windows
+                protocol = _default_protocol
+        kwargs['partner_location'] = partner_location
         if host is None:
             if protocol in ['inproc', 'ipc']:
                 host = get_ipc_host()
@@ -828,39 +939,136 @@ class ZMQComm(CommBase.CommBase):
         return address
 
     def check_reply_socket_send(self, msg):
-        r"""Append reply socket address if it
+        r"""Prepend a frame containing the reply socket address if the
+        partner comm uses the Python interface. Otherwise the reply address
+        is sent in the message header.
 
         Args:
-            msg (str): Message that will be piggy backed on.
+            msg (bytes): Message that will be sent.
 
         Returns:
-            str: Message with reply address if it has not been sent.
-
+            list: Message frames that should be sent.
 
         """
-        return msg
-        
-    def check_reply_socket_recv(self, msg):
+        if not self.reply_frame:
+            return [msg]
+        frame = tools.str2bytes(self.set_reply_socket_send())
+        if self.ack_window > 1:
+            frame += _reply_frame_sep + str(self.ack_window).encode('utf-8')
+        return [frame, msg]
+
+    def check_reply_socket_recv(self, msg, frame=None):
         r"""Check incoming message for reply address.
 
         Args:
-            msg (str): Incoming message to check.
+            msg (bytes): Incoming message to check.
+            frame (bytes, optional): Frame containing the reply address
+                that was received with the message. Defaults to None and
+                the reply address is read from the message header. The parsed
+                header is retained so that it is not parsed again during
+                deserialization.
 
         Returns:
-            str: Messages with reply address removed if present.
+            tuple(bytes, str): Message and the reply address.
 
         """
         assert self.direction != 'send'
         # if self.direction == 'send':
         #     return msg, None
-        header = self.serializer.parse_header(msg.split(_flag_zmq_filter)[-1])
-        address = header['__meta__'].get('zmq_reply', None)
+        window = None
+        if frame is not None:
+            address, _, window = frame.partition(_reply_frame_sep)
+            address = tools.bytes2str(address)
+            window = int(window) if window else None
+        else:
+            header = self.serializer.parse_header(msg)
+            self._recv_parsed_header = (msg, header)
+            address = header['__meta__'].get('zmq_reply', None)
+            window = header['__meta__'].get('zmq_ack_window', None)
         if (address is None):
             address = self.reply_socket_address
         if address is not None:
-            self.set_reply_socket_recv(address)
+            address = self.set_reply_socket_recv(address)
+            if window is not None:
+                self._ack_window_recv[address] = window
         return msg, address
 
+    def deserialize(self, msg, **kwargs):
+        r"""Deserialize a message, reusing the header if it was already
+        parsed when the message was received.
+
+        Args:
+            msg (bytes): Message to be deserialized.
+            **kwargs: Additional keyword arguments are passed to the
+                parent class's method.
+
+        Returns:
+            tuple(obj, dict): Deserialized message and header information.
+
+        """
+        parsed = self._recv_parsed_header
+        if (parsed is not None) and (parsed[0] is msg):
+            self._recv_parsed_header = None
+            kwargs.setdefault('header', parsed[1])
+        return super(ZMQComm, self).deserialize(msg, **kwargs)
+
+    def ack_message(self, key):
+        r"""Create the message acknowledging receipt of all messages
+        received from a reply address so far.
+
+        Args:
+            key (str): Reply address that messages were received from.
+
+        Returns:
+            bytes: Acknowledgement message. Senders that do not advertise
+                an acknowledgement window (e.g. the C interface) are
+                sent the bare reply message once per message.
+
+        """
+        if self._ack_window_recv.get(key, 1) == 1:
+            return _reply_msg
+        return b':'.join([_reply_msg, tools.str2bytes(self._ack_identity),
+                          tools.str2bytes(str(self._n_zmq_recv[key]))])
+
+    def parse_ack_message(self, msg):
+        r"""Determine how many sent messages an acknowledgement covers.
+
+        Args:
+            msg (bytes): Acknowledgement message received on the reply
+                socket.
+
+        Returns:
+            int: Number of newly acknowledged messages.
+
+        """
+        parts = msg.split(b':')
+        if (len(parts) != 3) or (parts[0] != _reply_msg):
+            return 1
+        identity = parts[1]
+        count = int(parts[2])
+        out = count - self._ack_peers.get(identity, 0)
+        self._ack_peers[identity] = count
+        return out
+
+    def is_ack_due(self, key):
+        r"""Determine if received messages should be acknowledged.
+        Messages are acknowledged cumulatively once the sender's window
+        fills or there are no more messages waiting to be received.
+
+        Args:
+            key (str): Reply address that messages were received from.
+
+        Returns:
+            bool: True if an acknowledgement should be sent.
+
+        """
+        nack = self._n_zmq_recv[key] - self._n_reply_recv[key]
+        if nack <= 0:
+            return False
+        if nack >= self._ack_window_recv.get(key, 1):
+            return True
+        return (self.n_msg_recv == 0)
+
     def _catch_eagain(self, function, *args, **kwargs):
         tries = 10
         error = BaseException('_catch_eagain')
@@ -898,7 +1106,7 @@ class ZMQComm(CommBase.CommBase):
             return msg
         self._catch_eagain(self.reply_socket_send.send,
                            msg, flags=zmq.NOBLOCK)
-        self._n_reply_sent += 1
+        self._n_reply_sent += self.parse_ack_message(msg)
         self.reply_socket_send.poll(timeout=self.zmq_sleeptime,
                                     flags=zmq.POLLIN)
         return msg
@@ -939,7 +1147,10 @@ class ZMQComm(CommBase.CommBase):
                 "_reply_handshake_recv (in recv) => ZMQ Error(%s): %s"
                 % (key, e))
         assert msg_recv == msg_send
-        self._n_reply_recv[key] += 1
+        if msg_send == _reply_msg:
+            self._n_reply_recv[key] += 1
+        else:
+            self._n_reply_recv[key] = int(msg_send.split(b':')[-1])
         return True
 
     def _close_backlog(self, wait=False):
@@ -975,7 +1186,7 @@ class ZMQComm(CommBase.CommBase):
                 # Requeue messages in transit during close
                 # self._send_client_msg(ZMQProxy.server_signoff_msg)
                 while self.is_message(zmq.POLLIN):  # pragma: debug
-                    back_messages.append(self.socket.recv())
+                    back_messages.append(self.socket.recv_multipart())
             # Ensure socket not still open
             self._openned = False
             if not self.socket.closed:
@@ -1090,6 +1301,8 @@ class ZMQComm(CommBase.CommBase):
         out = super(ZMQComm, self).create_work_comm_kwargs
         out['socket_type'] = 'PAIR'
         out['context'] = self.context
+        out['reply_frame'] = self.reply_frame
+        out['partner_location'] = self.partner_location
         return out
 
     # This could be used to clean up file descriptors accumulated when
@@ -1146,9 +1359,11 @@ class ZMQComm(CommBase.CommBase):
     def prepare_header(self, header_kwargs):
         r"""Prepare header kwargs for the communicator."""
         out = super(ZMQComm, self).prepare_header(header_kwargs)
-        if self.is_open:
+        if self.is_open and not self.reply_frame:
             out.setdefault('__meta__', {})
             out['__meta__']['zmq_reply'] = self.set_reply_socket_send()
+            if self.ack_window > 1:
+                out['__meta__']['zmq_ack_window'] = self.ack_window
         return out
         
     def send(self, *args, **kwargs):
@@ -1194,11 +1409,12 @@ class ZMQComm(CommBase.CommBase):
             identity = self.dealer_identity
         topic = tools.str2bytes(topic)
         identity = tools.str2bytes(identity)
+        frames = self.check_reply_socket_send(msg)
         if self.socket_type_name == 'PUB':
-            total_msg = topic + _flag_zmq_filter + msg
-        else:
-            total_msg = msg
-        total_msg = self.check_reply_socket_send(total_msg)
+            if len(frames) > 1:
+                frames.insert(0, topic + _flag_zmq_filter)
+            else:
+                frames = [topic + _flag_zmq_filter + msg]
         kwargs.setdefault('flags', zmq.NOBLOCK)
         with self.socket_lock:
             try:
@@ -1206,7 +1422,7 @@ class ZMQComm(CommBase.CommBase):
                     kwargs['flags'] |= zmq.SNDMORE
                     self.socket.send(identity, **kwargs)
                 else:
-                    self.socket.send(total_msg, **kwargs)
+                    self.socket.send_multipart(frames, **kwargs)
                 TemporaryCommunicationError.reset((self.address, "zmq.EAGAIN"))
             except zmq.ZMQError as e:  # pragma: debug
                 if e.errno == zmq.EAGAIN:
@@ -1222,7 +1438,7 @@ class ZMQComm(CommBase.CommBase):
             # TemporaryCommunicationError is raised due to failure to send
             # total_msg after successfully sending identity
             kwargs['flags'] = 0
-            self.socket.send(total_msg, **kwargs)
+            self.socket.send_multipart(frames, **kwargs)
         self._n_zmq_sent += 1
         return True
 
@@ -1244,11 +1460,10 @@ class ZMQComm(CommBase.CommBase):
                     if self.socket.closed:  # pragma: debug
                         self.error("Socket closed")
                         return (False, self.empty_bytes_msg)
+                    frames = self.socket.recv_multipart(**kwargs)
                     if self.socket_type_name == 'ROUTER':
-                        [identity, total_msg] = self.socket.recv_multipart(**kwargs)
-                        self._recv_identities.add(identity)
-                    else:
-                        total_msg = self.socket.recv(**kwargs)
+                        self._recv_identities.add(frames.pop(0))
+                    total_msg = frames[-1]
                 except zmq.ZMQError as e:
                     if e.errno == zmq.ETIMEDOUT:  # pragma: debug
                         raise NoMessages("No messages in socket.")
@@ -1277,12 +1492,17 @@ class ZMQComm(CommBase.CommBase):
             else:
                 break
         # Interpret headers
-        total_msg, k = self.check_reply_socket_recv(total_msg)
         if self.socket_type_name == 'SUB':
-            topic, msg = total_msg.split(_flag_zmq_filter)
+            if len(frames) > 1:
+                topic = frames[0][:-len(_flag_zmq_filter)]
+                msg = total_msg
+            else:
+                topic, msg = total_msg.split(_flag_zmq_filter, 1)
             assert topic == self.topic_filter
         else:
             msg = total_msg
+        msg, k = self.check_reply_socket_recv(
+            msg, frame=(frames[-2] if len(frames) > 1 else None))
         # Confirm receipt
         if k is not None:
             self._n_zmq_recv[k] += 1
@@ -1355,14 +1575,20 @@ class ZMQComm(CommBase.CommBase):
                     self._n_reply_recv[k] = self._n_zmq_recv[k]  # pragma: debug
             return True
         flag = True
+        deferred = False
         for k in keys:
             if self.is_open and (self._n_zmq_recv[k] != self._n_reply_recv[k]):
+                if not self.is_ack_due(k):
+                    # Wait for the window to fill or the socket to idle
+                    deferred = True
+                    continue
                 self.debug("Confirming %d/%d received messages",
                            self._n_reply_recv[k], self._n_zmq_recv[k])
                 while (self._n_zmq_recv[k] != self._n_reply_recv[k]) and flag:
                     with self.reply_socket_lock:
-                        flag = self._reply_handshake_recv(_reply_msg, k)
+                        flag = self._reply_handshake_recv(
+                            self.ack_message(k), k)
                     if flag:
                         self.debug("Recv confirmed (%d/%d)",
                                    self._n_reply_recv[k], self._n_zmq_recv[k])
-        return flag
+        return (flag and not deferred)
@@ -2,18 +2,76 @@ import numpy as np
 from yggdrasil.components import ComponentBase
 
 
+def get_table_nrows(x):
+    r"""Determine the number of rows in a table.
+
+    Args:
+        x (object): Table represented as a structured numpy array, a
+            pandas DataFrame, or a list/tuple of equal length column
+            arrays.
+
+    Returns:
+        int: Number of rows in the table.
+
+    Raises:
+        TypeError: If x is not a supported table type.
+
+    """
+    if isinstance(x, np.ndarray) and (x.dtype.names is not None):
+        return len(x)
+    if isinstance(x, (list, tuple)) and x:
+        if all(isinstance(col, np.ndarray) and (col.ndim == 1)
+               for col in x):
+            nrows = len(x[0])
+            if all(len(col) == nrows for col in x):
+                return nrows
+    if type(x).__name__ == 'DataFrame':
+        return len(x)
+    raise TypeError(f"Object of type {type(x)} is not a supported table.")
+
+
+def select_table_rows(x, mask):
+    r"""Select rows from a table using a boolean mask.
+
+    Args:
+        x (object): Table represented as a structured numpy array, a
+            pandas DataFrame, or a list/tuple of equal length column
+            arrays.
+        mask (np.ndarray): Boolean array with one element for each row
+            in x that is True for rows that should be kept.
+
+    Returns:
+        object: Table of the same type as x containing only the rows
+            selected by mask.
+
+    """
+    if isinstance(x, np.ndarray):
+        return x[mask]
+    if isinstance(x, (list, tuple)):
+        return type(x)(col[mask] for col in x)
+    return x.loc[mask]
+
+
 class FilterBase(ComponentBase):
     r"""Base class for message filters.
 
     Args:
         initial_state (dict, optional): Dictionary of initial state variables
             that should be set when the filter is created.
+        row_wise (bool, optional): If True, messages containing tables
+            (structured arrays, pandas data frames, or lists of column
+            arrays) will be filtered row by row. The filter will be
+            evaluated once for the entire table and should produce a
+            boolean array with an element for each row. Only the rows that
+            pass the filter will be forwarded as a single, reduced table.
+            Defaults to False.
 
     """
 
     _filtertype = None
     _schema_type = 'filter'
     _schema_subtype_key = 'filtertype'
+    _schema_properties = {'row_wise': {'type': 'boolean', 'default': False}}
 
     def __init__(self, *args, **kwargs):
         self._state = {}
@@ -31,6 +89,75 @@ class FilterBase(ComponentBase):
         """
         raise NotImplementedError  # pragma: debug
 
+    def evaluate_mask(self, x):
+        r"""Evaluate the filter on a table, producing a mask for the rows
+        that pass the filter.
+
+        Args:
+            x (object): Table represented as a structured numpy array, a
+                pandas DataFrame, or a list/tuple of equal length column
+                arrays.
+
+        Returns:
+            np.ndarray: Boolean array with one element for each row in x
+                that is True if the row passes the filter.
+
+        Raises:
+            ValueError: If the filter does not produce a boolean result
+                or the result is not a scalar or a 1D array with an
+                element for each row in x.
+
+        """
+        nrows = get_table_nrows(x)
+        out = np.asarray(self.evaluate_filter(x))
+        if out.dtype != bool:
+            raise ValueError(f"Row-wise filter produced a result with type "
+                             f"{out.dtype}, but a boolean mask is required.")
+        if out.ndim == 0:
+            out = np.full(nrows, bool(out))
+        if out.shape != (nrows, ):
+            raise ValueError(f"Row-wise filter produced a mask with shape "
+                             f"{out.shape}, but the table has {nrows} rows.")
+        return out
+
+    def filter_rows(self, x):
+        r"""Apply the filter to each row in a table.
+
+        Args:
+            x (object): Table represented as a structured numpy array, a
+                pandas DataFrame, or a list/tuple of equal length column
+                arrays.
+
+        Returns:
+            object: Table of the same type as x that only contains rows
+                that pass the filter or None if no rows pass the filter.
+
+        """
+        mask = self.evaluate_mask(x)
+        if not mask.any():
+            return None
+        if mask.all():
+            return x
+        return select_table_rows(x, mask)
+
+    def is_table(self, x):
+        r"""Determine if a message should be filtered row by row.
+
+        Args:
+            x (object): Message object to check.
+
+        Returns:
+            bool: True if the filter is row-wise and x is a table.
+
+        """
+        if not self.row_wise:
+            return False
+        try:
+            get_table_nrows(x)
+        except TypeError:
+            return False
+        return True
+
     def __call__(self, x):
         r"""Call filter on the provided message.
 
@@ -38,9 +165,13 @@ class FilterBase(ComponentBase):
             x (object): Message object to filter.
 
         Returns:
-            bool: True if the message will pass through the filter, False otherwise.
+            bool: True if the message will pass through the filter, False
+                otherwise. For row-wise filters applied to tables, True
+                will be returned if any row passes the filter.
 
         """
+        if self.is_table(x):
+            return bool(self.evaluate_mask(x).any())
         out = self.evaluate_filter(x)
         if isinstance(out, np.ndarray):
             assert out.dtype == bool
@@ -14,6 +14,9 @@ class FunctionFilter(FilterBase):
             containing the function and "<function name>" is the name of the function.
             The function should take the message as input and return a boolean, True
             if the message should pass through the filter, False if it should not.
+            If row_wise is True, the function will be called once for an
+            entire table and should return a boolean array with one element
+            for each row.
 
     """
     _filtertype = 'function'
@@ -48,11 +51,18 @@ class FunctionFilter(FilterBase):
 
         def fcond(x):
             return (units.get_data(x) != 3)
-        
+
+        def frows(x):
+            return (x['a'] != 3)
+
+        table = np.array([(1, ), (2, ), (3, )], dtype=[('a', 'i4')])
         return [{'kwargs': {'function': fcond},
                  'pass': [1, 2, units.add_units(1, 'cm'),
                           np.ones(3, int),
                           units.add_units(np.ones(3, int), 'cm')],
                  'fail': [3, units.add_units(3, 'cm'),
                           3 * np.ones(3, int),
-                          units.add_units(3 * np.ones(3, int), 'cm')]}]
+                          units.add_units(3 * np.ones(3, int), 'cm')]},
+                {'kwargs': {'function': frows, 'row_wise': True},
+                 'pass': [table], 'fail': [table[2:]],
+                 'rows': [(table, table[:2]), (table[2:], None)]}]
@@ -13,7 +13,10 @@ class StatementFilter(FilterBase):
             should pass through the filter, False if it should not. The statement
             should only use a limited set of builtins and the math library (See
             yggdrasil.tools.safe_eval). If more complex relationships are required,
-            use the FunctionFilter class.
+            use the FunctionFilter class. If row_wise is True, the statement
+            will be evaluated once for an entire table and should produce a
+            boolean array with one element for each row (e.g.
+            "%x%['a'] > 1").
 
     Attributes:
         statement (str): Python statement that will be evaluated to determine if
@@ -53,6 +56,9 @@ class StatementFilter(FilterBase):
                 pass/fail for those keywords.
         
         """
+        table = np.array([(1, 1.0), (2, 2.0), (3, 3.0)],
+                         dtype=[('a', 'i4'), ('b', 'f8')])
+        columns = [np.arange(1, 4), np.arange(1, 4, dtype='f8')]
         out = [{'kwargs': {'statement': '%x% != 2'},
                 'pass': [1, 3], 'fail': [2]},
                {'kwargs': {'statement': '%x% != array([0, 0, 0])'},
@@ -63,5 +69,14 @@ class StatementFilter(FilterBase):
                {'kwargs': {'statement': '%x% != '
                            + repr(units.add_units(1, 'cm'))},
                 'pass': [units.add_units(2, 'cm')],
-                'fail': [units.add_units(1, 'cm')]}]
+                'fail': [units.add_units(1, 'cm')]},
+               {'kwargs': {'statement': '(%x%["a"] > 1) & (%x%["b"] < 3.0)',
+                           'row_wise': True},
+                'pass': [table], 'fail': [table[:1]],
+                'rows': [(table, table[1:2]),
+                         (table[:1], None)]},
+               {'kwargs': {'statement': '%x%[0] != 2', 'row_wise': True},
+                'pass': [columns],
+                'rows': [(columns, [columns[0][[0, 2]],
+                                    columns[1][[0, 2]]])]}]
         return out
@@ -1,3 +1,4 @@
+import numpy as np
 from yggdrasil.communication.transforms.TransformBase import TransformBase
 
 
@@ -51,6 +52,11 @@ class FilterTransform(TransformBase):
             object: The transformed message.
 
         """
+        if self.filter.is_table(x):
+            out = self.filter.filter_rows(x)
+            if out is None:
+                return iter([])
+            return out
         if self.filter(x):
             return x
         return iter([])
@@ -65,9 +71,14 @@ class FilterTransform(TransformBase):
                 keywords.
         
         """
+        table = np.array([(1, ), (2, ), (3, )], dtype=[('a', 'i4')])
         return [
             {'kwargs': {'filter': {'statement': '%x% > 1'}},
              'in/out': [(0, iter([])),
                         (2, 2)],
-             'in/out_t': [({'type': 'int'}, {'type': 'int'})]}
+             'in/out_t': [({'type': 'int'}, {'type': 'int'})]},
+            {'kwargs': {'filter': {'statement': '%x%["a"] > 1',
+                                   'row_wise': True}},
+             'in/out': [(table, table[1:]),
+                        (table[:1], iter([]))]}
         ]
@@ -1,15 +1,22 @@
 import os
 import copy
 import six
+import json
+import hashlib
+import warnings
 import importlib
 import contextlib
 import weakref
+import types
 from collections import OrderedDict
 from yggdrasil.doctools import docs2args
 
 
 _registry = {}
 _registry_complete = False
+_registry_validated = False
+_component_cache = {}
+_reverse_subtypes = {}
 
 
 class ComponentError(BaseException):
@@ -122,11 +129,18 @@ def get_registry(comptype=None):
 
     """
     global _registry
+    global _registry_validated
     if registration_in_progress():
         out = _registry
     else:
         from yggdrasil import constants
         out = constants.COMPONENT_REGISTRY
+        if not _registry_validated:
+            _registry_validated = True
+            if registry_hash(out) != constants.COMPONENT_REGISTRY_HASH:
+                warnings.warn("The component registry in constants.py does "
+                              "not match its hash. It should be regenerated "
+                              "by calling 'yggschema --only-constants'.")
     if comptype:
         if comptype not in out:  # pragma: debug
             raise Exception(f"Importing a component type that has not yet "
@@ -135,6 +149,30 @@ def get_registry(comptype=None):
     return out
 
 
+def registry_hash(registry):
+    r"""Compute a hash for the contents of a component registry.
+
+    Args:
+        registry (dict): Component registry mapping from component type to
+            registration information.
+
+    Returns:
+        str: Hex digest of the registry contents, excluding imported
+            classes.
+
+    """
+    contents = {k: {kk: vv for kk, vv in v.items() if kk != 'classes'}
+                for k, v in registry.items()}
+    return hashlib.sha256(
+        json.dumps(contents, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def clear_component_cache():
+    r"""Clear the cache of imported component classes."""
+    _component_cache.clear()
+    _reverse_subtypes.clear()
+
+
 def suspend_registry():
     r"""Suspend the registry by storing the global registries in a dictionary."""
     global _registry
@@ -142,6 +180,7 @@ def suspend_registry():
     out = {'_registry': _registry, '_registry_complete': _registry_complete}
     _registry = {}
     _registry_complete = False
+    clear_component_cache()
     return out
 
 
@@ -151,6 +190,7 @@ def restore_registry(reg_dict):
     global _registry_complete
     _registry = reg_dict['_registry']
     _registry_complete = reg_dict['_registry_complete']
+    clear_component_cache()
 
 
 def import_component(comptype, subtype=None, **kwargs):
@@ -179,11 +219,51 @@ def import_component(comptype, subtype=None, **kwargs):
     registry = get_registry(comptype=comptype)
     if subtype is None:
         subtype = kwargs.get(registry["key"], None)
+    # Classes are only cached once registration is complete as the
+    # registry may change during registration
+    use_cache = (not registration_in_progress())
+    key = (comptype, subtype)
+    if use_cache and (key in _component_cache):
+        out_cls = _component_cache[key]
+    else:
+        out_cls = _import_component(comptype, registry, subtype, **kwargs)
+        if use_cache:
+            _component_cache[key] = out_cls
+    # Check for an aliased class
+    if hasattr(out_cls, '_get_alias'):
+        out_cls = out_cls._get_alias()
+    return out_cls
+
+
+def _import_component(comptype, registry, subtype, **kwargs):
+    r"""Import a component class without using the cache.
+
+    Args:
+        comptype (str): Component type.
+        registry (dict): Registry for the component type.
+        subtype (str): Component subtype or class name.
+        **kwargs: Additional keyword arguments are passed to
+            import_component if the comm cannot be located and a file
+            component should be tried.
+
+    Returns:
+        class: Component class.
+
+    Raises:
+        ComponentError: If subtype is not a registered subtype or the name
+            of a registered subtype class for the specified comptype.
+
+    """
     if (comptype == 'comm') and (subtype is None):
         subtype = 'DefaultComm'
     if subtype is None:
         subtype = registry["default"]
-    rev_subtypes = {v: k for k, v in registry["subtypes"].items()}
+    if registration_in_progress() or (comptype not in _reverse_subtypes):
+        rev_subtypes = {v: k for k, v in registry["subtypes"].items()}
+        if not registration_in_progress():
+            _reverse_subtypes[comptype] = rev_subtypes
+    else:
+        rev_subtypes = _reverse_subtypes[comptype]
     if subtype in registry["subtypes"]:
         class_name = registry["subtypes"][subtype]
     elif subtype in rev_subtypes:
@@ -211,11 +291,7 @@ def import_component(comptype, subtype=None, **kwargs):
                     pass
             raise ComponentError(f"Could not locate a {comptype} component "
                                  f"{subtype}.")
-    out_cls = registry["classes"][class_name]
-    # Check for an aliased class
-    if hasattr(out_cls, '_get_alias'):
-        out_cls = out_cls._get_alias()
-    return out_cls
+    return registry["classes"][class_name]
 
 
 def create_component(comptype, subtype=None, **kwargs):
@@ -243,14 +319,15 @@ def create_component(comptype, subtype=None, **kwargs):
         ComponentError: If comptype is not a registered component type.
 
     """
-    from yggdrasil.schema import get_schema
-    s = get_schema().get(comptype, None)
-    if s is None:  # pragma: debug
+    if comptype not in get_registry():  # pragma: debug
         raise ComponentError("Unrecognized component type: %s" % comptype)
-    if s.subtype_key in kwargs:
-        subtype = kwargs[s.subtype_key]
+    subtype_key = get_registry(comptype)["key"]
+    if subtype_key in kwargs:
+        subtype = kwargs[subtype_key]
     if subtype is None:
-        subtype = s.identify_subtype(kwargs)
+        # The schema is only required if the subtype must be identified
+        from yggdrasil.schema import get_schema
+        subtype = get_schema().get(comptype).identify_subtype(kwargs)
     cls = import_component(comptype, subtype=subtype, **kwargs)
     return cls(**kwargs)
 
@@ -556,6 +633,74 @@ class ComponentBase(ComponentBaseUnregistered):
                 out[k] = getattr(self, k)
         return out
 
+    @classmethod
+    def _get_init_cache(cls):
+        r"""Get the information from the class schema that is used to
+        initialize instances. This is computed the first time an instance
+        of the class is created so that the schema properties do not need
+        to be parsed for each instance.
+
+        Returns:
+            dict: Immutable tables containing the properties that should
+                be set as attributes along with their default values, the
+                array properties, and a mapping from aliases to property
+                names.
+
+        """
+        out = cls.__dict__.get('_schema_init_cache', None)
+        if out is None:
+            attributes = []
+            arrays = []
+            aliases = []
+            for k, v in cls._schema_properties.items():
+                for x in v.get('aliases', []):
+                    aliases.append((x, k))
+                if k in cls._schema_excluded_from_class:
+                    continue
+                default = v.get('default', None)
+                attributes.append(
+                    (k, default, not isinstance(
+                        default, (str, bytes, bool, int, float))))
+                if v.get('type', None) == 'array':
+                    arrays.append(k)
+            out = types.MappingProxyType({
+                'attributes': tuple(attributes),
+                'properties': tuple(x[0] for x in attributes),
+                'arrays': tuple(arrays),
+                'aliases': tuple(aliases)})
+            cls._schema_init_cache = out
+        return out
+
+    @classmethod
+    def _get_validation_schema(cls, comptype, subtype):
+        r"""Get the relaxed component schema that should be used to
+        normalize keyword arguments for instances of this class. The
+        schema is cached on the class until the global schema changes.
+
+        Args:
+            comptype (str): Component type.
+            subtype (str): Component subtype.
+
+        Returns:
+            dict: Schema with properties excluded from class validation
+                removed.
+
+        """
+        from yggdrasil.schema import get_schema
+        schema = get_schema()
+        cached = cls.__dict__.get('_schema_validation_cache', None)
+        if ((cached is None) or (cached[0] is not schema)
+                or (cached[1] != subtype)):
+            s = schema.get_component_schema(comptype, subtype, relaxed=True)
+            for k in cls._schema_excluded_from_class_validation:
+                if k in s['properties']:
+                    del s['properties'][k]
+                if k in s.get('required', []):
+                    s['required'].remove(k)
+            cached = (schema, subtype, s)
+            cls._schema_validation_cache = cached
+        return cached[2]
+
     def __init__(self, skip_component_schema_normalization=None,
                  additional_component_properties=None, **kwargs):
         if skip_component_schema_normalization is None:
@@ -570,74 +715,55 @@ class ComponentBase(ComponentBaseUnregistered):
         if self._schema_subtype_key is not None:
             subtype = getattr(self, self._schema_subtype_key,
                               getattr(self, '_%s' % self._schema_subtype_key, None))
+        init_cache = self._get_init_cache()
         # Fall back to some simple parsing/normalization to save time on
         # full rapidjson normalization
         self._defaults_set = []
-        for k, v in self._schema_properties.items():
-            if k in self._schema_excluded_from_class:
-                continue
-            default = v.get('default', None)
+        for k, default, mutable in init_cache['attributes']:
             if (k == self._schema_subtype_key) and (subtype is not None):
-                default = subtype
-            if default is not None:
-                if k not in kwargs:
-                    self._defaults_set.append(k)
-                kwargs.setdefault(k, copy.deepcopy(default))
-            if v.get('type', None) == 'array':
-                if isinstance(kwargs.get(k, None), (bytes, str)):
-                    kwargs[k] = kwargs[k].split()
+                default, mutable = subtype, False
+            if (default is not None) and (k not in kwargs):
+                self._defaults_set.append(k)
+                kwargs[k] = copy.deepcopy(default) if mutable else default
+        for k in init_cache['arrays']:
+            if isinstance(kwargs.get(k, None), (bytes, str)):
+                kwargs[k] = kwargs[k].split()
         # Parse keyword arguments using schema
         if (((comptype is not None) and (subtype is not None)
              and (not skip_component_schema_normalization)
              and (not self._dont_register))):
-            from yggdrasil.schema import get_schema
-            s = get_schema().get_component_schema(
-                comptype, subtype, relaxed=True)
+            s = self._get_validation_schema(comptype, subtype)
             props = list(s['properties'].keys())
-            if not skip_component_schema_normalization:
-                kwargs.setdefault(self._schema_subtype_key, subtype)
-                if additional_component_properties:
-                    kwargs.update(additional_component_properties)
-                # Remove properties that shouldn't ve validated in class
-                extra_kwargs = {}
-                for k in self._schema_excluded_from_class_validation:
-                    if k in s['properties']:
-                        del s['properties'][k]
-                    if k in s['required']:
-                        s['required'].remove(k)
-                    if k in kwargs:
-                        extra_kwargs[k] = kwargs.pop(k)
-                # Validate and normalize
-                from yggdrasil import rapidjson
-                # import pprint
-                # print(f'before: {self}\n{pprint.pformat(kwargs)}')
-                try:
-                    kwargs = rapidjson.normalize(kwargs, s)
-                    kwargs.update(extra_kwargs)
-                except BaseException:  # pragma: debug
-                    import pprint
-                    pprint.pprint(kwargs)
-                    raise
-                # print(f'after: {self}\n{pprint.pformat(kwargs)}')
+            kwargs.setdefault(self._schema_subtype_key, subtype)
+            if additional_component_properties:
+                kwargs.update(additional_component_properties)
+            # Remove properties that shouldn't ve validated in class
+            extra_kwargs = {}
+            for k in self._schema_excluded_from_class_validation:
+                if k in kwargs:
+                    extra_kwargs[k] = kwargs.pop(k)
+            # Validate and normalize
+            from yggdrasil import rapidjson
+            try:
+                kwargs = rapidjson.normalize(kwargs, s)
+                kwargs.update(extra_kwargs)
+            except BaseException:  # pragma: debug
+                import pprint
+                pprint.pprint(kwargs)
+                raise
         else:
-            props = self._schema_properties.keys()
-            for k in props:
-                for x in self._schema_properties[k].get('aliases', []):
-                    if x in kwargs:
-                        kwargs.setdefault(k, kwargs.pop(x))
+            props = init_cache['properties']
+            for x, k in init_cache['aliases']:
+                if x in kwargs:
+                    kwargs.setdefault(k, kwargs.pop(x))
         # Set attributes based on properties
+        excluded = self._schema_excluded_from_class
         for k in props:
-            if k in self._schema_excluded_from_class:
+            if excluded and (k in excluded):
                 continue
             v = kwargs.pop(k, None)
             if getattr(self, k, None) is None:
                 setattr(self, k, v)
-            # elif (getattr(self, k) != v) and (v is not None):
-            #     warnings.warn(("The schema property '%s' is provided as a "
-            #                    "keyword with a value of %s, but the class "
-            #                    "already has an attribute of the same name "
-            #                    "with the value %s.")
-            #                   % (k, v, getattr(self, k)))
         self.extra_kwargs = kwargs
 
     @staticmethod
@@ -383,6 +383,8 @@ COMPONENT_REGISTRY = {
         },
     },
 }
+COMPONENT_REGISTRY_HASH = (
+    'ad350a7b4f9a3fd1273209e287c4277adcce9888f910683382c92a4e80549096')
 
 # File constants
 FILE2EXT = {
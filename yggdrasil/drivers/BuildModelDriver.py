@@ -10,6 +10,7 @@ class BuildToolBase(CompilerBase):
 
     is_build_tool = True
     build_language = None
+    build_cache = False
 
     @staticmethod
     def before_registration(cls):
@@ -809,7 +809,6 @@ class CModelDriver(CompiledModelDriver):
     include_channel_obj = True
     is_typed = True
     brackets = (r'{', r'}')
-    locked_buildfile = 'datatypes.o'
 
     @staticmethod
     def after_registration(cls, **kwargs):
@@ -1,5 +1,6 @@
 import os
 import re
+import hashlib
 import six
 import copy
 import glob
@@ -29,7 +30,13 @@ if _venv_prefix is not None:
     _system_suffix += '_' + os.path.basename(_venv_prefix)
 _buildfile_locks_lock = threading.RLock()
 _buildfile_locks = {}
+_dependencies_lock = 'internal_dependencies'
 _library_types = ['include', 'static', 'shared', 'windows_import']
+_build_cache_env = 'YGG_BUILD_CACHE'
+_build_cache_stamp_ext = '.ygghash'
+_build_cache_disabled = ['', '0', 'false', 'no', 'none', 'off']
+_include_regex = re.compile(r'^[ \t]*#[ \t]*include[ \t]*"([^"]+)"',
+                            re.MULTILINE)
 
 
 class LockedFile(object):
@@ -219,6 +226,89 @@ def get_compilation_tool(tooltype, name, default=False):
 
 # TODO: Cannot currently make compilation tools components because
 # of circular imports
+def get_build_cache_dir():
+    r"""Get the directory where build products are shared between builds.
+    The shared cache is only used if the YGG_BUILD_CACHE environment
+    variable is set to a directory. It is not pruned automatically.
+
+    Returns:
+        str: Full path to the build cache directory, None if the shared
+            cache is disabled.
+
+    """
+    out = os.environ.get(_build_cache_env, None)
+    if (out is None) or (out.strip().lower() in _build_cache_disabled):
+        return None
+    return os.path.abspath(os.path.expanduser(out))
+
+
+def hash_file_contents(fname, hasher=None):
+    r"""Update a hash with the contents of a file.
+
+    Args:
+        fname (str): Full path to the file that should be hashed.
+        hasher (hashlib._Hash, optional): Hash object that should be
+            updated. Defaults to None and a new sha256 hash is created.
+
+    Returns:
+        hashlib._Hash: Updated hash object.
+
+    """
+    if hasher is None:
+        hasher = hashlib.sha256()
+    with open(fname, 'rb') as fd:
+        for chunk in iter(lambda: fd.read(1 << 16), b''):
+            hasher.update(chunk)
+    return hasher
+
+
+def hash_build_inputs(sources, include_dirs=None, hasher=None):
+    r"""Update a hash with the contents of source files and any local
+    headers that they include (via quoted #include directives),
+    recursively. Files are identified by their base name rather than
+    their full path so that the hash does not depend on the location of
+    the sources.
+
+    Args:
+        sources (list): Full paths to the source files that should be
+            hashed.
+        include_dirs (list, optional): Directories that should be
+            searched for included headers after the directory containing
+            the including file. Defaults to None and only the directory
+            containing the including file is searched.
+        hasher (hashlib._Hash, optional): Hash object that should be
+            updated. Defaults to None and a new sha256 hash is created.
+
+    Returns:
+        hashlib._Hash: Updated hash object.
+
+    """
+    if hasher is None:
+        hasher = hashlib.sha256()
+    if include_dirs is None:
+        include_dirs = []
+    visited = set()
+    stack = [os.path.abspath(x) for x in sources[::-1]]
+    while stack:
+        fname = stack.pop()
+        if (fname in visited) or (not os.path.isfile(fname)):
+            continue
+        visited.add(fname)
+        with open(fname, 'rb') as fd:
+            contents = fd.read()
+        hasher.update(os.path.basename(fname).encode('utf-8'))
+        hasher.update(hashlib.sha256(contents).digest())
+        local_dirs = [os.path.dirname(fname)] + include_dirs
+        includes = _include_regex.findall(contents.decode('utf-8', 'ignore'))
+        for inc in includes[::-1]:
+            for d in local_dirs:
+                inc_path = os.path.abspath(os.path.join(d, inc))
+                if os.path.isfile(inc_path):
+                    stack.append(inc_path)
+                    break
+    return hasher
+
+
 class CompilationToolMeta(type):
     r"""Meta class for registering compilers."""
     def __new__(meta, name, bases, class_dict):
@@ -336,6 +426,16 @@ class CompilationToolBase(object):
             entries in product_exts and product_files that should be removed
             during cleanup. Be careful when adding files to this list.
         asan_flags (list): Flags added when with_asan is specified.
+        build_cache (bool): If True, outputs are stamped with a hash of
+            the build inputs (source/header contents, the resolved command
+            line and the tool) so that existing outputs are only reused
+            when the inputs are unchanged.
+        build_cache_shared (bool): If True and build_cache is True, outputs
+            are also stored in the shared build cache directory (see
+            get_build_cache_dir) if one is configured so that identical
+            builds in other locations can be restored instead of
+            recompiled. Tools that produce secondary products (see
+            product_exts and product_files) never use the shared cache.
 
     """
 
@@ -376,6 +476,8 @@ class CompilationToolBase(object):
     tool_suffix_format = '_%sx'
     asan_flags = None
     object_tool = None
+    build_cache = True
+    build_cache_shared = True
     _language_ext = None  # only update once per class
     _language_cache = {}
     
@@ -1199,6 +1301,162 @@ class CompilationToolBase(object):
                 if isrc in products:  # pragma: debug
                     products.remove(isrc)
 
+    @classmethod
+    def get_build_cache_key(cls, args, cmd, out):
+        r"""Get the key identifying a build from the contents of the input
+        files (including local headers for compilers), the resolved command
+        line, and the tool used.
+
+        Args:
+            args (list): Input arguments to the compilation call (usually
+                one or more source or object files).
+            cmd (list): Command that will be executed to create the output.
+            out (str): The full path to the primary product of the call.
+
+        Returns:
+            str: Hexadecimal hash identifying the build.
+
+        """
+        hasher = hashlib.sha256()
+        hasher.update(f'{cls.tooltype}:{cls.toolname}'.encode('utf-8'))
+        src = [x for x in args if os.path.isfile(x)]
+        # Paths relative to the sources are normalized so that the key
+        # does not depend on where the build takes place
+        root = None
+        if src:
+            root = os.path.dirname(os.path.abspath(src[0]))
+        include_dirs = []
+        for i, x in enumerate(cmd):
+            ix = x.replace(out, '<out>')
+            if root:
+                ix = ix.replace(root, '<root>')
+            hasher.update(ix.encode('utf-8') + b'\0')
+            for k in ['-I', '/I']:
+                if x == k and (i + 1) < len(cmd):
+                    include_dirs.append(cmd[i + 1])
+                elif x.startswith(k) and len(x) > len(k):
+                    include_dirs.append(x[len(k):])
+        if cls.tooltype == 'compiler':
+            hash_build_inputs(src, include_dirs=include_dirs, hasher=hasher)
+        else:
+            for x in src:
+                hasher.update(os.path.basename(x).encode('utf-8'))
+                hash_file_contents(x, hasher=hasher)
+        # Other files on the command line (e.g. libraries) are identified
+        # by their size and modification time to avoid hashing large files
+        for x in cmd:
+            if (x not in src) and (x != out) and os.path.isfile(x):
+                st = os.stat(x)
+                hasher.update(f'{os.path.basename(x)}:{st.st_size}:'
+                              f'{st.st_mtime_ns}'.encode('utf-8'))
+        return hasher.hexdigest()
+
+    @classmethod
+    def get_build_cache_dir(cls):
+        r"""Get the shared build cache directory that should be used by
+        this tool.
+
+        Returns:
+            str: Full path to the build cache directory, None if the
+                shared cache should not be used.
+
+        """
+        if ((not cls.build_cache_shared) or cls.product_exts
+                or cls.product_files or platform._is_win):
+            # Only the primary product is cached and Windows linkers
+            # produce untracked import libraries
+            return None
+        return get_build_cache_dir()
+
+    @classmethod
+    def check_build_cache(cls, key, args, out):
+        r"""Determine if an existing output is up to date with the build
+        inputs or if it can be restored from the shared build cache. Outputs
+        that are out of date are removed. Existing outputs without a
+        record of the build inputs (e.g. those created before stamps were
+        added or supplied by the user) are kept and adopted.
+
+        Args:
+            key (str): Build key returned by get_build_cache_key.
+            args (list): Input arguments to the compilation call.
+            out (str): The full path to the primary product of the call.
+
+        Returns:
+            bool: True if out is up to date, False if it must be built.
+
+        """
+        stamp = out + _build_cache_stamp_ext
+        if os.path.isfile(out):
+            if not os.path.isfile(stamp):
+                logger.debug(f"Output already exists: {out}")
+                cls.write_build_stamp(key, out)
+                return True
+            with open(stamp, 'r') as fd:
+                if fd.read().strip() == key:
+                    logger.debug(f"Output up to date: {out}")
+                    return True
+            logger.debug(f"Build inputs changed, rebuilding: {out}")
+            cls.remove_products(args, out)
+            if os.path.isfile(stamp):
+                os.remove(stamp)
+            return False
+        cache_dir = cls.get_build_cache_dir()
+        if not cache_dir:
+            return False
+        cached = os.path.join(cache_dir, key[:2], key)
+        if not os.path.isfile(cached):
+            return False
+        try:
+            tmp = f'{out}.{os.getpid()}.{threading.get_ident()}.tmp'
+            shutil.copy2(cached, tmp)
+            os.replace(tmp, out)
+            cls.write_build_stamp(key, out)
+        except OSError as e:  # pragma: debug
+            logger.debug(f"Could not restore {out} from build cache: {e}")
+            return False
+        logger.debug(f"Output restored from build cache: {out}")
+        return True
+
+    @classmethod
+    def write_build_stamp(cls, key, out):
+        r"""Record the build key for an output.
+
+        Args:
+            key (str): Build key returned by get_build_cache_key.
+            out (str): The full path to the primary product of the call.
+
+        """
+        stamp = out + _build_cache_stamp_ext
+        tmp = f'{stamp}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'w') as fd:
+            fd.write(key)
+        os.replace(tmp, stamp)
+
+    @classmethod
+    def update_build_cache(cls, key, out):
+        r"""Record the build key for a newly created output and add the
+        output to the shared build cache.
+
+        Args:
+            key (str): Build key returned by get_build_cache_key.
+            out (str): The full path to the primary product of the call.
+
+        """
+        cls.write_build_stamp(key, out)
+        cache_dir = cls.get_build_cache_dir()
+        if not (cache_dir and os.path.isfile(out)):
+            return
+        cached = os.path.join(cache_dir, key[:2], key)
+        if os.path.isfile(cached):
+            return
+        try:
+            os.makedirs(os.path.dirname(cached), exist_ok=True)
+            tmp = f'{cached}.{os.getpid()}.{threading.get_ident()}.tmp'
+            shutil.copy2(out, tmp)
+            os.replace(tmp, cached)
+        except OSError as e:  # pragma: debug
+            logger.debug(f"Could not add {out} to build cache: {e}")
+
     @classmethod
     def tool_version(cls, **kwargs):
         r"""Get the version of the compilation tool.
@@ -1242,7 +1500,8 @@ class CompilationToolBase(object):
                 be ignored if skip_flags is True.
             overwrite (bool, optional): If True, the existing compile file will
                 be overwritten. Otherwise, it will be kept and this function
-                will return without recompiling the source file.
+                will return without recompiling the source file if it is up to
+                date with the build inputs (see build_cache).
             products (list, optional): Existing Python list that additional
                 products produced by the compilation should be appended to.
                 Defaults to None and is ignored.
@@ -1283,6 +1542,7 @@ class CompilationToolBase(object):
         if additional_args is not None:
             args = args + additional_args
         # Process arguments only valid if skip_flags is False
+        use_cache = False
         if (not skip_flags):
             if products is None:
                 products = []
@@ -1294,12 +1554,17 @@ class CompilationToolBase(object):
                    and (working_dir is not None))):
                 out = os.path.join(working_dir, out)
             assert out not in args  # Don't remove source files
+            use_cache = (cls.build_cache and (out != 'clean')
+                         and (not os.path.isdir(out)))
             # Check for file
             if overwrite and (not dry_run):
                 cls.remove_products(args, out)
                 if os.path.isfile(out) or os.path.isdir(out):  # pragma: debug
                     raise RuntimeError("Product not removed: %s" % out)
-            if (not dry_run) and (os.path.isfile(out) or os.path.isdir(out)):
+                if os.path.isfile(out + _build_cache_stamp_ext):
+                    os.remove(out + _build_cache_stamp_ext)
+            if ((not (dry_run or use_cache))
+                    and (os.path.isfile(out) or os.path.isdir(out))):
                 cls.append_product(products, args, out)
                 logger.debug(f"Output already exists: {out}")
                 return out
@@ -1321,6 +1586,15 @@ class CompilationToolBase(object):
             else:
                 if out != 'clean':
                     cls.append_product(products, args, out)
+                if use_cache:
+                    products.append(out + _build_cache_stamp_ext)
+                return out
+        # Return if output is up to date with the build inputs
+        if use_cache:
+            build_key = cls.get_build_cache_key(args, cmd, out)
+            if cls.check_build_cache(build_key, args, out):
+                cls.append_product(products, args, out)
+                products.append(out + _build_cache_stamp_ext)
                 return out
         # Run command
         output = ''
@@ -1360,6 +1634,9 @@ class CompilationToolBase(object):
                             f"{cls.tooltype.title()} tool, {cls.toolname}"
                             f", failed to produce result \'{x}\'")
                     cls.append_product(products, args, x)
+                if use_cache:
+                    cls.update_build_cache(build_key, out)
+                    products.append(out + _build_cache_stamp_ext)
                 logger.debug(
                     f"{cls.tooltype.title()} {cls.toolname} produced "
                     f"{expected_products}")
@@ -2306,6 +2583,7 @@ class BuildToolBase(CompilerBase):  # pragma: in progress
     tooltype = 'buildtool'
     flag_options = OrderedDict()
     default_buildfile = None
+    build_cache = False
     _schema_properties = {
         'buildfile': {'type': 'string'},
         'builddir': {'type': 'string'},
@@ -2382,6 +2660,12 @@ class CompiledModelDriver(ModelDriver):
             two processes simultaneously. If False, it cannot and an
             MPI barrier will be used to prevent simultaneous compilation.
             Defaults to False.
+        locked_buildfile (str): File that is shared by all models of this
+            language and must be locked during compilation. If None, only
+            the model's target (and internal libraries) are locked during
+            compilation, except when running under MPI where internal
+            libraries are compiled under a lock shared with the partner
+            processes on the root process.
 
     Attributes:
         source_files (list): Source files.
@@ -2580,7 +2864,14 @@ class CompiledModelDriver(ModelDriver):
         self.debug("model_file: %s", self.model_file)
         # Add the buildfile_lock and pass the file
         if not self.allow_parallel_build:
-            self.buildfile_lock = self.get_buildfile_lock(instance=self)
+            fname = None
+            if self._mpi_comm and (self.locked_buildfile is None):
+                # Locks for individual libraries are not shared between
+                # processes so the lock sent to the partner on the root
+                # process must be the one held while compiling them
+                fname = _dependencies_lock
+            self.buildfile_lock = self.get_buildfile_lock(fname=fname,
+                                                          instance=self)
             if self._mpi_rank > 0:
                 self.send_mpi(self.buildfile_lock.message,
                               tag=self._mpi_tags['BUILDFILE'])
@@ -2592,8 +2883,11 @@ class CompiledModelDriver(ModelDriver):
         creating one as necessary.
 
         Args:
-            name (str): Build file.
-            context (threading.Context): Threading context.
+            name (str): Build file. Defaults to locked_buildfile if set and
+                the target of the instance (model_file) otherwise.
+            context (threading.Context): Threading context. Defaults to
+                the context of instance if provided and threading
+                otherwise.
             instance (ModelDriver): Driver instance that should be used.
             **kwargs: Additional keyword arguments are passed to the FileLock
                 initialization.
@@ -2605,9 +2899,13 @@ class CompiledModelDriver(ModelDriver):
         global _buildfile_locks
         if fname is None:
             fname = cls.locked_buildfile
+        if (fname is None) and (instance is not None):
+            fname = instance.model_file
         assert fname is not None
         if (context is None) and (instance is not None):
             context = instance.context
+        if context is None:
+            context = threading
         with _buildfile_locks_lock:
             if fname not in _buildfile_locks:
                 _buildfile_locks[fname] = LockedFile(fname, context, **kwargs)
@@ -2630,6 +2928,24 @@ class CompiledModelDriver(ModelDriver):
                                   tag=self._mpi_tags['UNLOCK_BUILDFILE'])
                 self.buildfile_lock.lock.release()
 
+    @contextlib.contextmanager
+    def dependencies_locked(self):
+        r"""Context manager for compiling internal libraries. When running
+        under MPI, a lock shared by all models is held so that libraries
+        are not compiled by more than one rank at a time (the lock sent
+        to the partner on the root process by other ranks)."""
+        lock = None
+        try:
+            if self._mpi_comm:
+                x = self.get_buildfile_lock(fname=_dependencies_lock,
+                                            instance=self).lock
+                x.acquire()
+                lock = x
+            yield
+        finally:
+            if lock is not None:
+                lock.release()
+
     @classmethod
     def mpi_partner_init(cls, self):
         r"""Actions initializing an MPIPartnerModel."""
@@ -3317,6 +3633,53 @@ class CompiledModelDriver(ModelDriver):
             out = out[:min_dep] + new_deps + out[min_dep:]
         return out
 
+    @classmethod
+    def get_dependency_graph(cls, deps, toolname=None,
+                             disable_python_c_api=False):
+        r"""Get the graph of dependencies, including any dependencies for the
+        direct dependencies, so that dependencies that do not depend on each
+        other can be compiled concurrently.
+
+        Args:
+            deps (list): Dependencies in order.
+            toolname (str, optional): Name of compiler tool that should be used.
+                Defaults to None and the default compiler for the language will
+                be used.
+            disable_python_c_api (bool, optional): If True, the Python C
+                API will be disabled. Defaults to False.
+
+        Returns:
+            OrderedDict: Mapping between dependencies (in the order that they
+                should be compiled serially) and the dependencies that must be
+                compiled before them.
+
+        """
+        order = cls.get_dependency_order(
+            deps, toolname=toolname,
+            disable_python_c_api=disable_python_c_api)[::-1]
+        out = OrderedDict()
+        for d in order:
+            drv = cls
+            dname = d
+            if isinstance(d, tuple):
+                dname = d[1]
+                if d[0] != cls.language:
+                    drv = import_component('model', d[0])
+            dep_info = drv.get_dependency_info(dname, toolname=toolname,
+                                               default={})
+            prereqs = []
+            for x in dep_info.get('internal_dependencies', []):
+                if isinstance(d, tuple) and not isinstance(x, tuple):
+                    x = (d[0], x)
+                if x not in out:
+                    # Fall back to serial order if the dependency cannot
+                    # be matched
+                    prereqs = list(out.keys())
+                    break
+                prereqs.append(x)
+            out[d] = prereqs
+        return out
+
     @classmethod
     def is_standard_library(cls, dep):
         r"""Determine if a dependency is a standard library.
@@ -4045,32 +4408,118 @@ class CompiledModelDriver(ModelDriver):
         return self.compile_dependencies(*args, **kwargs)
         
     @classmethod
-    def compile_dependencies(cls, toolname=None, dep=None, **kwargs):
-        r"""Compile any required internal libraries, including the interface."""
+    def get_compilation_graph(cls, toolname=None, dep=None, graph=None,
+                              **kwargs):
+        r"""Get the graph of internal libraries that must be compiled for
+        a dependency, including the interface libraries for any base
+        languages.
+
+        Args:
+            toolname (str, optional): Name of compiler tool that should be used.
+                Defaults to None and the default compiler for the language will
+                be used.
+            dep (str, optional): Dependency that should be compiled. Defaults
+                to the interface library.
+            graph (OrderedDict, optional): Existing graph that entries should
+                be added to. Defaults to None and a new graph is created.
+            **kwargs: Additional keyword arguments are passed to call_compiler
+                for each library.
+
+        Returns:
+            OrderedDict: Mapping between (language, library) pairs and tuples
+                of the driver class that should compile the library, the
+                source passed to call_compiler, the keyword arguments passed
+                to call_compiler, and the (language, library) pairs that must
+                be compiled first.
+
+        """
+        if graph is None:
+            graph = OrderedDict()
         if dep is None:
             dep = cls.interface_library
-        kwargs.setdefault('products', [])
         base_libraries = []
         compiler = cls.get_tool('compiler', toolname=toolname)
         for x in cls.base_languages:
-            toolname = None
+            base_toolname = None
             if compiler.toolset is not None:
-                toolname = get_compatible_tool(compiler, 'compiler', x).toolname
+                base_toolname = get_compatible_tool(
+                    compiler, 'compiler', x).toolname
             base_cls = import_component('model', x)
             base_libraries.append(base_cls.interface_library)
-            base_cls.compile_dependencies(toolname=toolname, **kwargs)
-        if (dep is not None) and cls.is_installed() and (dep not in base_libraries):
-            dep_order = cls.get_dependency_order(
-                dep, toolname=toolname,
-                disable_python_c_api=kwargs.get('disable_python_c_api', False))
-            for k in dep_order[::-1]:
-                if isinstance(k, tuple):
-                    assert len(k) == 2
-                    ikw = dict(kwargs, language=k[0],
-                               toolname=get_compatible_tool(compiler, 'compiler', k[0]))
-                    cls.call_compiler(k[1], **ikw)
-                else:
-                    cls.call_compiler(k, toolname=toolname, **kwargs)
+            if hasattr(base_cls, 'get_compilation_graph'):
+                base_cls.get_compilation_graph(toolname=base_toolname,
+                                               graph=graph, **kwargs)
+            else:
+                base_cls.compile_dependencies(toolname=base_toolname,
+                                              **kwargs)
+        if (dep is None) or (not cls.is_installed()) or (dep in base_libraries):
+            return graph
+
+        def as_node(k):
+            if isinstance(k, tuple):
+                return k
+            return (cls.language, k)
+
+        dep_graph = cls.get_dependency_graph(
+            dep, toolname=toolname,
+            disable_python_c_api=kwargs.get('disable_python_c_api', False))
+        for k, prereqs in dep_graph.items():
+            node = as_node(k)
+            if node in graph:
+                continue
+            if isinstance(k, tuple):
+                assert len(k) == 2
+                ikw = dict(kwargs, language=k[0],
+                           toolname=get_compatible_tool(compiler, 'compiler', k[0]))
+                graph[node] = (cls, k[1], ikw, [as_node(x) for x in prereqs])
+            else:
+                ikw = dict(kwargs, toolname=toolname)
+                graph[node] = (cls, k, ikw, [as_node(x) for x in prereqs])
+        return graph
+
+    @classmethod
+    def compile_dependencies(cls, toolname=None, dep=None, nproc=None,
+                             context=None, **kwargs):
+        r"""Compile any required internal libraries, including the interface.
+        Libraries that do not depend on each other are compiled concurrently.
+
+        Args:
+            toolname (str, optional): Name of compiler tool that should be used.
+                Defaults to None and the default compiler for the language will
+                be used.
+            dep (str, optional): Dependency that should be compiled. Defaults
+                to the interface library.
+            nproc (int, optional): Maximum number of libraries that should be
+                compiled at once. Defaults to the number of CPUs.
+            context (threading.Context, optional): Threading context used to
+                create the lock for each library. Defaults to threading.
+            **kwargs: Additional keyword arguments are passed to call_compiler
+                for each library.
+
+        """
+        kwargs.setdefault('products', [])
+        graph = cls.get_compilation_graph(toolname=toolname, dep=dep,
+                                          **kwargs)
+        if not graph:
+            return
+        suffix = cls.get_internal_suffix(**cls.select_suffix_kwargs(kwargs))
+
+        def compile_node(node):
+            drv, src, ikw, _ = graph[node]
+            if ikw.get('dry_run', False):
+                return drv.call_compiler(src, **ikw)
+            lock = cls.get_buildfile_lock(
+                fname='%s:%s%s' % (node[0], node[1], suffix),
+                context=context)
+            with lock.lock:
+                return drv.call_compiler(src, **ikw)
+
+        if nproc is None:
+            nproc = os.cpu_count() or 1
+        if kwargs.get('dry_run', False):
+            nproc = 1
+        tools.run_task_graph(OrderedDict((k, v[3]) for k, v in graph.items()),
+                             compile_node, nproc=nproc)
 
     @classmethod
     def cleanup_dependencies(cls, products=None, verbose=False, **kwargs):
@@ -4139,7 +4588,8 @@ class CompiledModelDriver(ModelDriver):
                 kwargs.setdefault(k, v)
             suffix_kws = self.select_suffix_kwargs(kwargs)
             if ((isinstance(kwargs['out'], str) and os.path.isfile(kwargs['out'])
-                 and (not kwargs['overwrite']))):
+                 and (not kwargs['overwrite'])
+                 and (not self.get_tool_instance('compiler').build_cache))):
                 self.debug("Result already exists: %s", kwargs['out'])
                 return kwargs['out']
             if 'env' not in kwargs:
@@ -4147,8 +4597,10 @@ class CompiledModelDriver(ModelDriver):
                                              toolname=kwargs['toolname'])
             try:
                 if not kwargs.get('dry_run', False):
-                    self.compile_dependencies_instance(
-                        toolname=kwargs['toolname'], **suffix_kws)
+                    with self.dependencies_locked():
+                        self.compile_dependencies_instance(
+                            toolname=kwargs['toolname'],
+                            context=self.context, **suffix_kws)
                 return self.call_compiler(source_files, **kwargs)
             except BaseException:
                 self.cleanup_products()
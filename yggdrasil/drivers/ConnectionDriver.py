@@ -145,6 +145,11 @@ class ConnectionDriver(Driver):
                   each.
               'broadcast': Send the same message to each comm.
               'scatter': Send part of message (must be a list) to each comm.
+              'least_loaded': Send each message to the comm with the fewest
+                  outstanding messages.
+              'work_stealing': Send each message to the first idle comm,
+                  falling back to 'least_loaded' if none become idle before
+                  the timeout.
         transform (str, func, optional): Function or string specifying function
             that should be used to translate messages from the input communicator
             before passing them to the output communicator. If a string, the
@@ -222,7 +227,8 @@ class ConnectionDriver(Driver):
                           'enum': ['cycle', 'gather'],
                           'default': 'cycle'},
         'output_pattern': {'type': 'string',
-                           'enum': ['cycle', 'broadcast', 'scatter'],
+                           'enum': ['cycle', 'broadcast', 'scatter',
+                                    'least_loaded', 'work_stealing'],
                            'default': 'broadcast'},
         'transform': {'type': 'array',
                       'items': {'anyOf': [
@@ -339,7 +345,9 @@ class ConnectionDriver(Driver):
             if self.as_process:
                 comm_list[i]['buffer_task_method'] = 'process'
             if (((comm_list[i].get('partner_copies', 0) > 1)
-                 and (not comm_list[i].get('is_client', False))
+                 and ((not comm_list[i].get('is_client', False))
+                      or (comm_kws.get('pattern', None)
+                          in ['least_loaded', 'work_stealing']))
                  and (direction == 'send')
                  and (not comm_list[i].get('dont_copy', False)))):
                 from yggdrasil.communication import ForkComm
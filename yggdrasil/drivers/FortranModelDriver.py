@@ -32,6 +32,7 @@ class FortranCompilerBase(CompilerBase):
     default_executable = None
     default_archiver = None
     product_exts = ['mod']
+    build_cache_shared = False  # module files are written elsewhere
 
     @classmethod
     def get_flags(cls, **kwargs):
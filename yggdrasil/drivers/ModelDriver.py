@@ -2,6 +2,7 @@ import os
 import re
 import sys
 import copy
+import codecs
 import logging
 import warnings
 import subprocess
@@ -538,6 +539,7 @@ class ModelDriver(Driver):
         self.model_process = None
         self.queue = multitasking.Queue()
         self.queue_thread = None
+        self.queue_decoder = None
         self.event_process_kill_called = multitasking.Event()
         self.event_process_kill_complete = multitasking.Event()
         # Tools
@@ -1620,8 +1622,16 @@ class ModelDriver(Driver):
         # if multitasking._on_mpi:
         #     self.init_mpi_env()
         self.model_process = self.run_model(**kwargs)
-        # Start thread to queue output
-        if not no_queue_thread:
+        # Start forwarding output to the queue
+        if no_queue_thread:
+            pass
+        elif self.use_output_multiplexer:
+            self.queue_decoder = codecs.getincrementaldecoder('utf-8')(
+                errors='replace')
+            self.queue_thread = multitasking.get_output_multiplexer().register(
+                self.model_process.stdout, self.enqueue_output_chunk,
+                name=self.name + '.EnqueueLoop')
+        else:
             self.queue_thread = multitasking.YggTaskLoop(
                 target=self.enqueue_output_loop,
                 name=self.name + '.EnqueueLoop')
@@ -1629,6 +1639,17 @@ class ModelDriver(Driver):
         if multitasking._on_mpi:
             self.init_mpi()
 
+    @property
+    def use_output_multiplexer(self):
+        r"""bool: True if output from the model process can be forwarded
+        by the shared, selector-based reader rather than a dedicated
+        thread. This requires that the platform supports selecting on
+        pipes and that queue_recv has not been overridden."""
+        return (multitasking.OutputMultiplexer.supported
+                and (type(self).queue_recv is ModelDriver.queue_recv)
+                and (getattr(self.model_process, 'stdout', None)
+                     is not None))
+
     def queue_close(self):
         r"""Close the queue for messages from the model process."""
         self.model_process.stdout.close()
@@ -1661,6 +1682,34 @@ class ModelDriver(Driver):
             except BaseException as e:  # pragma: debug
                 warnings.warn("Error in printing output: %s" % e)
 
+    def enqueue_output_chunk(self, chunk):
+        r"""Pass a chunk of output read from the model process to the
+        queue.
+
+        Args:
+            chunk (bytes): Output from the model process. An empty bytes
+                string indicates that the process closed its output.
+
+        """
+        if chunk:
+            try:
+                self.queue.put(self.queue_decoder.decode(chunk))
+            except BaseException as e:  # pragma: debug
+                warnings.warn("Error in printing output: %s" % e)
+            return
+        try:
+            remainder = self.queue_decoder.decode(b'', final=True)
+            if remainder:
+                self.queue.put(remainder)
+            self.queue.put(self._exit_line)
+        except multitasking.AliasDisconnectError:  # pragma: debug
+            self.error("Queue disconnected")
+        self.debug("End of model output")
+        try:
+            self.queue_close()
+        except BaseException:  # pragma: debug
+            pass
+
     def before_loop(self):
         r"""Actions before loop."""
         self.debug('Running %s from %s with cwd %s and env %s',
@@ -1770,22 +1819,29 @@ class ModelDriver(Driver):
         if self.check_mpi_request('stopped'):
             self.debug("Stop requested by MPI partner.")
             self.set_break_flag()
+        # Block until output arrives, then forward everything that is
+        # already queued at once
+        lines = []
         try:
-            line = self.queue.get_nowait()
+            lines.append(self.queue.get(timeout=self.sleeptime))
+            while lines[-1] != self._exit_line:
+                lines.append(self.queue.get_nowait())
         except Empty:
-            # This sleep is necessary to allow changes in queue without lock
-            self.sleep()
-            return
+            pass
         except multitasking.AliasDisconnectError:  # pragma: debug
             self.error("Queue disconnected")
             self.set_break_flag()
-        else:
-            if (line == self._exit_line) or self.check_mpi_request('stopped'):
-                self.debug("No more output")
-                self.set_break_flag()
-            else:
-                self.print_encoded(line, end="")
-                sys.stdout.flush()
+        if not lines:
+            return
+        finished = (lines[-1] == self._exit_line)
+        if finished:
+            lines.pop()
+        if lines:
+            self.print_encoded(''.join(lines), end="")
+            sys.stdout.flush()
+        if finished or self.check_mpi_request('stopped'):
+            self.debug("No more output")
+            self.set_break_flag()
 
     def run_finally(self):
         r"""Actions to perform in finally clause of try/except wrapping
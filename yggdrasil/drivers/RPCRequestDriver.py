@@ -1,3 +1,4 @@
+import functools
 from yggdrasil import constants
 from yggdrasil.drivers.ConnectionDriver import ConnectionDriver, run_remotely
 from yggdrasil.drivers.RPCResponseDriver import RPCResponseDriver
@@ -13,7 +14,9 @@ class RPCRequestDriver(ConnectionDriver):
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
-        response_drivers (dict): Response drivers created for each request.
+        response_drivers (dict): Response drivers that route responses back
+            to all of the clients, keyed by the response comm type (and
+            server index when there are multiple servers).
 
     """
 
@@ -108,6 +111,9 @@ class RPCRequestDriver(ConnectionDriver):
         """
         with self.lock:
             clients = self.clients
+            if direction == "input":
+                for x in self.response_drivers.values():
+                    x.remove_client(name)
             if (direction == "input") and (name in clients) and (len(clients) > 1):
                 super(RPCRequestDriver, self).send_message(
                     CommBase.CommMessage(args=constants.YGG_CLIENT_EOF,
@@ -154,10 +160,13 @@ class RPCRequestDriver(ConnectionDriver):
         r"""Send client sign on to server response driver."""
         super(RPCRequestDriver, self).before_loop()
         self.ocomm._send_serializer = True
+        if self.ocomm._commtype == 'fork':
+            # Requests are outstanding until the response is returned
+            self.ocomm.track_completion = True
 
     def send_message(self, msg, **kwargs):
-        r"""Start a response driver for a request message and send message with
-        header.
+        r"""Register the request with the response driver (starting it if
+        necessary) and send message with header.
 
         Args:
             msg (CommMessage): Message being sent.
@@ -176,14 +185,29 @@ class RPCRequestDriver(ConnectionDriver):
                  and (msg.args == constants.YGG_CLIENT_EOF))):  # pragma: intermittent
                 self.remove_model('input', msg.header['__meta__']['model'])
                 return True
+            idx = None
+            if self.ocomm._commtype == 'fork':
+                # Selecting the server can wait for one to become idle
+                # (up to steal_timeout for 'work_stealing') so it is done
+                # before the lock is taken
+                idx = self.ocomm.select_comm_index()
             with self.lock:
                 if (not self.is_comm_open) or self._block_response:  # pragma: debug
                     self.debug("Comm closed, not creating response driver.")
                     return False
-                key = msg.header['__meta__']['response_address']
-                if self.ocomm._commtype == 'fork':
-                    key = (msg.header['__meta__']['response_address'],
-                           self.ocomm.curr_comm_index % len(self.ocomm))
+                # Responses for all clients are multiplexed through a single
+                # response driver per server
+                key = msg.header['commtype']
+                drv_task_kwargs = {}
+                on_response = None
+                if idx is not None:
+                    key = (msg.header['commtype'], idx)
+                    # complete_message updates the load counters on this
+                    # process's copy of the fork comm so the response
+                    # driver must run as a thread in this process
+                    on_response = functools.partial(
+                        self.ocomm.complete_message, idx)
+                    drv_task_kwargs['task_method'] = 'thread'
                 if key in self.response_drivers:
                     response_driver = self.response_drivers[key]
                 else:
@@ -194,8 +218,10 @@ class RPCRequestDriver(ConnectionDriver):
                                 msg.header['__meta__']['request_id']]
                     drv_kwargs = dict(
                         request_name=self.name,
+                        on_response=on_response,
                         inputs=[response_kwargs],
-                        outputs=[{'commtype': msg.header["commtype"]}])
+                        outputs=[{'commtype': msg.header["commtype"]}],
+                        **drv_task_kwargs)
                     self.debug("Creating response comm: address = %s, request_id = %s",
                                msg.header['__meta__']['response_address'],
                                msg.header['__meta__']['request_id'])
@@ -210,6 +236,10 @@ class RPCRequestDriver(ConnectionDriver):
                     except BaseException:  # pragma: debug
                         self.exception("Could not create/start response driver.")
                         return False
+                response_driver.add_route(
+                    msg.header['__meta__']['request_id'],
+                    msg.header['__meta__']['response_address'],
+                    model=msg.header['__meta__'].get('model', ''))
             # Send response address in header
             kwargs.setdefault('header_kwargs', {})
             kwargs['header_kwargs'].setdefault('__meta__', {})
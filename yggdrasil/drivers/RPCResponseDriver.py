@@ -1,26 +1,42 @@
-from yggdrasil.drivers.ConnectionDriver import ConnectionDriver
+import copy
+from yggdrasil.drivers.ConnectionDriver import ConnectionDriver, run_remotely
+from yggdrasil.communication import new_comm
 
 
 class RPCResponseDriver(ConnectionDriver):
-    r"""Class for handling client side RPC type communication.
+    r"""Class for handling client side RPC type communication. A single
+    response driver receives the responses to all requests routed through
+    an RPCRequestDriver and forwards each one to the response comm of the
+    client that made the request, based on the request_id.
 
     Args:
         model_response_address (str): The address of the channel used by the
             client model to receive responses.
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
+        on_response (callable, optional): Function that should be called
+            with no arguments each time a response is forwarded to a
+            client. It is called on the driver's task so it can only update
+            state shared with the caller if the driver runs as a thread
+            (task_method='thread'). Defaults to None and is ignored.
         **kwargs: Additional keyword arguments are passed to parent class.
 
     Attributes:
         msg_id (str): ID associate with the request message this driver was
             created to respond to.
-        response_drivers (list): Response drivers created for each request.
+        response_comms (dict): Comms used to send responses to each client,
+            keyed by the address of the client's response comm.
+        response_models (dict): Name of the client model associated with
+            each client response address.
+        response_routes (dict): Client response address that the response
+            to each pending request should be sent to, keyed by request_id.
 
     """
 
     _connection_type = 'rpc_response'
 
-    def __init__(self, model_response_address, msg_id, **kwargs):
+    def __init__(self, model_response_address, msg_id, on_response=None,
+                 **kwargs):
         # Input communicator
         inputs = kwargs.get('inputs', [{}])
         inputs[0]['name'] = 'server_model_response-' + msg_id
@@ -37,12 +53,71 @@ class RPCResponseDriver(ConnectionDriver):
         super(RPCResponseDriver, self).__init__('rpc_response.' + msg_id,
                                                 **kwargs)
         self.msg_id = msg_id
+        self.on_response = on_response
+        self.response_comms = {}
+        self.response_models = {}
+        self.response_routes = {}
+        if model_response_address is not None:
+            self.response_comms[model_response_address] = self.ocomm
 
     @property
     def response_address(self):
         r"""str: Address of response comm."""
         return self.icomm.opp_address
 
+    @run_remotely
+    def add_route(self, request_id, response_address, model=''):
+        r"""Register the client response comm that the response to a
+        request should be sent to, creating the comm if this is the first
+        request from the client.
+
+        Args:
+            request_id (str): ID of the request.
+            response_address (str): Address of the client's response comm.
+            model (str, optional): Name of the client model. Defaults to ''.
+
+        """
+        with self.lock:
+            if response_address not in self.response_comms:
+                comm_kws = copy.deepcopy(self.ocomm_kws)
+                comm_kws['commtype'][0].update(
+                    address=response_address,
+                    name='client_model_response-' + request_id)
+                comm = new_comm(**comm_kws)
+                comm.open()
+                self.response_comms[response_address] = comm
+            if model:
+                self.response_models[response_address] = model
+            self.response_routes[request_id] = response_address
+
+    @run_remotely
+    def remove_client(self, model):
+        r"""Close the response comm(s) for a client model that signed off.
+
+        Args:
+            model (str): Name of the client model.
+
+        """
+        with self.lock:
+            for k in [k for k, v in self.response_models.items()
+                      if v == model]:
+                self.response_models.pop(k)
+                comm = self.response_comms[k]
+                if comm is not self.ocomm:
+                    self.response_comms.pop(k)
+                    comm.linger_close()
+
+    @run_remotely
+    def close_comm(self):
+        r"""Close the client response comms."""
+        with self.lock:
+            for comm in self.response_comms.values():
+                if comm is not self.ocomm:
+                    comm.close()
+                    comm.disconnect()
+            self.response_comms = {}
+        super(RPCResponseDriver, self).close_comm()
+
     def send_eof(self):
         r"""Send EOF message.
 
@@ -52,9 +127,10 @@ class RPCResponseDriver(ConnectionDriver):
         """
         # Don't send EOF
         return False
-        
+
     def send_message(self, msg, **kwargs):
-        r"""Propagate the request_id.
+        r"""Propagate the request_id and send the message to the response
+        comm of the client that made the request.
 
         Args:
             msg (CommMessage): Message being sent.
@@ -64,9 +140,55 @@ class RPCResponseDriver(ConnectionDriver):
             bool: Success or failure of send.
 
         """
+        request_id = None
         if msg.header and ('request_id' in msg.header['__meta__']):
+            request_id = msg.header['__meta__']['request_id']
+            kwargs.setdefault('header_kwargs', {})
+            kwargs['header_kwargs'].setdefault('__meta__', {})
+            kwargs['header_kwargs']['__meta__'].setdefault(
+                'request_id', request_id)
+        with self.lock:
+            if request_id in self.response_routes:
+                address = self.response_routes.pop(request_id)
+            elif self.response_routes:
+                # Responses without a request_id are returned in order
+                address = self.response_routes.pop(
+                    next(iter(self.response_routes)))
+            else:
+                address = None
+            ocomm = self.response_comms.get(address, self.ocomm)
+        if ocomm is self.ocomm:
+            flag = super(RPCResponseDriver, self).send_message(msg, **kwargs)
+        else:
+            flag = self.send_response(ocomm, msg, **kwargs)
+        if flag and (self.on_response is not None):
+            self.on_response()
+        return flag
+
+    def send_response(self, ocomm, msg, **kwargs):
+        r"""Send a message to a client response comm other than the
+        primary output comm.
+
+        Args:
+            ocomm (CommBase): Client response comm.
+            msg (CommMessage): Message being sent.
+            **kwargs: Keyword arguments are passed to the comm's send_message.
+
+        Returns:
+            bool: Success or failure of send.
+
+        """
+        if (msg.header is not None) and ('model' in msg.header.get('__meta__', {})):
             kwargs.setdefault('header_kwargs', {})
             kwargs['header_kwargs'].setdefault('__meta__', {})
             kwargs['header_kwargs']['__meta__'].setdefault(
-                'request_id', msg.header['__meta__']['request_id'])
-        return super(RPCResponseDriver, self).send_message(msg, **kwargs)
+                'model', msg.header['__meta__']['model'])
+        if ocomm._send_serializer and self.icomm.serializer.initialized:
+            ocomm.update_serializer_from_message(msg)
+        kws_prepare = {k: kwargs.pop(k) for k in ocomm._prepare_message_kws
+                       if k in kwargs}
+        msg_out = ocomm.prepare_message(msg.args, **kws_prepare)
+        with self.lock:
+            flag = (not ocomm.is_closed) and ocomm.send_message(msg_out, **kwargs)
+        self.errors += ocomm.errors
+        return flag
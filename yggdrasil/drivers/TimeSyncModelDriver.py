@@ -1,11 +1,237 @@
 import os
+import heapq
+import warnings
+import bisect
+import itertools
+import numpy as np
 import pandas as pd
-from yggdrasil import units, tools, multitasking
+from yggdrasil import units
 from yggdrasil.drivers.DSLModelDriver import DSLModelDriver
 
 
 _default_agg = 'mean'
 _default_interp = 'index'
+# Interpolation methods that only depend on the points adjacent to the
+# interpolated time
+_local_interp = ['index', 'values', 'pad', 'ffill', 'bfill', 'backfill',
+                 'nearest', 'zero', 'slinear']
+# Interpolation methods implemented by pandas (others use scipy, which
+# requires at least two points)
+_pandas_interp = ['linear', 'time', 'index', 'values', 'pad', 'ffill',
+                  'bfill', 'backfill']
+# Interpolation methods that are linear in the index and can be evaluated
+# for all variables using the same weights
+_linear_interp = ['index', 'values']
+# Aggregation methods that can be applied to all variables at once
+_vector_agg = {'mean': np.nanmean, 'sum': np.nansum, 'min': np.nanmin,
+               'max': np.nanmax, 'median': np.nanmedian}
+
+
+class TimeSeriesStore(object):
+    r"""Record of the variables supplied by a model at different times
+    that is kept sorted by time so that values can be added in any order
+    and the times bracketing a requested time can be found without
+    sorting the full history.
+
+    Attributes:
+        times (list): Sorted times (as integer nanoseconds) that there
+            are values for.
+        data (dict): Mapping from variable name to a list of values for
+            the variable at each time in times.
+
+    """
+
+    def __init__(self):
+        self.times = []
+        self.data = {}
+
+    def __len__(self):
+        return len(self.times)
+
+    @property
+    def columns(self):
+        r"""list: Names of the variables in the store."""
+        return list(self.data.keys())
+
+    @property
+    def max_time(self):
+        r"""pandas.Timedelta: Latest time that there are values for. None
+        if there are not any values."""
+        if not self.times:
+            return None
+        return pd.Timedelta(self.times[-1], unit='ns')
+
+    def insert(self, time, values):
+        r"""Add values for a time, replacing any existing values for the
+        same time.
+
+        Args:
+            time (pandas.Timedelta): Time that the values are for.
+            values (dict): Mapping from variable name to value.
+
+        """
+        key = time.value
+        idx = bisect.bisect_left(self.times, key)
+        for k in values.keys():
+            if k not in self.data:
+                self.data[k] = [np.nan for _ in self.times]
+        if (idx < len(self.times)) and (self.times[idx] == key):
+            for k, v in self.data.items():
+                v[idx] = values.get(k, np.nan)
+        else:
+            self.times.insert(idx, key)
+            for k, v in self.data.items():
+                v.insert(idx, values.get(k, np.nan))
+
+    def bracket(self, time):
+        r"""Determine the indices of the values at or immediately before
+        and after a time.
+
+        Args:
+            time (pandas.Timedelta): Time to bracket.
+
+        Returns:
+            tuple(int, int): Index of the last time less than or equal to
+                time and of the first time greater than or equal to time.
+                None is returned in place of an index if there is not a
+                time satisfying the condition.
+
+        """
+        key = time.value
+        lo = bisect.bisect_right(self.times, key) - 1
+        hi = bisect.bisect_left(self.times, key)
+        if lo < 0:
+            lo = None
+        if hi >= len(self.times):
+            hi = None
+        return lo, hi
+
+    def row(self, idx):
+        r"""Get the values for all variables at a time.
+
+        Args:
+            idx (int): Index of the time in times.
+
+        Returns:
+            np.ndarray: Values for each variable in columns.
+
+        """
+        return np.array([v[idx] for v in self.data.values()], dtype='float64')
+
+    def interpolate_linear(self, time):
+        r"""Linearly interpolate the values for all variables at a time
+        using the same weights for each variable. Values after the last
+        time are filled forward and values before the first time are
+        missing, matching the 'index' interpolation method.
+
+        Args:
+            time (pandas.Timedelta): Time to get values at.
+
+        Returns:
+            np.ndarray: Values for each variable in columns. None is
+                returned if the values at the bracketing times are not
+                all numeric and present.
+
+        """
+        lo, hi = self.bracket(time)
+        if lo is None:
+            return np.full(len(self.data), np.nan)
+        try:
+            x_lo = self.row(lo)
+            if (hi is None) or (hi == lo):
+                out = x_lo
+            else:
+                x_hi = self.row(hi)
+                w = ((time.value - self.times[lo])
+                     / (self.times[hi] - self.times[lo]))
+                out = x_lo + w * (x_hi - x_lo)
+        except (TypeError, ValueError):
+            return None
+        if np.isnan(out).any():
+            return None
+        return out
+
+    def frame(self, time=None, npoints=None):
+        r"""Create a DataFrame containing values from the store.
+
+        Args:
+            time (pandas.Timedelta, optional): Time that should be included
+                in the frame, with missing values if there are not any
+                values for the time. Defaults to None.
+            npoints (int, optional): Number of points on either side of
+                time that should be included. Defaults to None and all
+                of the values are included.
+
+        Returns:
+            pandas.DataFrame: Values indexed by time.
+
+        """
+        start, stop = 0, len(self.times)
+        if (time is not None) and (npoints is not None):
+            start = max(0, bisect.bisect_left(self.times, time.value) - npoints)
+            stop = min(stop, bisect.bisect_right(self.times, time.value)
+                       + npoints)
+        times = self.times[start:stop]
+        data = {k: v[start:stop] for k, v in self.data.items()}
+        if time is not None:
+            idx = bisect.bisect_left(times, time.value)
+            if (idx == len(times)) or (times[idx] != time.value):
+                times.insert(idx, time.value)
+                for v in data.values():
+                    v.insert(idx, np.nan)
+        out = pd.DataFrame(data, columns=list(self.data.keys()))
+        out.index = pd.to_timedelta(times, unit='ns')
+        out.index.name = 'time'
+        return out
+
+
+class TimeSyncScheduler(object):
+    r"""Requests for the state at a time that are waiting on data from
+    other models, ordered by the requested time so that each request can
+    be responded to as soon as there is data from all of the models.
+
+    Attributes:
+        pending (list): Heap of pending requests ordered by time.
+
+    """
+
+    def __init__(self):
+        self.pending = []
+        self._count = itertools.count()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, time, request):
+        r"""Add a request that should be responded to once there is data
+        for a time.
+
+        Args:
+            time (pandas.Timedelta): Time that the request is for.
+            request (tuple): Information about the request.
+
+        """
+        heapq.heappush(self.pending,
+                       (time.value, next(self._count), time, request))
+
+    def pop_ready(self, available):
+        r"""Remove the requests that there is now data for.
+
+        Args:
+            available (pandas.Timedelta): Latest time that there is data
+                for from all of the models. If None, no requests are ready.
+
+        Returns:
+            list: Time and information for the ready requests in the order
+                of the requested time.
+
+        """
+        out = []
+        if available is None:
+            return out
+        while self.pending and (self.pending[0][0] <= available.value):
+            out.append(heapq.heappop(self.pending)[2:])
+        return out
 
 
 class TimeSyncModelDriver(DSLModelDriver):
@@ -157,23 +383,22 @@ class TimeSyncModelDriver(DSLModelDriver):
         if env is not None:
             os.environ.update(env)
         rpc = YggTimesyncServer(name)
-        threads = {}
-        times = []
+        scheduler = TimeSyncScheduler()
         tables = {}
         table_units = {'base': {}}
-        table_lock = multitasking.RLock()
         default_agg = _default_agg
         if not isinstance(aggregation, dict):
             default_agg = aggregation
             aggregation = {}
         while True:
-            # Check for errors on response threads
-            for v in threads.values():
-                if v.check_flag_attr('error_flag'):  # pragma: debug
-                    for v in threads.values():
-                        if v.is_alive():
-                            v.terminate()
-                    raise Exception("Error on response thread.")
+            # Respond to requests that there is now data for. Don't start
+            # sampling until all clients have connected
+            if scheduler and rpc.all_clients_connected:
+                available = cls.available_time(tables, table_units,
+                                               rpc.open_clients)
+                for t_req, request in scheduler.pop_ready(available):
+                    cls.respond(rpc, t_req, *request, tables, table_units,
+                                synonyms, interpolation, aggregation)
             # Receive values from client models
             flag, values, request_id = rpc.recv_from(timeout=1.0,
                                                      quiet_timeout=True)
@@ -181,7 +406,6 @@ class TimeSyncModelDriver(DSLModelDriver):
                 print("timesync server: End of input.")
                 break
             if len(values) == 0:
-                rpc.sleep()
                 continue
             t, state = values[:]
             t_pd = units.convert_to_pandas_timedelta(t)
@@ -193,116 +417,105 @@ class TimeSyncModelDriver(DSLModelDriver):
                 state.pop(k, None)
             internal_variables = list(state.keys())
             # Update record
-            with table_lock:
-                if client_model not in tables:
-                    tables[client_model] = pd.DataFrame({'time': times})
-                # Update units & aggregation methods
-                if client_model not in table_units:
-                    # NOTE: this assumes that units will not change
-                    # between timesteps for a single model. Is there a
-                    # case where this might not be true?
-                    table_units[client_model] = {
-                        k: units.get_units(v) for k, v in state.items()}
-                    table_units[client_model]['time'] = units.get_units(t)
-                    alt_vars = []
-                    for k, v in synonyms.get(client_model, {}).items():
-                        alt_vars += v['alt']
-                        if v['alt2base'] is not None:
-                            table_units[client_model][k] = units.get_units(
-                                v['alt2base'](*[state[a] for a in v['alt']]))
-                        else:
-                            table_units[client_model][k] = table_units[
-                                client_model][v['alt'][0]]
-                    for k, v in table_units[client_model].items():
-                        table_units['base'].setdefault(k, v)
-                    for k in list(set(state.keys()) - set(alt_vars)):
-                        aggregation.setdefault(k, default_agg)
-                # Update the state
-                if t_pd not in times:
-                    times.append(t_pd)
-                for model, table in tables.items():
-                    new_data = {'time': [t_pd]}
-                    if model == client_model:
-                        new_data.update({k: [units.get_data(v)]
-                                         for k, v in state.items()})
-                    new_data = pd.DataFrame(new_data)
-                    idx = table['time'].isin([t_pd])
-                    if not idx.any():
-                        table = pd.concat([table, new_data], sort=False)
-                    elif model == client_model:
-                        table = table.drop(table.index[idx])
-                        table = pd.concat([table, new_data], sort=False)
-                    tables[model] = table.sort_values('time')
-            # Assign thread to handle checking when data is filled in
-            threads[request_id] = multitasking.YggTaskLoop(
-                target=cls.response_loop,
-                args=(client_model, request_id, rpc, t_pd,
-                      internal_variables, external_variables,
-                      tables, table_units, table_lock,
-                      synonyms, interpolation, aggregation))
-            threads[request_id].start()
-        # Cleanup threads (only called if there is an error since the
-        # loop will only be broken when all of the clients have signed
-        # off, implying that all requests have been responded to).
-        for v in threads.values():
-            if v.is_alive():  # pragma: debug
-                v.wait(0.5)
-        for v in threads.values():
-            if v.is_alive():  # pragma: debug
-                v.terminate()
+            if client_model not in tables:
+                tables[client_model] = TimeSeriesStore()
+            # Update units & aggregation methods
+            if client_model not in table_units:
+                # NOTE: this assumes that units will not change
+                # between timesteps for a single model. Is there a
+                # case where this might not be true?
+                table_units[client_model] = {
+                    k: units.get_units(v) for k, v in state.items()}
+                table_units[client_model]['time'] = units.get_units(t)
+                alt_vars = []
+                for k, v in synonyms.get(client_model, {}).items():
+                    alt_vars += v['alt']
+                    if v['alt2base'] is not None:
+                        table_units[client_model][k] = units.get_units(
+                            v['alt2base'](*[state[a] for a in v['alt']]))
+                    else:
+                        table_units[client_model][k] = table_units[
+                            client_model][v['alt'][0]]
+                for k, v in table_units[client_model].items():
+                    table_units['base'].setdefault(k, v)
+                for k in list(set(state.keys()) - set(alt_vars)):
+                    aggregation.setdefault(k, default_agg)
+            # Update the state
+            tables[client_model].insert(
+                t_pd, {k: units.get_data(v) for k, v in state.items()})
+            # Defer the response until there is data from all clients
+            scheduler.add(t_pd, (client_model, request_id,
+                                 internal_variables, external_variables))
 
     @classmethod
-    def check_for_data(cls, time, tables, table_units, table_lock,
-                       open_clients):
+    def available_time(cls, tables, table_units, open_clients):
+        r"""Determine the latest time that there is data for from all of
+        the clients that are still open.
+
+        Args:
+            tables (dict): Mapping from model name to TimeSeriesStore
+                containing variables supplied by the model.
+            table_units (dict): Mapping from model name to dictionaries
+                mapping from variable names to units.
+            open_clients (list): Clients that are still open.
+
+        Returns:
+            pandas.Timedelta: Latest time that there is data for. None
+                if there is not data from one or more open clients.
+
+        """
+        out = pd.Timedelta.max
+        for k in open_clients:
+            if (k not in table_units) or (k not in tables):
+                return None
+            kmax = tables[k].max_time
+            if kmax is None:  # pragma: debug
+                return None
+            out = min(out, kmax)
+        return out
+
+    @classmethod
+    def check_for_data(cls, time, tables, table_units, open_clients):
         r"""Check for a time in the tables to determine if there is
         sufficient data available to calculate the state.
 
         Args:
             time (pandas.Timedelta): Time that state is requested at.
-            tables (dict): Mapping from model name to pandas DataFrames
+            tables (dict): Mapping from model name to TimeSeriesStore
                 containing variables supplied by the model.
             table_units (dict): Mapping from model name to dictionaries
                 mapping from variable names to units.
-            table_lock (RLock): Thread-safe lock for accessing table.
             open_clients (list): Clients that are still open.
 
         Returns:
             bool: True if there is sufficient data, False otherwise.
 
         """
-        with table_lock:
-            for k, v in tables.items():
-                if (k in open_clients) and (time > max(v.dropna()['time'])):
-                    return False
-            for k in open_clients:
-                if k not in table_units:  # pragma: debug
-                    return False
-        return True
+        available = cls.available_time(tables, table_units, open_clients)
+        return (available is not None) and (time <= available)
 
     @classmethod
-    def response_loop(cls, client_model, request_id, rpc, time,
-                      internal_variables, external_variables,
-                      tables, table_units, table_lock,
-                      synonyms, interpolation, aggregation):
-        r"""Check for available data and send response if it is
-        available.
+    def respond(cls, rpc, time, client_model, request_id,
+                internal_variables, external_variables,
+                tables, table_units, synonyms, interpolation, aggregation):
+        r"""Send the response to a request once there is data available
+        from all of the clients for the requested time.
 
         Args:
+            rpc (ServerComm): Server RPC comm that should be used to
+                reply to the request.
+            time (pandas.Timedelta): Time to get variables at.
             client_model (str): Name of model that made the request.
             request_id (str): ID associated with request that should
                 be responded to.
-            rpc (ServerComm): Server RPC comm that should be used to
-                reply to the request when the data is available.
-            time (pandas.Timedelta): Time to get variables at.
             internal_variables (list): Variables that model is requesting
                 that it also calculates.
             external_variables (list): Variables that model is requesting
                 that will be provided by other models.
-            tables (dict): Mapping from model name to pandas DataFrames
+            tables (dict): Mapping from model name to TimeSeriesStore
                 containing variables supplied by the model.
             table_units (dict): Mapping from model name to dictionaries
                 mapping from variable names to units.
-            table_lock (RLock): Thread-safe lock for accessing table.
             synonyms (dict): Dictionary mapping from base variables to
                 alternate variables and mapping functions used to convert
                 between the variables. Defaults to empty dict and no
@@ -314,15 +527,11 @@ class TimeSyncModelDriver(DSLModelDriver):
                 aggregation method that should be used. Defaults to
                 empty dictionary.
 
+        Raises:
+            RuntimeError: If the response could not be sent.
+
         """
-        if not (rpc.all_clients_connected
-                and cls.check_for_data(time, tables, table_units, table_lock,
-                                       rpc.open_clients)):
-            # Don't start sampling until all clients have connected
-            # and there is data available for the requested timestep
-            tools.sleep(1.0)
-            return
-        tot = cls.merge(tables, table_units, table_lock, rpc.open_clients,
+        tot = cls.merge(time, tables, table_units, rpc.open_clients,
                         synonyms, interpolation, aggregation)
         # Update external units
         for k in external_variables:
@@ -330,10 +539,11 @@ class TimeSyncModelDriver(DSLModelDriver):
                 table_units[client_model][k] = table_units['base'][k]
         # Check if data is available at the desired timestep?
         # Convert units
-        for k in tot.columns:
-            funits = units.get_conversion_function(table_units['base'][k],
-                                                   table_units[client_model][k])
-            tot[k] = tot[k].apply(funits)
+        converted = cls.convert_units(
+            {k: tot[k].iloc[0] for k in tot.columns},
+            table_units['base'], table_units[client_model])
+        tot = pd.DataFrame({k: [v] for k, v in converted.items()},
+                           index=tot.index)
         # Transform back to variables expected by the model
         for kbase, alt in synonyms.get(client_model, {}).items():
             if alt['base2alt'] is not None:
@@ -360,19 +570,143 @@ class TimeSyncModelDriver(DSLModelDriver):
                                 "request %s for time %s from "
                                 "model %s.")
                                % (request_id, time_u, client_model))
-        raise multitasking.BreakLoopException
     
     @classmethod
-    def merge(cls, tables, table_units, table_lock, open_clients,
+    def convert_units(cls, values, old_units, new_units):
+        r"""Convert the units of several variables, converting all of the
+        variables that only require a scale and offset in a single
+        vectorized operation.
+
+        Args:
+            values (dict): Mapping from variable name to value.
+            old_units (dict): Mapping from variable name to the current
+                units of the variable.
+            new_units (dict): Mapping from variable name to the units the
+                variable should be converted to.
+
+        Returns:
+            dict: Mapping from variable name to converted value.
+
+        """
+        out = dict(values)
+        keys = list(values.keys())
+        factors = [units.get_conversion_factors(old_units[k], new_units[k])
+                   for k in keys]
+        affine = [i for i, f in enumerate(factors) if f is not None]
+        try:
+            x = np.array([values[keys[i]] for i in affine], dtype='float64')
+        except (TypeError, ValueError):  # pragma: debug
+            affine = []
+        if affine:
+            scale = np.array([factors[i][0] for i in affine])
+            offset = np.array([factors[i][1] for i in affine])
+            x = x * scale + offset
+            for j, i in enumerate(affine):
+                out[keys[i]] = x[j]
+        for i, k in enumerate(keys):
+            if i not in affine:
+                funits = units.get_conversion_function(old_units[k],
+                                                       new_units[k])
+                out[k] = funits(values[k])
+        return out
+
+    @classmethod
+    def interpolate(cls, time, store, kws):
+        r"""Interpolate the values of all variables in a store at a time.
+
+        Args:
+            time (pandas.Timedelta): Time to get variables at.
+            store (TimeSeriesStore): Values supplied by a model.
+            kws (dict): Interpolation keyword arguments.
+
+        Returns:
+            dict: Mapping from variable name to value at the time.
+
+        """
+        if ((kws['method'] in _linear_interp)
+                and (set(kws.keys()) <= set(['method', 'limit_area']))
+                and (kws.get('limit_area', None) is None)):
+            out = store.interpolate_linear(time)
+            if out is not None:
+                return dict(zip(store.columns, out))
+        # Only the points adjacent to the requested time are needed
+        # for local interpolation methods
+        npoints = None
+        if kws['method'] in _local_interp:
+            npoints = 1
+        v = store.frame(time=time, npoints=npoints)
+        if (npoints is not None) and (v.count().min() < 2):
+            # Windows at the edge of the data (e.g. extrapolation) may
+            # not have enough points for scipy based methods
+            v = store.frame(time=time)
+        pos = v.index.get_loc(time)
+        if 'order' in kws:
+            kws['order'] = min(v.dropna().shape[0] - 1, kws['order'])
+            if kws['order'] == 0:
+                kws.pop('order')
+                kws['method'] = _default_interp
+        # Cannot interpolate on pandas timedelta as of pandas 1.0.1
+        v.index = v.index.total_seconds()
+        if kws['method'] in _pandas_interp:
+            v = v.interpolate(**kws)
+        else:
+            cols = v.columns[v.count() >= 2]
+            v[cols] = v[cols].interpolate(**kws)
+        return v.iloc[pos].to_dict()
+
+    @classmethod
+    def aggregate(cls, time, samples, aggregation):
+        r"""Aggregate variables across models.
+
+        Args:
+            time (pandas.Timedelta): Time that the variables are for.
+            samples (list): Mappings from variable name to value for each
+                model.
+            aggregation (dict): Mapping from variable name to the
+                aggregation method that should be used.
+
+        Returns:
+            pandas.DataFrame: Aggregated variables at the time.
+
+        """
+        index = pd.TimedeltaIndex([time], name='time')
+        out = {}
+        other = {}
+        by_method = {}
+        for k, method in aggregation.items():
+            if isinstance(method, str) and (method in _vector_agg):
+                by_method.setdefault(method, []).append(k)
+            else:
+                other[k] = method
+        for method, keys in by_method.items():
+            x = np.array([[s.get(k, np.nan) for k in keys] for s in samples],
+                         dtype='float64')
+            with warnings.catch_warnings():
+                # All NaN columns result in NaN with a warning
+                warnings.simplefilter('ignore', category=RuntimeWarning)
+                res = _vector_agg[method](x, axis=0)
+            out.update(zip(keys, res))
+        if other:
+            x = pd.DataFrame([{k: s.get(k, np.nan) for k in other}
+                              for s in samples],
+                             index=[time for _ in samples])
+            x.index.name = 'time'
+            res = x.groupby('time').agg(other)
+            out.update({k: res[k].iloc[0] for k in res.columns})
+        return pd.DataFrame({k: [out[k]] for k in aggregation.keys()
+                             if k in out}, index=index)
+
+    @classmethod
+    def merge(cls, time, tables, table_units, open_clients,
               synonyms, interpolation, aggregation):
-        r"""Merge tables from models to get data.
+        r"""Merge tables from models to get data at a time.
 
         Args:
-            tables (dict): Mapping from model name to pandas DataFrames
+            time (pandas.Timedelta): Time to get variables at.
+            tables (dict): Mapping from model name to TimeSeriesStore
                 containing variables supplied by the model.
             table_units (dict): Mapping from model name to dictionaries
                 mapping from variable names to units.
-            table_lock (RLock): Thread-safe lock for accessing table.
             open_clients (list): Clients that are still open.
             synonyms (dict): Dictionary mapping from base variables to
                 alternate variables and mapping functions used to convert
@@ -385,6 +719,8 @@ class TimeSyncModelDriver(DSLModelDriver):
                 aggregation method that should be used. Defaults to
                 empty dictionary.
 
+        Returns:
+            pandas.DataFrame: Merged variables at the requested time.
 
         """
         # Adjust input arguments
@@ -392,50 +728,27 @@ class TimeSyncModelDriver(DSLModelDriver):
         if 'method' in interpolation:
             interp_default = interpolation
             interpolation = {}
-        # Interpolate
-        table_temp = {}
-        with table_lock:
-            for k, v in tables.items():
-                kws = interpolation.get(k, interp_default).copy()
-                if k not in open_clients:
-                    # Ensure that clients that have signed off are
-                    # extrapolated, otherwise they would never produce
-                    # valid data
-                    kws['limit_area'] = None
-                if 'order' in kws:
-                    kws['order'] = min(v.dropna().shape[0] - 1,
-                                       kws['order'])
-                    if kws['order'] == 0:
-                        kws.pop('order')
-                        kws.update(interp_default)
-                v = v.set_index('time')
-                # Cannot interpolate on pandas timedelta as of pandas 1.0.1
-                ind = v.index
-                v.index = v.index.total_seconds()
-                table_temp[k] = v.interpolate(**kws)
-                table_temp[k].index = ind
-        # Rename + transformation
-        for model, v in table_temp.items():
+        samples = []
+        for model, store in tables.items():
+            # Interpolate
+            kws = interpolation.get(model, interp_default).copy()
+            if model not in open_clients:
+                # Ensure that clients that have signed off are
+                # extrapolated, otherwise they would never produce
+                # valid data
+                kws['limit_area'] = None
+            v = cls.interpolate(time, store, kws)
+            # Rename + transformation
             drop = []
             for kbase, alt in synonyms.get(model, {}).items():
                 if alt['alt2base'] is not None:
-                    args = [v[k] for k in alt['alt']]
-                    v[kbase] = alt['alt2base'](*args)
+                    v[kbase] = alt['alt2base'](*[v[k] for k in alt['alt']])
                 else:
                     v[kbase] = v[alt['alt'][0]]
                 drop += alt['alt']
             for k in drop:
-                v = v.drop(k, axis=1)
+                v.pop(k, None)
             # Units
-            for k in v.columns:
-                funits = units.get_conversion_function(table_units[model][k],
-                                                       table_units['base'][k])
-                v[k] = v[k].apply(funits)
-            table_temp[model] = v
-        # Append
-        out = pd.DataFrame()
-        for k, v in table_temp.items():
-            out = pd.concat([out, v], sort=False)
-        # Groupby + aggregate
-        out = out.groupby('time').agg(aggregation)
-        return out
+            samples.append(cls.convert_units(v, table_units[model],
+                                             table_units['base']))
+        return cls.aggregate(time, samples, aggregation)
@@ -180,10 +180,13 @@ def YggRpcClient(name, outfmt=None, infmt=None, **kwargs):
             message sent to the request queue. Defautls to '%s'.
         infmt (str, optional): Format string used to recover variables from
             messages received from the response queue. Defautls to '%s'.
-        **kwargs: Additional keyword arguments are passed to InterfaceComm.
+        **kwargs: Additional keyword arguments are passed to InterfaceComm
+            (e.g. max_outstanding to limit the number of requests sent via
+            call_async/call_many that can await a response at once).
 
     Returns:
-        :class:.ClientComm: Communication object.
+        :class:.ClientComm: Communication object. In addition to call,
+            call_async and call_many can be used to pipeline requests.
         
     """
     from yggdrasil.communication import ClientComm
@@ -6,8 +6,10 @@ import weakref
 import logging
 import threading
 import queue
+import selectors
 import multiprocessing
 import asyncio
+from collections import OrderedDict
 from yggdrasil.tools import YggClass, sleep
 MPI = None
 _on_mpi = False
@@ -1367,6 +1369,275 @@ class MPIErrorExchange(object):
 #         self[key] = self._dict_refs[key]
 
 
+class TaskNotifier(object):
+    r"""Notification primitive shared by tasks to signal that they have
+    completed or encountered an error so that a single waiter can block
+    until the next change and react to exactly the tasks that changed.
+    Notifications are only delivered from tasks running as threads in the
+    process that created the notifier."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending = OrderedDict()
+
+    def notify(self, name, event='complete'):
+        r"""Record an event for a task and wake any waiters.
+
+        Args:
+            name (str): Name of the task that changed.
+            event (str, optional): Type of event. Defaults to 'complete'.
+
+        """
+        with self._cond:
+            self._pending.setdefault(name, [])
+            if event not in self._pending[name]:
+                self._pending[name].append(event)
+            self._cond.notify_all()
+
+    def wait(self, timeout=None):
+        r"""Wait for tasks to report events.
+
+        Args:
+            timeout (float, optional): Maximum time that should be waited
+                for an event. Defaults to None and is infinite.
+
+        Returns:
+            OrderedDict: Events reported since the last call keyed by task
+                name. Empty if the timeout was reached.
+
+        """
+        with self._cond:
+            if not self._pending:
+                self._cond.wait(timeout)
+            out = self._pending
+            self._pending = OrderedDict()
+        return out
+
+
+class OutputHandle(object):
+    r"""Handle for a stream registered with an OutputMultiplexer that
+    mimics the portion of the task API (is_alive, wait, join,
+    set_break_flag, was_break) used to manage output forwarding threads.
+
+    Args:
+        multiplexer (OutputMultiplexer): Multiplexer reading the stream.
+        stream (file): File object that output is read from.
+        callback (callable): Function called with each chunk of bytes
+            read from the stream and with an empty bytes string once the
+            stream is closed.
+        name (str, optional): Name used in log messages. Defaults to
+            None.
+
+    """
+
+    def __init__(self, multiplexer, stream, callback, name=None):
+        self.multiplexer = multiplexer
+        self.stream = stream
+        self.callback = callback
+        self.name = name
+        self.was_break = False
+        self._done = threading.Event()
+
+    def is_alive(self):
+        r"""bool: True if the stream is still being read."""
+        return not self._done.is_set()
+
+    def wait(self, timeout=None):
+        r"""Wait for the stream to be closed.
+
+        Args:
+            timeout (float, optional): Maximum time that should be
+                waited. Defaults to None and is infinite.
+
+        Returns:
+            bool: True if the stream was closed, False otherwise.
+
+        """
+        return self._done.wait(timeout)
+
+    def join(self, timeout=None):
+        r"""Alias for wait."""
+        self.wait(timeout)
+
+    def set_break_flag(self):
+        r"""Stop reading from the stream without closing it."""
+        self.was_break = True
+        self.multiplexer.unregister(self)
+
+    def finish(self, data=b''):
+        r"""Pass the final chunk to the callback and mark the handle as
+        complete.
+
+        Args:
+            data (bytes, optional): Final chunk. Defaults to an empty
+                bytes string, which signals the end of the output.
+
+        """
+        try:
+            self.callback(data)
+        except BaseException:  # pragma: debug
+            logger.exception("Error in output callback for %s" % self.name)
+        finally:
+            self._done.set()
+
+
+class OutputMultiplexer(object):
+    r"""Reader that forwards output from many streams (e.g. the stdout
+    pipes of model processes) from a single thread. Streams are switched
+    to non-blocking mode and registered with a selector so that output is
+    forwarded in chunks as soon as it is available and the end of a
+    stream is detected as soon as the pipe is closed. The thread is
+    started when the first stream is registered and exits once there are
+    no streams left.
+
+    Args:
+        chunk_size (int, optional): Maximum number of bytes read from a
+            stream at a time. Defaults to 65536.
+
+    """
+
+    supported = (os.name != 'nt')
+
+    def __init__(self, chunk_size=65536):
+        self.chunk_size = chunk_size
+        self.pid = os.getpid()
+        self._lock = threading.RLock()
+        self._handles = {}
+        self._selector = None
+        self._thread = None
+        self._wakeup = None
+
+    def register(self, stream, callback, name=None):
+        r"""Start forwarding output from a stream.
+
+        Args:
+            stream (file): File object with a fileno that output should
+                be read from.
+            callback (callable): Function called with each chunk of
+                bytes and with an empty bytes string once the stream is
+                closed.
+            name (str, optional): Name used in log messages. Defaults to
+                None.
+
+        Returns:
+            OutputHandle: Handle for the registered stream.
+
+        """
+        handle = OutputHandle(self, stream, callback, name=name)
+        fd = stream.fileno()
+        os.set_blocking(fd, False)
+        with self._lock:
+            if self._thread is None:
+                self._selector = selectors.DefaultSelector()
+                self._wakeup = os.pipe()
+                os.set_blocking(self._wakeup[0], False)
+                self._selector.register(self._wakeup[0], selectors.EVENT_READ)
+                self._thread = SafeThread(target=self._run_loop,
+                                          name='YggOutputMultiplexer')
+                self._thread.daemon = True
+                self._thread.start()
+            self._handles[fd] = handle
+            self._selector.register(fd, selectors.EVENT_READ, handle)
+            self._wake()
+        return handle
+
+    def unregister(self, handle):
+        r"""Stop forwarding output from a stream.
+
+        Args:
+            handle (OutputHandle): Handle returned by register.
+
+        """
+        with self._lock:
+            for fd, x in list(self._handles.items()):
+                if x is handle:
+                    self._remove(fd)
+                    self._wake()
+                    break
+        handle._done.set()
+
+    def _wake(self):
+        r"""Interrupt the selector so that registration changes are seen."""
+        try:
+            os.write(self._wakeup[1], b'\0')
+        except BlockingIOError:  # pragma: debug
+            pass
+
+    def _remove(self, fd):
+        r"""Remove a file descriptor from the selector."""
+        self._handles.pop(fd, None)
+        try:
+            self._selector.unregister(fd)
+        except (KeyError, ValueError):  # pragma: debug
+            pass
+
+    def _shutdown(self):
+        r"""Close the selector and wakeup pipe if there are no streams.
+
+        Returns:
+            bool: True if the thread should exit, False otherwise.
+
+        """
+        with self._lock:
+            if self._handles:
+                return False
+            self._selector.close()
+            for fd in self._wakeup:
+                os.close(fd)
+            self._selector = None
+            self._wakeup = None
+            self._thread = None
+        return True
+
+    def _run_loop(self):
+        r"""Forward output from registered streams until none remain."""
+        while not self._shutdown():
+            for key, _ in self._selector.select():
+                handle = key.data
+                if handle is None:
+                    try:
+                        os.read(key.fd, self.chunk_size)
+                    except BlockingIOError:  # pragma: debug
+                        pass
+                    continue
+                if handle.was_break:  # pragma: debug
+                    continue
+                try:
+                    data = os.read(key.fd, self.chunk_size)
+                except BlockingIOError:  # pragma: debug
+                    continue
+                except OSError:  # pragma: debug
+                    data = b''
+                if data:
+                    try:
+                        handle.callback(data)
+                    except BaseException:  # pragma: debug
+                        logger.exception("Error in output callback for %s"
+                                         % handle.name)
+                    continue
+                with self._lock:
+                    self._remove(key.fd)
+                handle.finish()
+
+
+_output_multiplexer = None
+
+
+def get_output_multiplexer():
+    r"""Get the output multiplexer for the current process, creating it
+    if it does not exist or was inherited from a parent process.
+
+    Returns:
+        OutputMultiplexer: Multiplexer for the current process.
+
+    """
+    global _output_multiplexer
+    if ((_output_multiplexer is None
+         or _output_multiplexer.pid != os.getpid())):
+        _output_multiplexer = OutputMultiplexer()
+    return _output_multiplexer
+
+
 class YggTask(YggClass):
     r"""Class for managing Ygg thread/process."""
 
@@ -1397,7 +1668,7 @@ class YggTask(YggClass):
             self.in_process = True
         process_kwargs = dict(
             name=name, group=group, daemon=daemon,
-            target=self.run)
+            target=self.run_task)
         self.process_instance = self.context.Task(**process_kwargs)
         self._ygg_target = target
         self._ygg_args = args
@@ -1407,6 +1678,7 @@ class YggTask(YggClass):
         self.create_flag_attr('start_flag')
         self.create_flag_attr('terminate_flag')
         self._calling_thread = None
+        self._notifiers = []
         self.state = ''
         super(YggTask, self).__init__(name, **ygg_kwargs)
         if not self.as_process:
@@ -1420,8 +1692,29 @@ class YggTask(YggClass):
         out = super(YggTask, self).__getstate__()
         out.pop('_input_args', None)
         out.pop('_input_kwargs', None)
+        out['_notifiers'] = []
         return out
 
+    def add_notifier(self, notifier):
+        r"""Add a notifier that should be signaled when the task completes
+        or encounters an error.
+
+        Args:
+            notifier (TaskNotifier): Notifier.
+
+        """
+        self._notifiers.append(notifier)
+
+    def notify(self, event='complete'):
+        r"""Signal an event to any notifiers.
+
+        Args:
+            event (str, optional): Type of event. Defaults to 'complete'.
+
+        """
+        for x in getattr(self, '_notifiers', []):
+            x.notify(self.name, event)
+
     def atexit(self):  # pragma: debug
         r"""Actions performed when python exits."""
         if self.is_alive():
@@ -1482,6 +1775,13 @@ class YggTask(YggClass):
         starting the thread/process."""
         self.debug('')
 
+    def run_task(self, *args, **kwargs):
+        r"""Run the task and signal notifiers when it completes."""
+        try:
+            self.run(*args, **kwargs)
+        finally:
+            self.notify('complete')
+
     def run(self, *args, **kwargs):
         r"""Continue running until terminate event set."""
         self.debug("Starting method")
@@ -1514,6 +1814,7 @@ class YggTask(YggClass):
         r"""Actions to perform on error in try/except wrapping run."""
         self.exception("%s ERROR", self.context.task_method.upper())
         self.set_flag_attr('error_flag')
+        self.notify('error')
 
     def run_finally(self):
         r"""Actions to perform in finally clause of try/except wrapping
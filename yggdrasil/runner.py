@@ -8,13 +8,15 @@ import atexit
 from pprint import pformat
 from itertools import chain
 import socket
+import threading
 from collections import OrderedDict
+from yggdrasil import tools
 from yggdrasil.tools import YggClass
 from yggdrasil.config import ygg_cfg, cfg_environment, temp_config
 from yggdrasil import platform, yamlfile
 from yggdrasil.drivers import create_driver
 from yggdrasil.components import import_component
-from yggdrasil.multitasking import MPI
+from yggdrasil.multitasking import MPI, TaskNotifier
 from yggdrasil.drivers.DuplicatedModelDriver import DuplicatedModelDriver
 from yggdrasil.drivers.ModelDriver import ModelDriver
 
@@ -273,6 +275,10 @@ class YggRunner(YggClass):
             be disabled. Defaults to False.
         with_asan (bool, optional): Compile and run all models with the
             address sanitizer. Defaults to False.
+        startup_workers (int, optional): Maximum number of threads that
+            should be used to create and start drivers concurrently.
+            Defaults to None and the ThreadPoolExecutor default is used. If
+            1, drivers are created and started serially.
 
     Attributes:
         namespace (str): Name that should be used to uniquely identify any
@@ -283,10 +289,14 @@ class YggRunner(YggClass):
         connectiondrivers (dict): Connection drivers for this run.
         interrupt_time (float): Time of last interrupt signal.
         error_flag (bool): True if one or more models raises an error.
+        notifier (TaskNotifier): Notifier that drivers signal when they
+            complete or encounter an error.
 
     ..todo:: namespace, host, and rank do not seem strictly necessary.
 
     """
+    wait_poll_interval = 1.0
+
     def __init__(self, modelYmls, namespace=None, host=None, rank=0,
                  ygg_debug_level=None, rmq_debug_level=None,
                  ygg_debug_prefix=None, connection_task_method='thread',
@@ -294,7 +304,7 @@ class YggRunner(YggClass):
                  partial_commtype=None, production_run=False,
                  mpi_tag_start=None, yaml_param=None, validate=False,
                  with_debugger=None, disable_python_c_api=False,
-                 with_asan=False):
+                 with_asan=False, startup_workers=None):
         kwargs_models = {'with_debugger': with_debugger,
                          'disable_python_c_api': disable_python_c_api,
                          'with_asan': with_asan}
@@ -328,6 +338,9 @@ class YggRunner(YggClass):
         self.complete_partial = complete_partial
         self.partial_commtype = partial_commtype
         self.validate = validate
+        self.startup_workers = startup_workers
+        self._env_lock = threading.RLock()
+        self.notifier = TaskNotifier()
         self.debug("Running in %s with path %s namespace %s rank %d",
                    os.getcwd(), sys.path, namespace, rank)
         # Update environment based on config
@@ -508,6 +521,7 @@ class YggRunner(YggClass):
                 kwargs = dict(yml, **kwargs)
                 instance = create_driver(yml=yml, namespace=self.namespace,
                                          rank=self.rank, **kwargs)
+            instance.add_notifier(self.notifier)
             yml['instance'] = instance
         finally:
             os.chdir(curpath)
@@ -608,6 +622,38 @@ class YggRunner(YggClass):
                     if yml['driver'].startswith('RPC'):
                         x['pattern'] = 'cycle'
 
+    def get_model_location(self, name, for_service=False):
+        r"""Determine where a model will run relative to the connection
+        drivers on this process.
+
+        Args:
+            name (str): Name of the model.
+            for_service (bool, optional): If True, the model's comms will be
+                accessed by a remote client via a service. Defaults to False.
+
+        Returns:
+            str: 'process' if the model's comms will be created in this
+                process (e.g. a dummy model used by YggFunction), 'host' if
+                the model runs in another process on this host, 'remote' if
+                the model runs on another host, and None if the model is
+                unknown.
+
+        """
+        if (name not in self.modelcopies) and (name not in self.modeldrivers):
+            return None
+        locations = ['process', 'host', 'remote']
+        out = 0
+        for x in self.get_models(name):
+            if ((for_service or (self.mpi_comm
+                                 and x.get('mpi_rank', self.rank) != self.rank))):
+                out = max(out, 2)
+            elif ((x.get('driver', None) == 'DummyModelDriver'
+                   and self.connection_task_method != 'process')):
+                out = max(out, 0)
+            else:
+                out = max(out, 1)
+        return locations[out]
+
     def create_connection_driver(self, yml):
         r"""Create a connection driver instance from the yaml information.
 
@@ -619,18 +665,97 @@ class YggRunner(YggClass):
 
         """
         yml['task_method'] = self.connection_task_method
+        for x in yml.get('inputs', []) + yml.get('outputs', []):
+            if isinstance(x, dict) and x.get('partner_model', None):
+                location = self.get_model_location(
+                    x['partner_model'], for_service=x.get('for_service', False))
+                if location is not None:
+                    x.setdefault('partner_location', location)
         drv = self.create_driver(yml)
         # Transfer connection addresses to model via env
         # TODO: Change to server that tracks connections
-        for model, env in drv.model_env.items():
-            env_key = 'env'
-            if (model not in self.modelcopies) and (model not in self.modeldrivers):
-                env_key = 'env_%s' % model
-            for x in self.get_models(model):
-                x.setdefault(env_key, {})
-                x[env_key].update(env)
+        with self._env_lock:
+            for model, env in drv.model_env.items():
+                env_key = 'env'
+                if ((model not in self.modelcopies)
+                        and (model not in self.modeldrivers)):
+                    env_key = 'env_%s' % model
+                for x in self.get_models(model):
+                    x.setdefault(env_key, {})
+                    x[env_key].update(env)
+        return drv
+
+    def create_model_driver(self, yml):
+        r"""Create a model driver instance from the yaml information.
+
+        Args:
+            yml (yaml): Yaml object containing driver information.
+
+        Returns:
+            object: An instance of the specified driver.
+
+        """
+        drv = self.create_driver(yml)
+        self.debug("Model %s:, env: %s", yml['name'], pformat(drv.env))
         return drv
 
+    def run_drivers(self, drivers, method, graph=None, action='created',
+                    break_cycles=False):
+        r"""Call a method for a set of drivers concurrently.
+
+        Args:
+            drivers (dict): Driver yamls keyed by name.
+            method (callable): Method that should be called with each
+                driver yaml.
+            graph (dict, optional): Mapping between driver names and the
+                names of drivers that must be processed before them.
+                Defaults to None and drivers are independent.
+            action (str, optional): Action used in the log message if the
+                method raises an error. Defaults to 'created'.
+            break_cycles (bool, optional): If True, drivers in a dependency
+                cycle are processed one at a time instead of raising an
+                error. Defaults to False.
+
+        """
+        if graph is None:
+            graph = {k: [] for k in drivers.keys()}
+
+        def call(name):
+            try:
+                return method(drivers[name])
+            except BaseException as e:
+                self.error("%s could not be %s: %s(%s)",
+                           name, action, type(e), e)
+                raise
+
+        tools.run_task_graph(graph, call, nproc=self.startup_workers,
+                             break_cycles=break_cycles)
+
+    def create_drivers(self, drivers, method):
+        r"""Create a set of drivers concurrently. Drivers are created in
+        their working directory so drivers with the same working directory
+        are created together.
+
+        Args:
+            drivers (dict): Driver yamls keyed by name.
+            method (callable): Method that should be used to create each
+                driver from its yaml.
+
+        """
+        groups = OrderedDict()
+        for k, v in drivers.items():
+            if v.get('working_dir', None):
+                v['working_dir'] = os.path.abspath(v['working_dir'])
+            groups.setdefault(v.get('working_dir', None), OrderedDict())
+            groups[v.get('working_dir', None)][k] = v
+        curpath = os.getcwd()
+        try:
+            for wd, group in groups.items():
+                os.chdir(wd if wd else curpath)
+                self.run_drivers(group, method)
+        finally:
+            os.chdir(curpath)
+
     def distribute_mpi(self):
         r"""Distribute models between MPI processes."""
         size = self.mpi_comm.Get_size()
@@ -752,7 +877,8 @@ class YggRunner(YggClass):
         
     def loadDrivers(self):
         r"""Load all of the necessary drivers, doing the IO drivers first
-        and adding IO driver environmental variables back tot he models."""
+        and adding IO driver environmental variables back tot he models.
+        Drivers of each type are created concurrently."""
         self.debug('')
         driver = dict(name='name')
         try:
@@ -765,19 +891,21 @@ class YggRunner(YggClass):
                 driver_cls.preparse_function(driver)
             if self.mpi_comm:
                 self.distribute_mpi()
+        except BaseException as e:  # pragma: debug
+            self.error("%s could not be created: %s", driver['name'], e)
+            self.terminate()
+            raise
+        try:
             # Create I/O drivers
             self.debug("Loading connection drivers")
             for driver in self.connectiondrivers.values():
                 driver['task_method'] = self.connection_task_method
-                self.create_connection_driver(driver)
+            self.create_drivers(self.connectiondrivers,
+                                self.create_connection_driver)
             # Create model drivers
             self.debug("Loading model drivers")
-            for driver in self.modeldrivers.values():
-                self.create_driver(driver)
-                self.debug("Model %s:, env: %s",
-                           driver['name'], pformat(driver['instance'].env))
-        except BaseException as e:  # pragma: debug
-            self.error("%s could not be created: %s", driver['name'], e)
+            self.create_drivers(self.modeldrivers, self.create_model_driver)
+        except BaseException:  # pragma: debug
             self.terminate()
             raise
 
@@ -809,38 +937,57 @@ class YggRunner(YggClass):
         x = self.modeldrivers[name]['instance']
         x.stop()
 
+    def start_connection(self, driver):
+        r"""Start a connection driver and wait for it to enter its loop.
+
+        Args:
+            driver (dict): Connection driver yaml.
+
+        """
+        self.debug("Starting driver %s", driver['name'])
+        d = driver['instance']
+        if not d.was_started:
+            d.start()
+        self.debug("Checking driver %s", driver['name'])
+        d.wait_for_loop()
+        assert d.was_loop
+        assert not d.errors
+
+    def start_model(self, driver):
+        r"""Start a model driver, starting any servers it is a client of
+        first.
+
+        Args:
+            driver (dict): Model driver yaml.
+
+        """
+        self.debug("Starting driver %s", driver['name'])
+        d = driver['instance']
+        for n2 in driver.get('client_of', []):
+            self.start_server(n2)
+        if not d.was_started:
+            d.start()
+
     def startDrivers(self):
-        r"""Start drivers, starting with the IO drivers."""
+        r"""Start drivers, starting with the IO drivers. Drivers of each type
+        are started concurrently, with servers started before their clients."""
         if not self.mpi_comm or (self.rank == 0):
             assert not self.modelcopies
         self.info('Starting I/O drivers and models on system '
                   + '{} in namespace {} with rank {}'.format(
                       self.host, self.namespace, self.rank))
-        driver = dict(name='name')
         try:
             # Start connections
-            for driver in self.io_drivers():
-                self.debug("Starting driver %s", driver['name'])
-                d = driver['instance']
-                if not d.was_started:
-                    d.start()
-            # Ensure connections in loop
-            for driver in self.io_drivers():
-                self.debug("Checking driver %s", driver['name'])
-                d = driver['instance']
-                d.wait_for_loop()
-                assert d.was_loop
-                assert not d.errors
-            # Start models
-            for driver in self.modeldrivers.values():
-                self.debug("Starting driver %s", driver['name'])
-                d = driver['instance']
-                for n2 in driver.get('client_of', []):
-                    self.start_server(n2)
-                if not d.was_started:
-                    d.start()
-        except BaseException as e:  # pragma: debug
-            self.error("%s did not start: %s(%s)", driver['name'], type(e), e)
+            self.run_drivers(self.connectiondrivers, self.start_connection,
+                             action='started')
+            # Start models, servers before their clients
+            graph = {k: [x for x in v.get('client_of', [])
+                         if x in self.modeldrivers]
+                     for k, v in self.modeldrivers.items()}
+            self.run_drivers(self.modeldrivers, self.start_model,
+                             graph=graph, action='started',
+                             break_cycles=True)
+        except BaseException:  # pragma: debug
             self.terminate()
             raise
         if self.mpi_comm:
@@ -856,45 +1003,71 @@ class YggRunner(YggClass):
                 return False
         return True
 
+    def check_model(self, drv):
+        r"""Check a running model for errors or completion, performing the
+        exits for associated IO drivers if it finished.
+
+        Args:
+            drv (dict): Dictionary of model parameters including the driver
+                instance.
+
+        Returns:
+            bool: True if the model is no longer running or there was an
+                error, False otherwise.
+
+        """
+        d = drv['instance']
+        if d.errors:  # pragma: debug
+            self.error('Error in model %s', drv['name'])
+            self.error_flag = True
+            return True
+        elif d.io_errors:  # pragma: debug
+            self.error('Error in input/output driver for model %s'
+                       % drv['name'])
+            self.error_flag = True
+            return True
+        if d.is_alive():
+            self.debug('%s still running', drv['name'])
+            return False
+        self.info("%s finished running.", drv['name'])
+        self.do_client_exits(drv)
+        self.debug("%s completed client exits.", drv['name'])
+        self.info("%s finished exiting.", drv['name'])
+        return True
+
     def waitModels(self, timeout=False):
-        r"""Wait for all model drivers to finish. When a model finishes,
-        join the thread and perform exits for associated IO drivers."""
+        r"""Wait for all model drivers to finish. Blocks until a driver
+        signals that it completed or encountered an error and then checks
+        the models affected by the change. When a model finishes, join the
+        thread and perform exits for associated IO drivers. Drivers that do
+        not run in this process are polled every wait_poll_interval
+        seconds."""
         self.debug('')
-        running = [d for d in self.modeldrivers.values()]
-        dead = []
+        running = OrderedDict((d['name'], d)
+                              for d in self.modeldrivers.values())
+        changed = list(running.keys())
         Tout = self.start_timeout(t=timeout,
                                   key_suffix='.waitModels')
-        while ((len(running) > 0) and (not self.error_flag)
-               and (not Tout.is_out)):
-            for drv in running:
-                d = drv['instance']
-                if d.errors:  # pragma: debug
-                    self.error('Error in model %s', drv['name'])
-                    self.error_flag = True
-                    break
-                elif d.io_errors:  # pragma: debug
-                    self.error('Error in input/output driver for model %s'
-                               % drv['name'])
-                    self.error_flag = True
-                    break
-                d.join(1)
-                if not d.is_alive():
-                    if not d.errors:
-                        self.info("%s finished running.", drv['name'])
-                        # self.do_model_exits(drv)
-                        # self.debug("%s completed model exits.", drv['name'])
-                        self.do_client_exits(drv)
-                        self.debug("%s completed client exits.", drv['name'])
-                        running.remove(drv)
-                        self.info("%s finished exiting.", drv['name'])
-                else:
-                    self.debug('%s still running', drv['name'])
-            dead = []
-            for drv in self.all_drivers:
-                d = drv['instance']
-                d.join(0.1)
-                if not d.is_alive():
-                    dead.append(drv['name'])
+        while running and (not self.error_flag) and (not Tout.is_out):
+            for name in changed:
+                if name not in running:
+                    continue
+                if self.check_model(running[name]):
+                    if not self.error_flag:
+                        running.pop(name)
+                    else:  # pragma: debug
+                        break
+            if (not running) or self.error_flag:
+                break
+            events = self.notifier.wait(timeout=self.wait_poll_interval)
+            for name, x in events.items():
+                if (name in running) and ('complete' in x):
+                    running[name]['instance'].join(self.timeout)
+            if events and all(name in running for name in events.keys()):
+                changed = list(events.keys())
+            else:
+                # Connection driver events and polling affect all models
+                changed = list(running.keys())
         self.stop_timeout(key_suffix='.waitModels')
         for d in self.modeldrivers.values():
             if d['instance'].errors:
@@ -83,6 +83,22 @@ def create_schema():
     return x
 
 
+def check_constants():
+    r"""Check that constants.py is up to date with the components
+    registered by importing the component modules. This is intended to
+    be run when building/installing the package so that the registry does
+    not need to be validated against the modules at runtime.
+
+    Raises:
+        RuntimeError: If constants.py is out of date.
+
+    """
+    from yggdrasil.components import init_registry, registering
+    with registering():
+        x = SchemaRegistry(init_registry(recurse=True))
+        update_constants(x, check=True)
+
+
 def load_schema(fname=None):
     r"""Return the yggdrasil schema for YAML options.
 
@@ -220,9 +236,21 @@ def get_model_form_schema(fname_dst=None, **kwargs):
     return out
 
 
-def update_constants(schema=None):
-    r"""Update constants.py with info from the schema."""
-    from yggdrasil.components import import_component
+def update_constants(schema=None, check=False):
+    r"""Update constants.py with info from the schema.
+
+    Args:
+        schema (SchemaRegistry, optional): Schema that constants should be
+            generated from. Defaults to the loaded schema.
+        check (bool, optional): If True, constants.py will not be updated
+            and an error will be raised if the generated constants do not
+            match the existing file. Defaults to False.
+
+    Raises:
+        RuntimeError: If check is True and constants.py is out of date.
+
+    """
+    from yggdrasil.components import import_component, registry_hash
     from yggdrasil.drivers.CompiledModelDriver import (
         get_compilation_tool_registry)
     if schema is None:
@@ -324,7 +352,9 @@ def update_constants(schema=None):
                  _constants_separator[1:]]
     lines += [
         "", "# Component registry",
-        f"COMPONENT_REGISTRY = {as_lines(component_registry)}"]
+        f"COMPONENT_REGISTRY = {as_lines(component_registry)}",
+        f"COMPONENT_REGISTRY_HASH = (\n"
+        f"    {registry_hash(component_registry)!r})"]
     lines += [
         "", "# File constants",
         "FILE2EXT = %s" % as_lines(file2ext),
@@ -356,8 +386,16 @@ def update_constants(schema=None):
         "COMPILATION_TOOL_VARS = %s" % as_lines(compilation_tool_vars)]
     lines += [
         "LANGUAGE_PROPERTIES = %s" % as_lines(language_properties)]
+    contents = '\n'.join(lines) + '\n'
+    if check:
+        with open(filename, 'r') as fd:
+            if fd.read() != contents:
+                raise RuntimeError(f"{filename} is out of date with the "
+                                   f"component modules. It should be "
+                                   f"regenerated by calling 'yggschema'.")
+        return
     with open(filename, 'w') as fd:
-        fd.write('\n'.join(lines) + '\n')
+        fd.write(contents)
 
 
 class ComponentSchema(object):
@@ -766,8 +766,41 @@ class SerializeBase(tools.YggClass):
             #     raise
         return args
 
+    def serialize_data(self, args, metadata=None):
+        r"""Serialize message data without encoding the header.
+
+        Args:
+            args (obj): List of arguments to be formatted or a ready made message.
+            metadata (dict, optional): Header information for the message.
+                Defaults to None.
+
+        Returns:
+            bytes: Serialized message data.
+
+        Raises:
+            TypeError: If returned msg is not bytes type.
+
+        """
+        if metadata is None:
+            metadata = {}
+        if metadata.get('raw', False):
+            data = args
+        else:
+            was_init = self.initialized
+            if was_init:
+                args = self.normalize(args)
+            self.initialize_from_message(args, **metadata)
+            if (not was_init) and self.initialized:
+                args = self.normalize(args)
+            data = self.func_serialize(args)
+        if not isinstance(data, bytes):
+            raise TypeError(f"Serialization function returned "
+                            f"object of type '{type(data)}', not "
+                            f"required '{bytes}' type.")
+        return data
+
     def serialize(self, args, metadata=None, add_serializer_info=False,
-                  no_metadata=False, max_header_size=0):
+                  no_metadata=False, max_header_size=0, data=None):
         r"""Serialize a message.
 
         Args:
@@ -782,6 +815,10 @@ class SerializeBase(tools.YggClass):
                 should occupy in order to be sent in a single message.
                 A value of 0 indicates that any size header is valid.
                 Defaults to 0.
+            data (bytes, optional): Data previously serialized from args by
+                serialize_data on this or an equivalent serializer. If
+                provided, args will not be serialized again. Defaults to
+                None.
 
         Returns:
             bytes, str: Serialized message.
@@ -795,25 +832,12 @@ class SerializeBase(tools.YggClass):
             metadata = {}
         if isinstance(args, bytes) and (args == constants.YGG_MSG_EOF):
             metadata['raw'] = True
-        if not metadata.get('raw', False):
-            was_init = self.initialized
-            if was_init:
-                args = self.normalize(args)
-            self.initialize_from_message(args, **metadata)
-            if (not was_init) and self.initialized:
-                args = self.normalize(args)
+        if data is None:
+            data = self.serialize_data(args, metadata=metadata)
         if add_serializer_info:
             self.verbose_debug("serializer_info = %.100s...",
                                str(self.serializer_info))
             metadata['serializer'] = self.serializer_info
-        if metadata.get('raw', False):
-            data = args
-        else:
-            data = self.func_serialize(args)
-        if not isinstance(data, bytes):
-            raise TypeError(f"Serialization function returned "
-                            f"object of type '{type(data)}', not "
-                            f"required '{bytes}' type.")
         return self.encode(data, metadata, no_metadata=no_metadata,
                            max_header_size=max_header_size)
 
@@ -890,16 +914,49 @@ class SerializeBase(tools.YggClass):
                 out = self.normalize(out)
         return out, metadata
 
-    def decode(self, msg, no_data=False, metadata=None):
+    @staticmethod
+    def split_buffer(msg, sep, maxsplit):
+        r"""Split a message into bytes. Messages received in place into a
+        bytearray (e.g. by MPIComm) are split via a memoryview so that each
+        part is only copied once.
+
+        Args:
+            msg (bytes, bytearray): Message to split.
+            sep (bytes): Separator to split the message at.
+            maxsplit (int): Maximum number of splits.
+
+        Returns:
+            list: Parts of the message as bytes.
+
+        """
+        if isinstance(msg, bytes):
+            return msg.split(sep, maxsplit)
+        view = memoryview(msg)
+        out = []
+        prev = 0
+        while len(out) < maxsplit:
+            idx = msg.find(sep, prev)
+            if idx < 0:
+                break
+            out.append(bytes(view[prev:idx]))
+            prev = idx + len(sep)
+        out.append(bytes(view[prev:]))
+        return out
+
+    def decode(self, msg, no_data=False, metadata=None, header=None):
         r"""Decode message parts into header and body.
 
         Args:
-            msg (str, bytes): Message to be decoded.
+            msg (str, bytes, bytearray): Message to be decoded.
             no_data (bool, optional): If True, only the metadata is returned.
                 Defaults to False.
             metadata (dict, optional): Metadata that should be used to deserialize
                 the message instead of the current header content. Defaults to
                 None and is not used.
+            header (dict, optional): Header that was already parsed from msg
+                (e.g. by the communication layer) and should be used instead
+                of parsing the header again. Defaults to None and the header
+                is parsed from msg.
 
         Returns:
             tuple(obj, dict): Deserialized message and header information.
@@ -910,23 +967,28 @@ class SerializeBase(tools.YggClass):
             TypeError: If msg is not bytes.
 
         """
-        if not isinstance(msg, bytes):
+        if not isinstance(msg, (bytes, bytearray)):
             raise TypeError("Messages are expected to be bytes.")
         if msg.startswith(constants.YGG_MSG_HEAD):
             if metadata is not None:  # pragma: debug
                 raise ValueError("Metadata in header and provided by keyword.")
-            _, metadata, data = msg.split(constants.YGG_MSG_HEAD, 2)
-            metadata = rapidjson.loads(metadata)
+            _, metadata, data = self.split_buffer(
+                msg, constants.YGG_MSG_HEAD, 2)
+            if header is None:
+                metadata = rapidjson.loads(metadata)
+            else:
+                metadata = header
         elif isinstance(metadata, dict) and metadata['__meta__'].get('in_data', False):
             assert msg.count(constants.YGG_MSG_HEAD) == 1
-            metadata_remainder, data = msg.split(constants.YGG_MSG_HEAD, 1)
+            metadata_remainder, data = self.split_buffer(
+                msg, constants.YGG_MSG_HEAD, 1)
             if len(metadata_remainder) > 0:
                 metadata.update(rapidjson.loads(metadata_remainder))
             metadata['__meta__'].pop('in_data')
             # Data no longer contains the additional metadata
             metadata['__meta__']['size'] = len(data)
         else:
-            data = msg
+            data = bytes(msg)
             if metadata is None:
                 metadata = {'__meta__': {'size': len(msg)}}
         # Set flags based on data
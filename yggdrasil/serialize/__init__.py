@@ -1,7 +1,6 @@
 import re
 import copy
 import numpy as np
-import pandas
 import io as sio
 from yggdrasil import platform, units, scanf, tools, constants
 try:
@@ -1305,6 +1304,7 @@ def numpy2pandas(arr):
         pandas.DataFrame: Pandas data frame with contents from the input array.
 
     """
+    import pandas
     if not isinstance(arr, np.ndarray):
         raise TypeError("arr must be a numpy array, not %s." % type(arr))
     out = pandas.DataFrame(arr)
@@ -1323,6 +1323,7 @@ def pandas2numpy(frame, index=False):
         np.ndarray: Structured numpy array.
 
     """
+    import pandas
     if not isinstance(frame, pandas.DataFrame):
         raise TypeError("frame must be a pandas data frame, not %s." % type(frame))
     arr = frame.to_records(index=index)
@@ -1365,6 +1366,7 @@ def dict2pandas(d, order=None):
         pandas.DataFrame: Pandas data frame with contents from the input dict.
 
     """
+    import pandas
     out = numpy2pandas(dict2numpy(d, order=order))
     if order is None:
         out.columns = pandas.RangeIndex(len(out.columns))
@@ -1381,6 +1383,7 @@ def pandas2dict(frame):
         dict: Dictionary with contents from the input frame.
 
     """
+    import pandas
     if not isinstance(frame, pandas.DataFrame):
         raise TypeError("frame must be a pandas data frame, not %s." % type(frame))
     return numpy2dict(pandas2numpy(frame))
@@ -1398,6 +1401,7 @@ def list2pandas(arrays, names=None):
         pandas.DataFrame: Pandas data frame with contents from the input list.
 
     """
+    import pandas
     if names is None:
         names = list2names(arrays, no_default=True)
     out = numpy2pandas(list2numpy(arrays, names=names))
@@ -37,6 +37,13 @@ _linewidth = 2
 _legend_fontsize = 14
 _pyperf_warmups = 0
 _python_version = '%d.%d' % (sys.version_info[0], sys.version_info[1])
+# Maximum time (in seconds) that importing the Python interface should
+# take and modules that it should not import
+_interface_module = 'yggdrasil.languages.Python.YggInterface'
+_interface_import_target = 1.0
+_interface_import_excluded = ['yggdrasil.runner', 'yggdrasil.schema',
+                              'yggdrasil.drivers', 'yggdrasil.yamlfile',
+                              'pandas', 'git', 'distutils']
 
 
 # TODO:
@@ -201,6 +208,102 @@ def get_source(lang, direction, test_name='timed_pipe'):
     return out
 
 
+def time_import(module, nrep=3):
+    r"""Time the import of a module in a new Python process using
+    the interpreter's -X importtime option.
+
+    Args:
+        module (str): Name of the module that should be imported.
+        nrep (int, optional): Number of times the import should be
+            repeated. Defaults to 3.
+
+    Returns:
+        tuple(float, list): Minimum time (in seconds) taken by the
+            cumulative import of the module across repetitions and the
+            names of all modules imported as a result.
+
+    """
+    times = []
+    modules = []
+    for _ in range(nrep):
+        out = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        modules = []
+        for line in out.stderr.decode('utf-8').splitlines():
+            if not line.startswith('import time:'):
+                continue
+            cumulative, name = line.split('|')[1:]
+            if cumulative.strip() == 'cumulative':
+                continue
+            name = name.strip()
+            modules.append(name)
+            if name == module:
+                times.append(float(cumulative) * 1.0e-6)
+    return min(times), modules
+
+
+def check_interface_import(nrep=3, target=None):
+    r"""Check that importing the Python interface does not import
+    modules that are only required by the runner and, optionally, that it
+    does not take longer than a target time.
+
+    Args:
+        nrep (int, optional): Number of times the import should be
+            repeated. Defaults to 3.
+        target (float, optional): Time (in seconds) that the import should
+            take less than. Defaults to None and the time is only reported.
+            Wall-clock import times depend on the machine so this should
+            only be set for dedicated benchmark runs (e.g. to
+            _interface_import_target).
+
+    Returns:
+        float: Minimum time (in seconds) taken by the import.
+
+    Raises:
+        AssertionError: If the import includes any of the excluded
+            modules or takes longer than the target.
+
+    """
+    t, modules = time_import(_interface_module, nrep=nrep)
+    excluded = [x for x in modules
+                if any((x == y) or x.startswith(y + '.')
+                       for y in _interface_import_excluded)]
+    assert not excluded, (f"Importing {_interface_module} also imported "
+                          f"{excluded}")
+    logger.info("Importing %s took %s s", _interface_module, t)
+    if target is not None:
+        assert t < target, (
+            f"Importing {_interface_module} took {t} s (target is "
+            f"{target} s)")
+    return t
+
+
+def time_comm_creation(commtype=None, nrep=100, **kwargs):
+    r"""Time the creation of comm instances without opening them.
+
+    Args:
+        commtype (str, optional): Type of comm to create. Defaults to
+            None and the default comm is used.
+        nrep (int, optional): Number of comms to create. Defaults to 100.
+        **kwargs: Additional keyword arguments are passed to the comm
+            class.
+
+    Returns:
+        float: Average time (in seconds) taken to create a comm.
+
+    """
+    comm_cls = import_component('comm', commtype)
+    kwargs.setdefault('dont_open', True)
+    ttot = 0.0
+    for i in range(nrep):
+        t0 = time.perf_counter()
+        x = comm_cls(f'time_comm_creation{i}', **kwargs)
+        ttot += time.perf_counter() - t0
+        x.close()
+    return ttot / nrep
+
+
 @contextlib.contextmanager
 def change_default_comm(default_comm):
     from yggdrasil.communication.DefaultComm import DefaultComm
@@ -215,6 +318,216 @@ def change_default_comm(default_comm):
     DefaultComm._reset_alias()
 
 
+@contextlib.contextmanager
+def change_zmq_protocol(protocol):
+    old_protocol = os.environ.pop('YGG_ZMQ_PROTOCOL', None)
+    if protocol is not None:
+        os.environ['YGG_ZMQ_PROTOCOL'] = protocol
+    yield
+    os.environ.pop('YGG_ZMQ_PROTOCOL', None)
+    if old_protocol is not None:  # pragma: debug
+        os.environ['YGG_ZMQ_PROTOCOL'] = old_protocol
+
+
+def time_zmq_throughput(lang='python', protocols=['tcp', 'ipc'],
+                        nmsg=1000, msg_size=100, nrep=3, **kwargs):
+    r"""Time the throughput of small ZMQ messages between models over
+    different transports.
+
+    Args:
+        lang (str, optional): Language of the models sending and receiving
+            messages. Defaults to 'python'.
+        protocols (list, optional): ZMQ transport protocols that should be
+            timed. Defaults to ['tcp', 'ipc'].
+        nmsg (int, optional): Number of messages to send. Defaults to 1000.
+        msg_size (int, optional): Size of each message. Defaults to 100.
+        nrep (int, optional): Number of times each run should be
+            repeated. Defaults to 3.
+        **kwargs: Additional keyword arguments are passed to TimedRun.
+
+    Returns:
+        dict: Messages per second for each protocol.
+
+    """
+    kwargs.setdefault('dont_use_pyperf', True)
+    ext = '.dat' if kwargs['dont_use_pyperf'] else '.json'
+    out = {}
+    for protocol in protocols:
+        with change_zmq_protocol(protocol):
+            x = TimedRun(lang, lang, comm_type='zmq',
+                         filename=os.path.join(
+                             os.getcwd(),
+                             f'scaling_timed_pipe_zmq_{protocol}{ext}'),
+                         **kwargs)
+            _, tavg, _ = x.time_run(nmsg, msg_size, nrep=nrep)
+        out[protocol] = nmsg / tavg
+    return out
+
+
+def time_zmq_proxy(nclients=[1, 8, 64], nmsg=10000, msg_size=100,
+                   protocol='tcp'):
+    r"""Time forwarding of messages from many clients to a server through
+    a ZMQProxy.
+
+    Args:
+        nclients (list, optional): Numbers of clients that should be timed.
+            Defaults to [1, 8, 64].
+        nmsg (int, optional): Total number of messages sent by the clients.
+            Defaults to 10000.
+        msg_size (int, optional): Size of each message. Defaults to 100.
+        protocol (str, optional): ZMQ transport protocol. Defaults to 'tcp'.
+
+    Returns:
+        dict: Messages per second forwarded for each number of clients.
+
+    """
+    import zmq
+    from yggdrasil.communication import ZMQComm
+    context = ZMQComm._global_context
+    msg = b'0' * msg_size
+    out = {}
+    for ncli in nclients:
+        srv_address = ZMQComm.format_address(
+            protocol, ZMQComm.get_ipc_host() if protocol == 'ipc'
+            else 'localhost')
+        proxy = ZMQComm.ZMQProxy(srv_address, zmq_context=context,
+                                 protocol=protocol)
+        proxy.add_client()
+        proxy.start()
+        server = ZMQComm.create_socket(context, zmq.DEALER)
+        server.connect(proxy.srv_address)
+        signon = server.recv()
+        assert signon.startswith(ZMQComm.ZMQProxy.server_signon_msg)
+        clients = []
+        for i in range(ncli):
+            clients.append(ZMQComm.create_socket(context, zmq.DEALER))
+            clients[-1].connect(proxy.cli_address)
+        clients[0].send(signon)
+        while not server.recv().startswith(
+                ZMQComm.ZMQProxy.client_signon_msg):
+            pass
+        t0 = time.perf_counter()
+        for i in range(nmsg):
+            clients[i % ncli].send(msg)
+        for i in range(nmsg):
+            server.recv()
+        out[ncli] = nmsg / (time.perf_counter() - t0)
+        for x in clients + [server]:
+            x.close(linger=0)
+        proxy.remove_client()
+    return out
+
+
+def time_mpi_bandwidth(msg_sizes=[2**10, 2**16, 2**20], nmsg=100,
+                       tag_start=1000, typed=False):
+    r"""Time the rank-to-rank bandwidth of an MPIComm connection. This
+    must be run under mpiexec with at least 2 processes, e.g.
+
+    mpiexec -n 2 python -c "from yggdrasil import timing; \
+    print(timing.time_mpi_bandwidth())"
+
+    Args:
+        msg_sizes (list, optional): Sizes (in bytes) of the messages that
+            should be timed. Defaults to [2**10, 2**16, 2**20].
+        nmsg (int, optional): Number of messages sent for each size.
+            Defaults to 100.
+        tag_start (int, optional): MPI tag that the connection should
+            start at. Defaults to 1000.
+        typed (bool, optional): If True, messages are sent as arrays via
+            typed MPI buffers (send_array/recv_array) instead of as
+            serialized bytes. Defaults to False.
+
+    Returns:
+        dict: Bytes per second received for each message size on rank 1,
+            empty on all other ranks.
+
+    """
+    from yggdrasil.multitasking import MPI
+    from yggdrasil.communication import new_comm, get_comm
+    assert MPI is not None
+    mpi_comm = MPI.COMM_WORLD
+    rank = mpi_comm.Get_rank()
+    assert mpi_comm.Get_size() >= 2
+    if rank == 0:
+        comm = new_comm('time_mpi_bandwidth', commtype='mpi',
+                        direction='send', reverse_names=True,
+                        partner_mpi_ranks=[1], tag_start=tag_start + 1)
+        mpi_comm.send(comm.opp_comm_kwargs(), dest=1, tag=tag_start)
+    elif rank == 1:
+        kws = mpi_comm.recv(source=0, tag=tag_start)
+        kws.update(commtype='mpi', tag_start=tag_start + 1)
+        comm = get_comm('time_mpi_bandwidth', **kws)
+    else:
+        return {}
+    out = {}
+    try:
+        for size in msg_sizes:
+            if typed:
+                msg = np.zeros(size // 8, dtype='float64')
+            else:
+                msg = b'0' * size
+            # Pairwise sync so that only ranks 0 & 1 need to participate
+            if rank == 0:
+                mpi_comm.recv(source=1, tag=tag_start)
+            else:
+                mpi_comm.send(size, dest=0, tag=tag_start)
+            t0 = time.perf_counter()
+            for i in range(nmsg):
+                if rank == 0 and typed:
+                    assert comm.send_array(msg)
+                elif rank == 0:
+                    assert comm.send(msg)
+                elif typed:
+                    flag, _ = comm.recv_array(msg.dtype, timeout=60.0)
+                    assert flag
+                else:
+                    flag, _ = comm.recv(timeout=60.0)
+                    assert flag
+            if rank == 1:
+                out[size] = size * nmsg / (time.perf_counter() - t0)
+    finally:
+        comm.close()
+    return out
+
+
+def time_rpc_calls(language='python', iterations=100, nrep=3):
+    r"""Time RPC call loops using the rpcFib example, in which two client
+    models (one making sequential calls and one sending requests before
+    receiving responses) call the same server model.
+
+    Args:
+        language (str, optional): Language of the rpcFib example models.
+            Defaults to 'python'.
+        iterations (int, optional): Number of calls made by each client.
+            Defaults to 100.
+        nrep (int, optional): Number of times the integration should be run.
+            Defaults to 3.
+
+    Returns:
+        float: RPC calls per second for the fastest run, including the
+            time required to start and stop the integration.
+
+    """
+    yamls = examples.get_example_yaml('rpcFib', language)
+    env = {'FIB_ITERATIONS': str(iterations),
+           'FIB_SERVER_SLEEP_SECONDS': '0'}
+    old_env = {k: os.environ.get(k, None) for k in env}
+    os.environ.update(env)
+    times = []
+    try:
+        for _ in range(nrep):
+            t0 = time.perf_counter()
+            runner.run(yamls)
+            times.append(time.perf_counter() - t0)
+    finally:
+        for k, v in old_env.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:  # pragma: debug
+                os.environ[k] = v
+    return 2 * iterations / min(times)
+
+
 @contextlib.contextmanager
 def debug_log():  # pragma: debug
     r"""Set the log level to debug."""
@@ -8,10 +8,6 @@ import re
 import sys
 import glob
 import sysconfig
-try:
-    from distutils import sysconfig as distutils_sysconfig
-except ImportError:  # pragma: debug
-    distutils_sysconfig = None
 import warnings
 import copy
 import shutil
@@ -23,6 +19,7 @@ import subprocess
 import importlib
 import difflib
 import contextlib
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from yggdrasil import platform, constants
 from yggdrasil.components import import_component, ComponentBase
 
@@ -415,6 +412,11 @@ def get_python_c_library(allow_failure=False, libtype=None):
         if paths.get(k, None) and (paths[k] not in dir_try):
             dir_try.append(paths[k])
     dir_try.append(os.path.join(paths['data'], 'lib'))
+    try:
+        # distutils is imported here as it is slow to import
+        from distutils import sysconfig as distutils_sysconfig
+    except ImportError:  # pragma: debug
+        distutils_sysconfig = None
     if distutils_sysconfig is not None:
         dir_try.append(os.path.dirname(
             distutils_sysconfig.get_python_lib(True, True)))
@@ -1036,6 +1038,67 @@ def sleep(interval):
     time.sleep(interval)
 
 
+def run_task_graph(graph, func, nproc=None, break_cycles=False):
+    r"""Call a function for each node in a dependency graph, running nodes
+    whose prerequisites are complete concurrently in a pool of threads.
+
+    Args:
+        graph (dict): Mapping between nodes and the nodes that must be
+            complete before they are processed. Prerequisites that are not
+            nodes in the graph are ignored.
+        func (callable): Function that should be called with each node.
+        nproc (int, optional): Maximum number of nodes that should be
+            processed at once. Defaults to None and the ThreadPoolExecutor
+            default is used. If 1, nodes are processed serially.
+        break_cycles (bool, optional): If True, nodes that are part of a
+            dependency cycle are processed one at a time (in the order
+            they appear in graph) once no other nodes can be processed.
+            Defaults to False.
+
+    Returns:
+        dict: Mapping between nodes and the values returned by func.
+
+    Raises:
+        ValueError: If graph contains a dependency cycle and break_cycles
+            is False.
+
+    """
+    remaining = {k: [x for x in v if (x in graph) and (x != k)]
+                 for k, v in graph.items()}
+    complete = set()
+    out = {}
+
+    def next_nodes(nrunning, limit=None):
+        ready = [k for k, v in remaining.items()
+                 if all(x in complete for x in v)][:limit]
+        if remaining and (not ready) and (not nrunning):
+            if not break_cycles:
+                raise ValueError(f"Dependency cycle between "
+                                 f"{list(remaining.keys())}")
+            ready = [next(iter(remaining))]
+        for k in ready:
+            remaining.pop(k)
+        return ready
+
+    if (nproc == 1) or (len(graph) <= 1):
+        while remaining:
+            for k in next_nodes(0, limit=1):
+                out[k] = func(k)
+                complete.add(k)
+        return out
+    with ThreadPoolExecutor(max_workers=nproc) as pool:
+        running = {}
+        while remaining or running:
+            for k in next_nodes(len(running)):
+                running[pool.submit(func, k)] = k
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for x in finished:
+                k = running.pop(x)
+                out[k] = x.result()
+                complete.add(k)
+    return out
+
+
 def safe_eval(statement, **kwargs):
     r"""Run eval with a limited set of builtins and Python libraries/functions.
 
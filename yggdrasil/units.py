@@ -1,6 +1,5 @@
 import re
 import numpy as np
-import pandas as pd
 import deprecation
 from collections import OrderedDict
 from ._version import get_versions
@@ -18,6 +17,8 @@ Units = units_.Units
 UnitsError = units_.UnitsError
 _unit_quantity = Quantity
 _unit_array = QuantityArray
+_conversion_cache = {}
+_conversion_cache_stats = {'hits': 0, 'misses': 0}
 
 
 PYTHON_SCALARS_WITH_UNITS = OrderedDict([
@@ -40,6 +41,7 @@ def convert_to_pandas_timedelta(x):
         pandas.Timedelta: Equivalent Timedelta variable.
 
     """
+    import pandas as pd
     assert has_units(x)
     t_data = get_data(x)
     t_unit = get_units(x)
@@ -315,7 +317,111 @@ def convert_to(arr, new_units):
     """
     if not has_units(arr):
         return add_units(arr, new_units)
-    return arr.to(new_units)
+    factors = get_conversion_factors(get_units(arr), new_units)
+    if factors is None:
+        return arr.to(new_units)
+    return add_units(apply_conversion_factors(get_data(arr), factors),
+                     new_units)
+
+
+def _convert_uncached(x, old_units, new_units):
+    r"""Convert a scalar from one unit to another without using the
+    conversion cache.
+
+    Args:
+        x (float): Scalar value in old_units.
+        old_units (str): Units to convert from.
+        new_units (str): Units to convert to.
+
+    Returns:
+        float: Scalar value in new_units.
+
+    """
+    ux = add_units(x, old_units)
+    if has_units(ux):
+        ux = ux.to(new_units)
+    else:
+        ux = add_units(ux, new_units)
+    return float(get_data(ux))
+
+
+def get_conversion_factors(old_units, new_units):
+    r"""Get the scale and offset that convert values from one unit to
+    another such that new = scale * old + offset. Factors are cached
+    for each pair of units so that the units only need to be parsed
+    once.
+
+    Args:
+        old_units (str): Units to convert from.
+        new_units (str): Units to convert to.
+
+    Returns:
+        tuple, None: Scale and offset for the conversion or None if the
+            conversion is not affine and must be performed using the
+            full units machinery.
+
+    Raises:
+        UnitsError: If the units are not compatible.
+
+    """
+    key = (old_units, new_units)
+    try:
+        out = _conversion_cache[key]
+        _conversion_cache_stats['hits'] += 1
+        return out
+    except KeyError:
+        _conversion_cache_stats['misses'] += 1
+    offset = _convert_uncached(0.0, old_units, new_units)
+    scale = _convert_uncached(1.0, old_units, new_units) - offset
+    out = (scale, offset)
+    if not np.isclose(_convert_uncached(2.0, old_units, new_units),
+                      2.0 * scale + offset):  # pragma: debug
+        out = None
+    _conversion_cache[key] = out
+    return out
+
+
+def apply_conversion_factors(x, factors):
+    r"""Apply conversion factors to a scalar or array of values.
+
+    Args:
+        x (float, np.ndarray, pandas.Series): Values without units that
+            should be converted. Arrays and Series are converted as a
+            whole.
+        factors (tuple): Scale and offset returned by
+            get_conversion_factors.
+
+    Returns:
+        float, np.ndarray, pandas.Series: Converted values.
+
+    """
+    scale, offset = factors
+    if (scale == 1.0) and (offset == 0.0):
+        return x
+    out = x * scale
+    if offset != 0.0:
+        out = out + offset
+    return out
+
+
+def get_conversion_cache_info():
+    r"""Get information about the use of the unit conversion cache.
+
+    Returns:
+        dict: Number of cache hits & misses and the number of unit pairs
+            stored in the cache.
+
+    """
+    out = dict(_conversion_cache_stats)
+    out['size'] = len(_conversion_cache)
+    return out
+
+
+def clear_conversion_cache():
+    r"""Clear the unit conversion cache and reset the hit/miss counts."""
+    _conversion_cache.clear()
+    _conversion_cache_stats['hits'] = 0
+    _conversion_cache_stats['misses'] = 0
 
 
 def get_conversion_function(old_units, new_units):
@@ -328,10 +434,16 @@ def get_conversion_function(old_units, new_units):
 
     Returns:
         function: Conversion function that takes scalar/array as input
-            and returns converted scalar/array.
+            and returns converted scalar/array. Arrays and pandas.Series
+            are converted with a single vectorized operation.
 
     """
     def fconvert(x):
-        ux = add_units(x, old_units)
-        return get_data(convert_to(ux, new_units))
+        factors = get_conversion_factors(old_units, new_units)
+        if factors is None:  # pragma: debug
+            ux = add_units(x, old_units)
+            return get_data(convert_to(ux, new_units))
+        if has_units(x):
+            x = get_data(convert_to(x, old_units))
+        return apply_conversion_factors(x, factors)
     return fconvert
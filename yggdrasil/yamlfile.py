@@ -4,7 +4,6 @@ import pprint
 import chevron
 import yaml
 import json
-import git
 import io as sio
 from yggdrasil import constants, rapidjson
 from yggdrasil.schema import get_schema
@@ -97,6 +96,7 @@ def clone_github_repo(fname, commit=None, local_directory=None):
         cloneurl = parsed.scheme + '://' + parsed.netloc + '/' + owner + '/' +\
             reponame
         # clone the repo into the appropriate directory
+        import git
         repo = git.Repo.clone_from(cloneurl, os.path.join(local_directory,
                                                           owner, reponame))
         if commit is not None: